@@ -5,21 +5,68 @@ Este script fornece uma interface amigável para todas as funcionalidades do sis
 """
 
 import os
+import re
 import sys
+import copy
 import json
-import csv
+import queue
+import atexit
 import logging
-import argparse
-import webbrowser
-import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
+from collections import Counter, defaultdict
+from itertools import chain, islice
 from pathlib import Path
-from tabulate import tabulate
-from colorama import init, Fore, Style
-import matplotlib.pyplot as plt
+from logging.handlers import QueueHandler, QueueListener, MemoryHandler
+
+# orjson é opcional: acelera a leitura/escrita do regioes.json quando instalado
+try:
+    import orjson
+    ORJSON_DISPONIVEL = True
+except ImportError:
+    ORJSON_DISPONIVEL = False
+
+
+class _SemCor:
+    """Substitui Fore/Style enquanto o colorama não é carregado (todas as cores vazias)"""
+
+    def __getattr__(self, nome):
+        return ""
+
+
+# Cores são carregadas sob demanda por _init_cores(); até lá, texto sem formatação
+Fore = Style = _SemCor()
+
+# tabulate é importado apenas na primeira tabela impressa
+_tabulate = None
+
+# Indica se o colorama já foi inicializado (no Windows, é ele quem traduz ANSI)
+_ansi_ativo = False
+
+# Banner já renderizado com as cores atuais
+_banner_cache = None
+_menus_cache = {}
+
+
+def _cores_habilitadas(argv):
+    """Cores apenas em terminal interativo, sem NO_COLOR definido e sem --no-color"""
+    return ("--no-color" not in argv
+            and sys.stdout.isatty()
+            and not os.environ.get("NO_COLOR"))
+
+
+def _init_cores():
+    """Importa e inicializa o colorama, substituindo os stubs de cor"""
+    global Fore, Style, _ansi_ativo, _banner_cache
+    from colorama import init, Fore as _Fore, Style as _Style
+
+    # Inicializar colorama para cores no terminal
+    init(autoreset=True)
+    Fore, Style = _Fore, _Style
+    _ansi_ativo = True
+    _banner_cache = None
+    _menus_cache.clear()
 
-# Inicializar colorama para cores no terminal
-init(autoreset=True)
 
 # Configuração de diretórios
 BASE_DIR = Path(__file__).parent
@@ -30,8 +77,9 @@ LOGS_DIR = BASE_DIR / "logs"
 DOCS_DIR = BASE_DIR / "docs"
 TEMP_DIR = BASE_DIR / "temp"
 
-# Garantir que os diretórios existam
-TEMP_DIR.mkdir(exist_ok=True, parents=True)
+# Garantir que os diretórios existam (um stat basta quando já existem)
+if not TEMP_DIR.is_dir():
+    TEMP_DIR.mkdir(exist_ok=True, parents=True)
 
 # Adicionar diretório src ao path para importar módulos
 sys.path.append(str(SRC_DIR))
@@ -42,24 +90,53 @@ hoje = datetime.now()
 diretorio_log_ano = LOGS_DIR / str(hoje.year)
 diretorio_log_mes = diretorio_log_ano / f"{hoje.month:02d}"
 
-# Criar diretórios de log se não existirem
-diretorio_log_ano.mkdir(exist_ok=True, parents=True)
-diretorio_log_mes.mkdir(exist_ok=True, parents=True)
+# Criar diretórios de log se não existirem; o mês já cobre o ano via parents=True
+if not diretorio_log_mes.is_dir():
+    diretorio_log_mes.mkdir(exist_ok=True, parents=True)
 
 arquivo_log = diretorio_log_mes / f"cli_{hoje.strftime('%Y%m%d')}.log"
 
+# O console é escrito de forma síncrona, para que as mensagens saiam antes dos
+# prompts de input()/pause(); só o arquivo passa pela fila: uma thread do
+# QueueListener grava no buffer, descarregado a cada 256 registros ou
+# imediatamente ao receber um ERROR
+_log_fila = queue.SimpleQueue()
+_log_buffer = MemoryHandler(
+    capacity=256,
+    flushLevel=logging.ERROR,
+    target=logging.FileHandler(arquivo_log)
+)
+_log_listener = QueueListener(
+    _log_fila,
+    _log_buffer,
+    respect_handler_level=True
+)
+_log_listener.start()
+
+# Ordem inversa no atexit: primeiro esvazia a fila, depois descarrega o buffer
+atexit.register(_log_buffer.flush)
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(arquivo_log),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[QueueHandler(_log_fila), logging.StreamHandler(sys.stdout)]
 )
 logger = logging.getLogger("cli")
 
+
 # Banner ASCII do sistema
-BANNER = f"""
+def banner():
+    """Retorna o banner ASCII do sistema, montado uma única vez com as cores atuais"""
+    global _banner_cache
+    if _banner_cache is None:
+        _banner_cache = _montar_banner()
+    return _banner_cache
+
+
+def _montar_banner():
+    """Monta o texto do banner ASCII"""
+    return f"""
 {Fore.CYAN}╔═══════════════════════════════════════════════════════════════╗
 ║                                                               ║
 ║   {Fore.YELLOW}███████╗██████╗  ██████╗    ██████╗██╗     ██╗███╗   ███╗{Fore.CYAN}   ║
@@ -105,12 +182,54 @@ def print_success(texto):
 
 def print_table(data, headers):
     """Imprime uma tabela formatada na tela"""
-    print(tabulate(data, headers=headers, tablefmt="grid"))
+    global _tabulate
+    if _tabulate is None:
+        from tabulate import tabulate as _tabulate
+    print(_tabulate(data, headers=headers, tablefmt="grid"))
+
+
+# Padrões para detectar colunas de temperatura, umidade e chuva (OpenWeather/INMET)
+_RE_TEMP = re.compile(r"temp", re.IGNORECASE)
+_RE_UMID = re.compile(r"(?i:umid)|^UMD_INS$")
+_RE_CHUVA = re.compile(r"chuva|rain", re.IGNORECASE)
+
+# Nível de log em uma linha no formato "data - NÍVEL - mensagem"
+_RE_NIVEL_LOG = re.compile(r"ERROR|WARNING|INFO")
+
+# Nome dos arquivos de dados: tipo_regiao_AAAAMMDD.csv (com timestamp opcional)
+_RE_ARQUIVO_DADOS = re.compile(r"^(atual|historico)_(.+?)_\d{8}(?:_\d+)?\.(?:csv|parquet)$")
+
+
+def _colunas_por_padrao(colunas, padrao):
+    """Retorna as colunas cujo nome casa com o padrão compilado"""
+    return [c for c in colunas if padrao.search(c)]
+
+
+# Layout fixo da listagem de regiões configuradas (Nome, Descrição, Lat, Lon, Estação)
+_FORMATO_REGIOES = "{:<22} {:<50} {:>9} {:>9} {:<13}"
+_CABECALHO_REGIOES = _FORMATO_REGIOES.format("Nome", "Descrição", "Latitude", "Longitude", "Estação INMET")
+_SEPARADOR_REGIOES = "-" * len(_CABECALHO_REGIOES)
+
+
+def _print_regioes_simples(linhas):
+    """Imprime a tabela de regiões com colunas de largura fixa (sem tabulate)"""
+    print("\n".join([
+        _CABECALHO_REGIOES,
+        _SEPARADOR_REGIOES,
+        *(_FORMATO_REGIOES.format(*linha) for linha in linhas)
+    ]))
 
 
 def clear_screen():
     """Limpa a tela do terminal"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if os.name == 'nt' and not _ansi_ativo:
+        # Console do Windows sem colorama pode não interpretar ANSI
+        os.system('cls')
+        return
+    
+    # Sequência ANSI: limpar tela e mover o cursor para o início (sem subprocesso)
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
 
 
 def pause():
@@ -124,20 +243,76 @@ def confirm_action(mensagem="Confirma esta ação?"):
     return resposta in ['s', 'sim', 'y', 'yes']
 
 
+# Opções de cada menu (id, descrição); o texto colorido é montado uma única vez
+_OPCOES_PRINCIPAL = (
+    ("1", "Coleta de Dados"),
+    ("2", "Consulta e Análise"),
+    ("3", "Gerenciar Regiões"),
+    ("4", "Exportação de Dados"),
+    ("5", "Logs e Monitoramento"),
+    ("6", "Configurações"),
+    ("7", "Ajuda e Documentação"),
+    ("0", "Sair"),
+)
+_OPCOES_COLETA = (
+    ("1", "Coletar dados atuais (últimos 7 dias)"),
+    ("2", "Coletar dados históricos"),
+    ("3", "Coletar todos os dados (atual + histórico)"),
+    ("4", "Coletar dados para região específica"),
+    ("0", "Voltar"),
+)
+_OPCOES_CONSULTA = (
+    ("1", "Listar regiões com dados disponíveis"),
+    ("2", "Visualizar dados de uma região"),
+    ("3", "Visualizar dados históricos"),
+    ("4", "Análise avançada (interface interativa)"),
+    ("5", "Comparar regiões"),
+    ("0", "Voltar"),
+)
+_OPCOES_REGIOES = (
+    ("1", "Listar regiões configuradas"),
+    ("2", "Adicionar nova região"),
+    ("3", "Remover região"),
+    ("4", "Importar regiões de CSV"),
+    ("5", "Exportar regiões para CSV"),
+    ("0", "Voltar"),
+)
+_OPCOES_EXPORTACAO = (
+    ("1", "Exportar dados para CSV"),
+    ("2", "Exportar dados para Excel"),
+    ("3", "Exportar gráficos"),
+    ("0", "Voltar"),
+)
+_OPCOES_LOGS = (
+    ("1", "Visualizar logs do sistema"),
+    ("2", "Verificar estatísticas de coleta"),
+    ("3", "Limpar logs antigos"),
+    ("0", "Voltar"),
+)
+_OPCOES_CONFIGURACOES = (
+    ("1", "Configurar credenciais de API"),
+    ("2", "Configurar frequência de coleta"),
+    ("3", "Verificar diretórios do sistema"),
+    ("0", "Voltar"),
+)
+
+
+def _texto_menu(opcoes):
+    """Retorna o texto das opções de um menu, montado uma vez por esquema de cores"""
+    texto = _menus_cache.get(opcoes)
+    if texto is None:
+        texto = "".join(f"{Fore.CYAN}{id_opcao}.{Style.RESET_ALL} {descricao}\n"
+                        for id_opcao, descricao in opcoes)
+        _menus_cache[opcoes] = texto
+    return texto
+
+
 def mostrar_menu_principal():
     """Exibe o menu principal do sistema"""
     clear_screen()
-    print(BANNER)
+    print(banner())
     print_header("MENU PRINCIPAL")
-    print(f"{Fore.CYAN}1.{Style.RESET_ALL} Coleta de Dados")
-    print(f"{Fore.CYAN}2.{Style.RESET_ALL} Consulta e Análise")
-    print(f"{Fore.CYAN}3.{Style.RESET_ALL} Gerenciar Regiões")
-    print(f"{Fore.CYAN}4.{Style.RESET_ALL} Exportação de Dados")
-    print(f"{Fore.CYAN}5.{Style.RESET_ALL} Logs e Monitoramento")
-    print(f"{Fore.CYAN}6.{Style.RESET_ALL} Configurações")
-    print(f"{Fore.CYAN}7.{Style.RESET_ALL} Ajuda e Documentação")
-    print(f"{Fore.CYAN}0.{Style.RESET_ALL} Sair")
-    print()
+    print(_texto_menu(_OPCOES_PRINCIPAL))
     return input("Escolha uma opção: ")
 
 
@@ -151,32 +326,21 @@ def executar_coleta(modo="atual", regioes=None, dias=7, anos=15):
         dias: número de dias para coleta atual
         anos: número de anos para coleta histórica
     """
-    from src.executar_coleta import main as executar_coleta_main
-    
-    cmd_args = ["--modo", modo]
-    
-    if regioes:
-        cmd_args.extend(["--regioes"] + regioes)
-    if dias != 7:
-        cmd_args.extend(["--dias", str(dias)])
-    if anos != 15:
-        cmd_args.extend(["--anos", str(anos)])
-    
-    # Salvar os argumentos originais
-    original_args = sys.argv.copy()
+    from src.executar_coleta import run as executar_coleta_run
     
     try:
-        # Substituir sys.argv com nossos argumentos
-        sys.argv = [sys.argv[0]] + cmd_args
-        print_info(f"Executando coleta com argumentos: {' '.join(cmd_args)}")
-        executar_coleta_main()
-        print_success("Coleta concluída com sucesso!")
+        print_info(f"Executando coleta: modo={modo}, dias={dias}, anos={anos}"
+                   + (f", regiões={' '.join(regioes)}" if regioes else ""))
+        resultado = executar_coleta_run(modo=modo, regioes=regioes, dias=dias, anos=anos)
+        # Novos dados podem ter sido gravados: descartar leituras em cache
+        _invalidar_cache_dados()
+        if resultado == 0:
+            print_success("Coleta concluída com sucesso!")
+        else:
+            print_error("A coleta terminou com erros. Verifique os logs.")
     except Exception as e:
         print_error(f"Erro ao executar coleta: {e}")
         logger.exception("Erro na execução da coleta")
-    finally:
-        # Restaurar argumentos originais
-        sys.argv = original_args
 
 
 def menu_coleta():
@@ -184,12 +348,7 @@ def menu_coleta():
     while True:
         clear_screen()
         print_header("COLETA DE DADOS")
-        print(f"{Fore.CYAN}1.{Style.RESET_ALL} Coletar dados atuais (últimos 7 dias)")
-        print(f"{Fore.CYAN}2.{Style.RESET_ALL} Coletar dados históricos")
-        print(f"{Fore.CYAN}3.{Style.RESET_ALL} Coletar todos os dados (atual + histórico)")
-        print(f"{Fore.CYAN}4.{Style.RESET_ALL} Coletar dados para região específica")
-        print(f"{Fore.CYAN}0.{Style.RESET_ALL} Voltar")
-        print()
+        print(_texto_menu(_OPCOES_COLETA))
         opcao = input("Escolha uma opção: ")
         
         if opcao == "1":
@@ -264,33 +423,128 @@ def menu_coleta():
             pause()
 
 
+def _json_loads(conteudo):
+    """Interpreta JSON a partir de bytes (orjson se disponível)"""
+    if ORJSON_DISPONIVEL:
+        return orjson.loads(conteudo)
+    return json.loads(conteudo)
+
+
+def _json_dumps(obj):
+    """Serializa para JSON indentado em bytes UTF-8 (orjson se disponível)"""
+    if ORJSON_DISPONIVEL:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+# Cache do regioes.json já interpretado: caminho -> (st_mtime_ns, conteúdo)
+_cfg_cache = {}
+
+
+def _load_regioes_config():
+    """
+    Carrega o arquivo regioes.json, reaproveitando o conteúdo já lido
+    enquanto o mtime do arquivo não mudar.
+    
+    O dicionário retornado é compartilhado pelo cache: quem for alterá-lo
+    deve trabalhar sobre uma cópia (copy.deepcopy).
+    """
+    caminho = CONFIG_DIR / "regioes.json"
+    mtime = caminho.stat().st_mtime_ns
+    
+    em_cache = _cfg_cache.get(caminho)
+    if em_cache and em_cache[0] == mtime:
+        return em_cache[1]
+    
+    config = _json_loads(caminho.read_bytes())
+    
+    _cfg_cache[caminho] = (mtime, config)
+    return config
+
+
+def _salvar_regioes_config(config):
+    """
+    Grava o regioes.json de forma atômica: o conteúdo é serializado de uma
+    vez, escrito em um arquivo temporário no mesmo diretório e então
+    substitui o original com os.replace.
+    """
+    caminho = CONFIG_DIR / "regioes.json"
+    temporario = caminho.with_suffix(".json.tmp")
+    conteudo = _json_dumps(config)
+    
+    _cfg_cache.clear()
+    _invalidar_cache_dados()
+    with open(temporario, "wb") as f:
+        f.write(conteudo)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporario, caminho)
+
+
 def listar_regioes_configuradas():
     """Obtém a lista de regiões configuradas no sistema"""
     try:
-        with open(CONFIG_DIR / "regioes.json", "r", encoding="utf-8") as f:
-            dados = json.load(f)
-            regioes = [r["nome"] for r in dados.get("regioes_agricolas", [])]
-            return regioes
+        dados = _load_regioes_config()
+        regioes = [r["nome"] for r in dados.get("regioes_agricolas", [])]
+        return regioes
     except Exception as e:
         logger.error(f"Erro ao carregar regiões: {e}")
         return []
 
 
+# src.analisador_dados é importado apenas na primeira utilização (carrega pandas e matplotlib)
+_analisador = None
+
+
+def _analisador_dados():
+    """Retorna o módulo src.analisador_dados, importando-o na primeira chamada"""
+    global _analisador
+    if _analisador is None:
+        from src import analisador_dados
+        _analisador = analisador_dados
+    return _analisador
+
+
+# Regiões com dados em disco; None força uma nova varredura dos diretórios
+_regioes_dados_cache = {"val": None}
+
+
 def listar_regioes_com_dados():
-    """Lista todas as regiões que possuem dados coletados"""
-    from src.analisador_dados import listar_regioes_disponiveis
-    return listar_regioes_disponiveis()
+    """
+    Lista todas as regiões que possuem dados coletados.
+    
+    A varredura do diretório de dados é feita uma vez e reaproveitada pelos
+    menus até que _invalidar_cache_dados() seja chamada (após uma coleta ou
+    alteração das regiões). A lista retornada não deve ser modificada.
+    """
+    if _regioes_dados_cache["val"] is None:
+        _regioes_dados_cache["val"] = _analisador_dados().listar_regioes_disponiveis()
+    return _regioes_dados_cache["val"]
+
+
+def _invalidar_cache_dados():
+    """Descarta as regiões e os dados mantidos em cache nesta sessão"""
+    _regioes_dados_cache["val"] = None
+    _carregar_dados_cache.cache_clear()
+
+
+@lru_cache(maxsize=32)
+def _carregar_dados_cache(regiao, dias):
+    """
+    Carrega os dados recentes de uma região, reaproveitando leituras na mesma sessão.
+    O DataFrame retornado é compartilhado entre chamadas e não deve ser modificado.
+    """
+    return _analisador_dados().carregar_dados_recentes(regiao, dias=dias)
 
 
 def visualizar_dados(regiao, tipo="atual"):
     """Visualiza dados de uma região específica"""
-    from src.analisador_dados import carregar_dados_recentes
     
     print_info(f"Carregando dados {tipo} para {regiao}...")
     
     try:
         # Carregar dados
-        dados = carregar_dados_recentes(regiao, dias=30 if tipo == "atual" else 365)
+        dados = _carregar_dados_cache(regiao, 30 if tipo == "atual" else 365)
         
         if dados is None or dados.empty:
             print_error(f"Nenhum dado encontrado para {regiao}!")
@@ -300,44 +554,46 @@ def visualizar_dados(regiao, tipo="atual"):
         print_success(f"{len(dados)} registros encontrados")
         
         # Detectar colunas importantes com base na fonte
-        colunas_temperatura = [c for c in dados.columns if "temp" in c.lower()]
-        colunas_umidade = [c for c in dados.columns if "umid" in c.lower() or c == "UMD_INS"]
-        colunas_chuva = [c for c in dados.columns if "chuva" in c.lower() or "rain" in c.lower() or c == "CHUVA"]
+        colunas_temperatura = _colunas_por_padrao(dados.columns, _RE_TEMP)
+        colunas_umidade = _colunas_por_padrao(dados.columns, _RE_UMID)
+        colunas_chuva = _colunas_por_padrao(dados.columns, _RE_CHUVA)
         
-        # Mostrar as primeiras linhas
-        print("\nPrimeiras linhas dos dados:")
-        print(tabulate(dados.head(5).to_dict('records'), headers="keys", tablefmt="grid"))
+        # Montar toda a saída e escrevê-la de uma só vez no terminal
+        saida = ["\nPrimeiras linhas dos dados:",
+                 dados.head(5).to_string(index=False, max_cols=8)]
         
-        # Estatísticas descritivas
+        # Estatísticas descritivas (apenas média/mín/máx, sem o describe() completo)
         if colunas_temperatura:
-            print("\nEstatísticas de temperatura:")
-            stats = dados[colunas_temperatura[0]].describe()
-            print(f"  Média: {stats['mean']:.1f}°C")
-            print(f"  Mínima: {stats['min']:.1f}°C")
-            print(f"  Máxima: {stats['max']:.1f}°C")
+            serie = dados[colunas_temperatura[0]]
+            saida += ["\nEstatísticas de temperatura:",
+                      f"  Média: {serie.mean():.1f}°C",
+                      f"  Mínima: {serie.min():.1f}°C",
+                      f"  Máxima: {serie.max():.1f}°C"]
         
         if colunas_umidade:
-            print("\nEstatísticas de umidade:")
-            stats = dados[colunas_umidade[0]].describe()
-            print(f"  Média: {stats['mean']:.1f}%")
-            print(f"  Mínima: {stats['min']:.1f}%")
-            print(f"  Máxima: {stats['max']:.1f}%")
+            serie = dados[colunas_umidade[0]]
+            saida += ["\nEstatísticas de umidade:",
+                      f"  Média: {serie.mean():.1f}%",
+                      f"  Mínima: {serie.min():.1f}%",
+                      f"  Máxima: {serie.max():.1f}%"]
         
         if colunas_chuva:
-            print("\nEstatísticas de precipitação:")
-            total = dados[colunas_chuva[0]].sum()
-            print(f"  Total: {total:.1f}mm")
-            dias_com_chuva = (dados[colunas_chuva[0]] > 0).sum()
-            print(f"  Dias com chuva: {dias_com_chuva}")
+            serie = dados[colunas_chuva[0]]
+            dias_com_chuva = int((serie.to_numpy() > 0).sum())
+            saida += ["\nEstatísticas de precipitação:",
+                      f"  Total: {serie.sum():.1f}mm",
+                      f"  Dias com chuva: {dias_com_chuva}"]
         
         # Perguntar se deseja visualizar gráficos
-        print("\nDeseja visualizar gráficos?")
-        print(f"{Fore.CYAN}1.{Style.RESET_ALL} Sim")
-        print(f"{Fore.CYAN}2.{Style.RESET_ALL} Não")
+        saida += ["\nDeseja visualizar gráficos?",
+                  f"{Fore.CYAN}1.{Style.RESET_ALL} Sim",
+                  f"{Fore.CYAN}2.{Style.RESET_ALL} Não\n"]
+        sys.stdout.write("\n".join(saida))
         opcao_graficos = input("Escolha uma opção [1]: ") or "1"
         
         if opcao_graficos == "1":
-            from src.analisador_dados import plotar_temperatura, plotar_umidade, plotar_precipitacao
+            import matplotlib.pyplot as plt
+            analisador = _analisador_dados()
             
             print("\nQual gráfico deseja visualizar?")
             print(f"{Fore.CYAN}1.{Style.RESET_ALL} Temperatura")
@@ -347,18 +603,18 @@ def visualizar_dados(regiao, tipo="atual"):
             opcao_grafico = input("Escolha uma opção [4]: ") or "4"
             
             if opcao_grafico == "1" and colunas_temperatura:
-                plotar_temperatura(dados, regiao)
+                analisador.plotar_temperatura(dados, regiao)
             elif opcao_grafico == "2" and colunas_umidade:
-                plotar_umidade(dados, regiao)
+                analisador.plotar_umidade(dados, regiao)
             elif opcao_grafico == "3" and colunas_chuva:
-                plotar_precipitacao(dados, regiao)
+                analisador.plotar_precipitacao(dados, regiao)
             else:  # Opção 4 ou inválida: mostrar todos
                 if colunas_temperatura:
-                    plotar_temperatura(dados, regiao)
+                    analisador.plotar_temperatura(dados, regiao)
                 if colunas_umidade:
-                    plotar_umidade(dados, regiao)
+                    analisador.plotar_umidade(dados, regiao)
                 if colunas_chuva:
-                    plotar_precipitacao(dados, regiao)
+                    analisador.plotar_precipitacao(dados, regiao)
             
             plt.show()
     
@@ -367,18 +623,25 @@ def visualizar_dados(regiao, tipo="atual"):
         logger.exception("Erro na visualização de dados")
 
 
+def executar_analise_interativa():
+    """
+    Executa a interface interativa de análise no próprio processo.
+    
+    Returns:
+        int: Código de saída da análise (0 em caso de sucesso)
+    """
+    # Importado sob demanda: reaproveita pandas/matplotlib já carregados,
+    # sem iniciar outro interpretador Python
+    from src.exemplo_analise import main as exemplo_analise_main
+    return exemplo_analise_main()
+
+
 def menu_consulta():
     """Menu de consulta e análise de dados"""
     while True:
         clear_screen()
         print_header("CONSULTA E ANÁLISE DE DADOS")
-        print(f"{Fore.CYAN}1.{Style.RESET_ALL} Listar regiões com dados disponíveis")
-        print(f"{Fore.CYAN}2.{Style.RESET_ALL} Visualizar dados de uma região")
-        print(f"{Fore.CYAN}3.{Style.RESET_ALL} Visualizar dados históricos")
-        print(f"{Fore.CYAN}4.{Style.RESET_ALL} Análise avançada (interface interativa)")
-        print(f"{Fore.CYAN}5.{Style.RESET_ALL} Comparar regiões")
-        print(f"{Fore.CYAN}0.{Style.RESET_ALL} Voltar")
-        print()
+        print(_texto_menu(_OPCOES_CONSULTA))
         opcao = input("Escolha uma opção: ")
         
         if opcao == "1":
@@ -426,9 +689,7 @@ def menu_consulta():
             # Interface interativa de análise
             print_info("Iniciando interface interativa de análise...")
             try:
-                # Usar subprocess para manter o CLI responsivo
-                import subprocess
-                subprocess.run([sys.executable, str(SRC_DIR / "exemplo_analise.py")])
+                executar_analise_interativa()
             except Exception as e:
                 print_error(f"Erro ao iniciar interface de análise: {e}")
             
@@ -463,28 +724,38 @@ def menu_consulta():
                     
                     # Aqui você pode implementar a lógica de comparação ou chamar uma função
                     # Por exemplo, plotar temperatura das duas regiões no mesmo gráfico
-                    from src.analisador_dados import carregar_dados_recentes
-                    
-                    dados1 = carregar_dados_recentes(regiao1, dias=30)
-                    dados2 = carregar_dados_recentes(regiao2, dias=30)
+                    dados1 = _carregar_dados_cache(regiao1, 30)
+                    dados2 = _carregar_dados_cache(regiao2, 30)
                     
                     if dados1 is None or dados2 is None or dados1.empty or dados2.empty:
                         print_error("Dados insuficientes para comparação!")
                     else:
                         # Identificar coluna de temperatura
-                        col_temp1 = next((c for c in dados1.columns if "temp" in c.lower()), None)
-                        col_temp2 = next((c for c in dados2.columns if "temp" in c.lower()), None)
+                        col_temp1 = next(iter(_colunas_por_padrao(dados1.columns, _RE_TEMP)), None)
+                        col_temp2 = next(iter(_colunas_por_padrao(dados2.columns, _RE_TEMP)), None)
                         
                         if col_temp1 and col_temp2 and 'datetime' in dados1.columns and 'datetime' in dados2.columns:
-                            plt.figure(figsize=(12, 6))
-                            plt.plot(dados1['datetime'], dados1[col_temp1], 'r-', label=regiao1)
-                            plt.plot(dados2['datetime'], dados2[col_temp2], 'b-', label=regiao2)
-                            plt.title(f'Comparação de Temperatura: {regiao1} vs {regiao2}')
-                            plt.xlabel('Data')
-                            plt.ylabel('Temperatura (°C)')
-                            plt.legend()
-                            plt.grid(True, alpha=0.3)
-                            plt.gcf().autofmt_xdate()
+                            import pandas as pd
+                            import matplotlib.pyplot as plt
+                            
+                            # Alinhar as duas séries pelo horário mais próximo em um único DataFrame;
+                            # leituras a mais de uma hora de distância ficam vazias (lacunas no gráfico)
+                            serie1 = (dados1[['datetime', col_temp1]].dropna(subset=['datetime'])
+                                      .sort_values('datetime').rename(columns={col_temp1: regiao1}))
+                            serie2 = (dados2[['datetime', col_temp2]].dropna(subset=['datetime'])
+                                      .sort_values('datetime').rename(columns={col_temp2: regiao2}))
+                            comparacao = pd.merge_asof(serie1, serie2, on='datetime', direction='nearest',
+                                                       tolerance=pd.Timedelta(hours=1))
+                            
+                            ax = comparacao.set_index('datetime').plot(
+                                figsize=(12, 6),
+                                style=['r-', 'b-'],
+                                title=f'Comparação de Temperatura: {regiao1} vs {regiao2}'
+                            )
+                            ax.set_xlabel('Data')
+                            ax.set_ylabel('Temperatura (°C)')
+                            ax.grid(True, alpha=0.3)
+                            ax.figure.autofmt_xdate()
                             plt.show()
                         else:
                             print_error("Não foi possível encontrar colunas compatíveis para comparação")
@@ -511,11 +782,10 @@ def adicionar_regiao():
     
     try:
         # Carregar regiões existentes
-        with open(CONFIG_DIR / "regioes.json", "r", encoding="utf-8") as f:
-            config = json.load(f)
+        config = copy.deepcopy(_load_regioes_config())
         
         # Verificar duplicação
-        regioes_existentes = [r["nome"] for r in config.get("regioes_agricolas", [])]
+        regioes_existentes = {r["nome"] for r in config.get("regioes_agricolas", [])}
         
         # Solicitar dados da nova região
         nome = input("Nome da região (sem espaços, ex: Sao_Paulo_SP): ")
@@ -557,8 +827,7 @@ def adicionar_regiao():
         config["regioes_agricolas"].append(nova_regiao)
         
         # Salvar arquivo atualizado
-        with open(CONFIG_DIR / "regioes.json", "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        _salvar_regioes_config(config)
         
         print_success(f"Região '{nome}' adicionada com sucesso!")
     
@@ -573,8 +842,7 @@ def remover_regiao():
     
     try:
         # Carregar regiões existentes
-        with open(CONFIG_DIR / "regioes.json", "r", encoding="utf-8") as f:
-            config = json.load(f)
+        config = copy.deepcopy(_load_regioes_config())
         
         regioes = config.get("regioes_agricolas", [])
         
@@ -597,8 +865,7 @@ def remover_regiao():
                     config["regioes_agricolas"].pop(escolha - 1)
                     
                     # Salvar arquivo atualizado
-                    with open(CONFIG_DIR / "regioes.json", "w", encoding="utf-8") as f:
-                        json.dump(config, f, indent=2, ensure_ascii=False)
+                    _salvar_regioes_config(config)
                     
                     print_success(f"Região '{nome_regiao}' removida com sucesso!")
             else:
@@ -624,62 +891,62 @@ def importar_regioes_csv():
             return
         
         # Carregar configuração atual
-        with open(CONFIG_DIR / "regioes.json", "r", encoding="utf-8") as f:
-            config = json.load(f)
+        config = copy.deepcopy(_load_regioes_config())
         
         if "regioes_agricolas" not in config:
             config["regioes_agricolas"] = []
         
-        regioes_existentes = [r["nome"] for r in config["regioes_agricolas"]]
+        regioes_existentes = {r["nome"] for r in config["regioes_agricolas"]}
         
-        # Ler arquivo CSV
-        with open(caminho, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            
-            if not reader.fieldnames:
-                print_error("Arquivo CSV vazio ou inválido!")
-                return
-            
-            # Verificar campos necessários
-            campos_necessarios = ["nome", "latitude", "longitude"]
-            campos_faltantes = [campo for campo in campos_necessarios if campo not in reader.fieldnames]
-            
-            if campos_faltantes:
-                print_error(f"Campos obrigatórios faltando no CSV: {', '.join(campos_faltantes)}")
-                print_info(f"Campos disponíveis: {', '.join(reader.fieldnames)}")
-                return
-            
-            # Processar linhas
-            contador = 0
-            for row in reader:
-                # Verificar se região já existe
-                if row["nome"] in regioes_existentes:
-                    print_warning(f"Região '{row['nome']}' já existe e será ignorada.")
-                    continue
-                
-                try:
-                    # Criar objeto da nova região
-                    nova_regiao = {
-                        "nome": row["nome"],
-                        "descricao": row.get("descricao", row["nome"]),
-                        "latitude": float(row["latitude"]),
-                        "longitude": float(row["longitude"]),
-                        "estacao_inmet": row.get("estacao_inmet", "")
-                    }
-                    
-                    # Adicionar à configuração
-                    config["regioes_agricolas"].append(nova_regiao)
-                    regioes_existentes.append(row["nome"])
-                    contador += 1
-                
-                except (ValueError, KeyError) as e:
-                    print_warning(f"Erro ao processar linha: {e}")
-            
-            # Salvar arquivo atualizado
-            with open(CONFIG_DIR / "regioes.json", "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
-            
-            print_success(f"{contador} regiões importadas com sucesso!")
+        # Ler arquivo CSV de uma vez (tudo como texto; coordenadas convertidas abaixo)
+        import pandas as pd
+        
+        try:
+            df = pd.read_csv(caminho, encoding='utf-8', dtype=str, keep_default_na=False)
+        except pd.errors.EmptyDataError:
+            print_error("Arquivo CSV vazio ou inválido!")
+            return
+        
+        # Verificar campos necessários
+        campos_necessarios = ["nome", "latitude", "longitude"]
+        campos_faltantes = [campo for campo in campos_necessarios if campo not in df.columns]
+        
+        if campos_faltantes:
+            print_error(f"Campos obrigatórios faltando no CSV: {', '.join(campos_faltantes)}")
+            print_info(f"Campos disponíveis: {', '.join(df.columns)}")
+            return
+        
+        # Ignorar regiões já configuradas ou repetidas no próprio arquivo
+        duplicadas = df["nome"].isin(regioes_existentes) | df["nome"].duplicated()
+        for nome in df.loc[duplicadas, "nome"]:
+            print_warning(f"Região '{nome}' já existe e será ignorada.")
+        df = df[~duplicadas]
+        
+        # Converter coordenadas; linhas com valores não numéricos são descartadas
+        df = df.assign(
+            latitude=pd.to_numeric(df["latitude"], errors="coerce"),
+            longitude=pd.to_numeric(df["longitude"], errors="coerce")
+        )
+        invalidas = df["latitude"].isna() | df["longitude"].isna()
+        for nome in df.loc[invalidas, "nome"]:
+            print_warning(f"Erro ao processar linha: coordenadas inválidas para '{nome}'")
+        df = df[~invalidas]
+        
+        # Campos opcionais
+        if "descricao" not in df.columns:
+            df = df.assign(descricao=df["nome"])
+        if "estacao_inmet" not in df.columns:
+            df = df.assign(estacao_inmet="")
+        
+        # Adicionar à configuração
+        novas_regioes = df[["nome", "descricao", "latitude", "longitude", "estacao_inmet"]].to_dict(orient="records")
+        config["regioes_agricolas"].extend(novas_regioes)
+        contador = len(novas_regioes)
+        
+        # Salvar arquivo atualizado
+        _salvar_regioes_config(config)
+        
+        print_success(f"{contador} regiões importadas com sucesso!")
     
     except Exception as e:
         print_error(f"Erro ao importar regiões: {e}")
@@ -692,8 +959,7 @@ def exportar_regioes_csv():
     
     try:
         # Carregar regiões existentes
-        with open(CONFIG_DIR / "regioes.json", "r", encoding="utf-8") as f:
-            config = json.load(f)
+        config = _load_regioes_config()
         
         regioes = config.get("regioes_agricolas", [])
         
@@ -708,20 +974,13 @@ def exportar_regioes_csv():
         if os.path.isdir(caminho):
             caminho = os.path.join(caminho, "regioes_exportadas.csv")
         
-        # Escrever arquivo CSV
-        with open(caminho, 'w', encoding='utf-8', newline='') as csvfile:
-            fieldnames = ["nome", "descricao", "latitude", "longitude", "estacao_inmet"]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            for regiao in regioes:
-                writer.writerow({
-                    "nome": regiao["nome"],
-                    "descricao": regiao.get("descricao", ""),
-                    "latitude": regiao["latitude"],
-                    "longitude": regiao["longitude"],
-                    "estacao_inmet": regiao.get("estacao_inmet", "")
-                })
+        # Escrever arquivo CSV de uma vez a partir de um DataFrame
+        import pandas as pd
+        
+        fieldnames = ["nome", "descricao", "latitude", "longitude", "estacao_inmet"]
+        df = pd.DataFrame(regioes).reindex(columns=fieldnames)
+        df[["descricao", "estacao_inmet"]] = df[["descricao", "estacao_inmet"]].fillna("")
+        df.to_csv(caminho, index=False, encoding='utf-8')
         
         print_success(f"{len(regioes)} regiões exportadas para '{caminho}'")
     
@@ -735,13 +994,7 @@ def menu_regioes():
     while True:
         clear_screen()
         print_header("GERENCIAR REGIÕES")
-        print(f"{Fore.CYAN}1.{Style.RESET_ALL} Listar regiões configuradas")
-        print(f"{Fore.CYAN}2.{Style.RESET_ALL} Adicionar nova região")
-        print(f"{Fore.CYAN}3.{Style.RESET_ALL} Remover região")
-        print(f"{Fore.CYAN}4.{Style.RESET_ALL} Importar regiões de CSV")
-        print(f"{Fore.CYAN}5.{Style.RESET_ALL} Exportar regiões para CSV")
-        print(f"{Fore.CYAN}0.{Style.RESET_ALL} Voltar")
-        print()
+        print(_texto_menu(_OPCOES_REGIOES))
         opcao = input("Escolha uma opção: ")
         
         if opcao == "1":
@@ -751,8 +1004,7 @@ def menu_regioes():
             
             if regioes:
                 # Carregar detalhes das regiões
-                with open(CONFIG_DIR / "regioes.json", "r", encoding="utf-8") as f:
-                    config = json.load(f)
+                config = _load_regioes_config()
                 
                 regioes_info = []
                 for regiao in config.get("regioes_agricolas", []):
@@ -764,7 +1016,7 @@ def menu_regioes():
                         regiao.get("estacao_inmet", "")
                     ])
                 
-                print_table(regioes_info, ["Nome", "Descrição", "Latitude", "Longitude", "Estação INMET"])
+                _print_regioes_simples(regioes_info)
             else:
                 print_warning("Nenhuma região configurada encontrada!")
             
@@ -793,13 +1045,203 @@ def menu_regioes():
             pause()
 
 
+# Pasta Downloads do usuário, resolvida uma única vez
+_DOWNLOADS_DIR = Path.home() / "Downloads"
+_dir_exportacao_cache = {"val": None}
+
+
+def _diretorio_exportacao():
+    """
+    Retorna o diretório onde as exportações são salvas: a pasta Downloads do
+    usuário ou, se ela não existir, o diretório atual. O resultado é
+    reaproveitado enquanto o diretório escolhido continuar existindo.
+    """
+    diretorio = _dir_exportacao_cache["val"]
+    if diretorio is None or not os.path.isdir(diretorio):
+        if _DOWNLOADS_DIR.is_dir():
+            diretorio = str(_DOWNLOADS_DIR)
+        else:
+            print_warning("Pasta Downloads não encontrada. Usando diretório atual.")
+            diretorio = os.getcwd()
+        _dir_exportacao_cache["val"] = diretorio
+    return diretorio
+
+
+def _escritor_csv(dados):
+    """
+    Escolhe o escritor de CSV para uma exportação: o escritor C++ do pyarrow,
+    se instalado e se todas as colunas forem numéricas ou de data/hora, ou
+    DataFrame.to_csv nos demais casos.
+    
+    Returns:
+        str: 'pyarrow' ou 'pandas'
+    """
+    import importlib.util
+    import pandas as pd
+    
+    if importlib.util.find_spec("pyarrow") is None:
+        return "pandas"
+    
+    for coluna in dados.columns:
+        serie = dados[coluna]
+        if pd.api.types.is_datetime64_any_dtype(serie):
+            continue
+        if pd.api.types.is_numeric_dtype(serie) and not pd.api.types.is_bool_dtype(serie) \
+                and not pd.api.types.is_extension_array_dtype(serie):
+            continue
+        # Texto ou tipos mistos: manter o escritor do pandas
+        return "pandas"
+    return "pyarrow"
+
+
+def _csv_rapido(dados, destino, cabecalho=True, escritor=None):
+    """
+    Grava um DataFrame em CSV com o escritor informado ou, se omitido, com o
+    escolhido por _escritor_csv.
+    
+    `destino` pode ser um caminho ou um arquivo binário já aberto, o que
+    permite gravar vários blocos em sequência (cabecalho=False nos seguintes).
+    Todos os blocos de um mesmo arquivo devem usar o mesmo escritor, para que
+    os valores saiam no mesmo formato.
+    
+    Returns:
+        str: O escritor utilizado
+    """
+    if escritor is None:
+        escritor = _escritor_csv(dados)
+    
+    if escritor == "pandas":
+        dados.to_csv(destino, index=False, header=cabecalho)
+        return escritor
+    
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    
+    # Os números saem com todos os dígitos necessários para recuperar o valor
+    # exato (valores ausentes ficam vazios, como no pandas)
+    tabela = pa.Table.from_pandas(dados, preserve_index=False)
+    # Datas com precisão de segundos, no mesmo formato do pandas
+    for i, campo in enumerate(tabela.schema):
+        if pa.types.is_timestamp(campo.type):
+            tabela = tabela.set_column(i, campo.name,
+                                       tabela.column(i).cast(pa.timestamp("s", tz=campo.type.tz), safe=False))
+    pa_csv.write_csv(tabela, destino, write_options=pa_csv.WriteOptions(include_header=cabecalho))
+    return escritor
+
+
+def _alinhar_bloco(bloco, colunas):
+    """
+    Reordena as colunas de um bloco conforme as do primeiro bloco exportado.
+    
+    Raises:
+        ValueError: Se o bloco tiver colunas diferentes, que seriam perdidas
+    """
+    if not bloco.columns.equals(colunas):
+        if len(bloco.columns.symmetric_difference(colunas)):
+            raise ValueError(f"Bloco com colunas diferentes do primeiro: {', '.join(map(str, bloco.columns))}")
+        bloco = bloco[colunas]
+    return bloco
+
+
+def _exportar_blocos_csv(blocos, caminho):
+    """
+    Grava em um único CSV os DataFrames produzidos por `blocos`.
+    
+    O cabeçalho vem do primeiro bloco; os seguintes devem ter as mesmas
+    colunas (como os de carregar_dados_recentes_iter). O arquivo só é criado
+    se houver dados.
+    
+    Returns:
+        int: Número de registros gravados
+    """
+    total = 0
+    colunas = None
+    arquivo = None
+    escritor = None
+    try:
+        for bloco in blocos:
+            if bloco.empty:
+                continue
+            if arquivo is None:
+                colunas = bloco.columns
+                arquivo = open(caminho, "wb")
+                # O escritor escolhido para o primeiro bloco vale para todos
+                escritor = _csv_rapido(bloco, arquivo)
+            else:
+                _csv_rapido(_alinhar_bloco(bloco, colunas), arquivo, cabecalho=False, escritor=escritor)
+            total += len(bloco)
+    finally:
+        if arquivo is not None:
+            arquivo.close()
+    return total
+
+
+def _exportar_blocos_excel(blocos, caminho):
+    """
+    Grava em uma planilha Excel os DataFrames produzidos por `blocos`, linha a
+    linha, sem manter a planilha inteira em memória. Os blocos devem ter as
+    mesmas colunas (como os de carregar_dados_recentes_iter).
+    
+    Usa o xlsxwriter em modo constant_memory quando disponível (cada linha é
+    descarregada em disco assim que escrita); caso contrário, o modo
+    write_only do openpyxl.
+    
+    Returns:
+        int: Número de registros gravados
+    """
+    try:
+        import xlsxwriter
+    except ImportError:
+        xlsxwriter = None
+    
+    total = 0
+    colunas = None
+    livro = planilha = None
+    
+    for bloco in blocos:
+        if bloco.empty:
+            continue
+        if colunas is None:
+            colunas = bloco.columns
+            cabecalho = [str(c) for c in colunas]
+            if xlsxwriter is not None:
+                livro = xlsxwriter.Workbook(caminho, {
+                    "constant_memory": True,
+                    "default_date_format": "yyyy-mm-dd hh:mm:ss",
+                })
+                planilha = livro.add_worksheet()
+                planilha.write_row(0, 0, cabecalho)
+            else:
+                from openpyxl import Workbook
+                livro = Workbook(write_only=True)
+                planilha = livro.create_sheet()
+                planilha.append(cabecalho)
+        else:
+            bloco = _alinhar_bloco(bloco, colunas)
+        
+        # Células vazias no lugar de NaN/NaT, como no DataFrame.to_excel
+        valores = bloco.astype(object).where(bloco.notna(), None)
+        if xlsxwriter is not None:
+            for i, linha in enumerate(valores.itertuples(index=False, name=None), total + 1):
+                planilha.write_row(i, 0, linha)
+        else:
+            for linha in valores.itertuples(index=False, name=None):
+                planilha.append(linha)
+        total += len(bloco)
+    
+    if livro is not None:
+        if xlsxwriter is not None:
+            livro.close()
+        else:
+            livro.save(caminho)
+    return total
+
+
 def exportar_dados_csv(regiao, periodo="ultimo_mes"):
     """Exporta dados de uma região para CSV"""
     print_header(f"EXPORTAR DADOS DE {regiao.upper()}")
     
     try:
-        from src.analisador_dados import carregar_dados_recentes
-        
         # Determinar período
         dias = 30
         if periodo == "ultimo_ano":
@@ -813,30 +1255,23 @@ def exportar_dados_csv(regiao, periodo="ultimo_mes"):
         elif periodo == "todos_dados":
             dias = 365 * 15  # Até 15 anos
         
-        # Carregar dados
-        dados = carregar_dados_recentes(regiao, dias=dias)
-        
-        if dados is None or dados.empty:
-            print_error(f"Nenhum dado encontrado para {regiao}!")
-            return
-        
-        # Usando pasta Downloads do usuário para salvar
-        diretorio = os.path.join(os.path.expanduser("~"), "Downloads")
-        
-        # Verificar se existe a pasta Downloads, caso contrário usar o diretório atual
-        if not os.path.exists(diretorio):
-            print_warning(f"Pasta Downloads não encontrada. Usando diretório atual.")
-            diretorio = os.getcwd()
+        # Pasta Downloads do usuário (ou diretório atual, se não existir)
+        diretorio = _diretorio_exportacao()
         
         # Criar nome de arquivo
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         nome_arquivo = f"{regiao}_{periodo}_{timestamp}.csv"
         caminho_completo = os.path.join(diretorio, nome_arquivo)
         
-        # Salvar arquivo
-        dados.to_csv(caminho_completo, index=False)
+        # Salvar arquivo em blocos, sem manter todo o período em memória
+        blocos = _analisador_dados().carregar_dados_recentes_iter(regiao, dias=dias)
+        total = _exportar_blocos_csv(blocos, caminho_completo)
         
-        print_success(f"{len(dados)} registros exportados para '{caminho_completo}'")
+        if not total:
+            print_error(f"Nenhum dado encontrado para {regiao}!")
+            return
+        
+        print_success(f"{total} registros exportados para '{caminho_completo}'")
     
     except Exception as e:
         print_error(f"Erro ao exportar dados: {e}")
@@ -848,11 +1283,7 @@ def menu_exportacao():
     while True:
         clear_screen()
         print_header("EXPORTAÇÃO DE DADOS")
-        print(f"{Fore.CYAN}1.{Style.RESET_ALL} Exportar dados para CSV")
-        print(f"{Fore.CYAN}2.{Style.RESET_ALL} Exportar dados para Excel")
-        print(f"{Fore.CYAN}3.{Style.RESET_ALL} Exportar gráficos")
-        print(f"{Fore.CYAN}0.{Style.RESET_ALL} Voltar")
-        print()
+        print(_texto_menu(_OPCOES_EXPORTACAO))
         opcao = input("Escolha uma opção: ")
         
         if opcao == "1":
@@ -953,31 +1384,24 @@ def menu_exportacao():
                     elif periodo_opcao == "4":
                         dias = 365 * 15  # todos os dados (até 15 anos)
                     
-                    from src.analisador_dados import carregar_dados_recentes
-                    dados = carregar_dados_recentes(regiao, dias=dias)
-                    
-                    if dados is None or dados.empty:
-                        print_error(f"Nenhum dado encontrado para {regiao}!")
-                        pause()
-                        continue
-                    
-                    # Usando pasta Downloads do usuário para salvar
-                    diretorio = os.path.join(os.path.expanduser("~"), "Downloads")
-                    
-                    # Verificar se existe a pasta Downloads, caso contrário usar o diretório atual
-                    if not os.path.exists(diretorio):
-                        print_warning(f"Pasta Downloads não encontrada. Usando diretório atual.")
-                        diretorio = os.getcwd()
+                    # Pasta Downloads do usuário (ou diretório atual, se não existir)
+                    diretorio = _diretorio_exportacao()
                     
                     # Criar nome de arquivo
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                     nome_arquivo = f"{regiao}_dados_{timestamp}.xlsx"
                     caminho_completo = os.path.join(diretorio, nome_arquivo)
                     
-                    # Salvar arquivo
-                    dados.to_excel(caminho_completo, index=False, engine='openpyxl')
+                    # Salvar arquivo em blocos, sem manter todo o período em memória
+                    blocos = _analisador_dados().carregar_dados_recentes_iter(regiao, dias=dias)
+                    total = _exportar_blocos_excel(blocos, caminho_completo)
+                    
+                    if not total:
+                        print_error(f"Nenhum dado encontrado para {regiao}!")
+                        pause()
+                        continue
                     
-                    print_success(f"{len(dados)} registros exportados para '{caminho_completo}'")
+                    print_success(f"{total} registros exportados para '{caminho_completo}'")
                 else:
                     print_error("Índice inválido!")
             except ValueError:
@@ -1007,13 +1431,8 @@ def menu_exportacao():
                 if 1 <= escolha <= len(regioes):
                     regiao = regioes[escolha - 1]
                     
-                    # Usando pasta Downloads do usuário para salvar
-                    diretorio = os.path.join(os.path.expanduser("~"), "Downloads")
-                    
-                    # Verificar se existe a pasta Downloads, caso contrário usar o diretório atual
-                    if not os.path.exists(diretorio):
-                        print_warning(f"Pasta Downloads não encontrada. Usando diretório atual.")
-                        diretorio = os.getcwd()
+                    # Pasta Downloads do usuário (ou diretório atual, se não existir)
+                    diretorio = _diretorio_exportacao()
                     
                     # Carregar dados com opções de período
                     print("\nSelecione o período para análise:")
@@ -1032,10 +1451,7 @@ def menu_exportacao():
                     elif periodo_opcao == "4":
                         dias = 365 * 15  # todos os dados (até 15 anos)
                     
-                    from src.analisador_dados import carregar_dados_recentes
-                    from src.analisador_dados import plotar_temperatura, plotar_umidade, plotar_precipitacao
-                    
-                    dados = carregar_dados_recentes(regiao, dias=dias)
+                    dados = _carregar_dados_cache(regiao, dias)
                     
                     if dados is None or dados.empty:
                         print_error(f"Nenhum dado encontrado para {regiao}!")
@@ -1045,35 +1461,24 @@ def menu_exportacao():
                     # Timestamp para os arquivos
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                     
-                    # Salvar gráficos
+                    # Salvar gráficos (gerados em paralelo)
                     print_info("Gerando gráficos...")
                     
-                    # Temperatura
-                    try:
-                        arquivo_temp = os.path.join(diretorio, f"{regiao}_temperatura_{timestamp}.png")
-                        plt.figure(figsize=(12, 8))
-                        plotar_temperatura(dados, regiao, arquivo_temp)
-                        print_success(f"Gráfico de temperatura salvo em '{arquivo_temp}'")
-                    except Exception as e:
-                        print_warning(f"Erro ao gerar gráfico de temperatura: {e}")
-                    
-                    # Umidade
-                    try:
-                        arquivo_umid = os.path.join(diretorio, f"{regiao}_umidade_{timestamp}.png")
-                        plt.figure(figsize=(12, 8))
-                        plotar_umidade(dados, regiao, arquivo_umid)
-                        print_success(f"Gráfico de umidade salvo em '{arquivo_umid}'")
-                    except Exception as e:
-                        print_warning(f"Erro ao gerar gráfico de umidade: {e}")
+                    graficos = {
+                        "temperatura": "temperatura",
+                        "umidade": "umidade",
+                        "precipitacao": "precipitação",
+                    }
+                    caminhos = {tipo: os.path.join(diretorio, f"{regiao}_{tipo}_{timestamp}.png")
+                                for tipo in graficos}
+                    resultados = _analisador_dados().exportar_graficos(dados, regiao, caminhos)
                     
-                    # Precipitação
-                    try:
-                        arquivo_chuva = os.path.join(diretorio, f"{regiao}_precipitacao_{timestamp}.png")
-                        plt.figure(figsize=(12, 8))
-                        plotar_precipitacao(dados, regiao, arquivo_chuva)
-                        print_success(f"Gráfico de precipitação salvo em '{arquivo_chuva}'")
-                    except Exception as e:
-                        print_warning(f"Erro ao gerar gráfico de precipitação: {e}")
+                    for tipo, descricao in graficos.items():
+                        erro = resultados.get(tipo)
+                        if erro is None:
+                            print_success(f"Gráfico de {descricao} salvo em '{caminhos[tipo]}'")
+                        else:
+                            print_warning(f"Erro ao gerar gráfico de {descricao}: {erro}")
                 
                 else:
                     print_error("Índice inválido!")
@@ -1092,49 +1497,114 @@ def menu_exportacao():
             pause()
 
 
+def _listar_logs_por_mtime(diretorio):
+    """
+    Lista os arquivos .log sob `diretorio` (em qualquer subdiretório) como
+    tuplas (caminho, mtime, tamanho), do mais antigo para o mais recente.
+    
+    Usa os.scandir recursivamente, fazendo um único stat por arquivo.
+    """
+    arquivos = []
+    pendentes = [str(diretorio)]
+    while pendentes:
+        try:
+            entradas = os.scandir(pendentes.pop())
+        except FileNotFoundError:
+            continue
+        with entradas:
+            for entrada in entradas:
+                if entrada.is_dir(follow_symlinks=False):
+                    pendentes.append(entrada.path)
+                elif entrada.name.endswith(".log") and entrada.is_file():
+                    info = entrada.stat()
+                    arquivos.append((entrada.path, info.st_mtime, info.st_size))
+    
+    arquivos.sort(key=lambda item: item[1])
+    return arquivos
+
+
+def _ler_ultimas_linhas(caminho, n=50, tamanho_bloco=8192):
+    """
+    Retorna as últimas `n` linhas de um arquivo de texto e o total de linhas.
+    
+    Arquivos pequenos são lidos por inteiro. Nos demais, as linhas são
+    contadas em blocos binários (sem decodificar) e apenas o final do arquivo
+    é lido, de trás para frente, como o `tail`.
+    """
+    tamanho = os.path.getsize(caminho)
+    if tamanho < 64 * 1024:
+        with open(caminho, "r", encoding="utf-8") as f:
+            linhas = f.readlines()
+        return linhas[-n:], len(linhas)
+    
+    with open(caminho, "rb") as f:
+        total = sum(bloco.count(b"\n") for bloco in iter(lambda: f.read(1 << 20), b""))
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b"\n":
+            total += 1  # última linha sem quebra de linha
+        
+        final = b""
+        posicao = tamanho
+        # n + 1 quebras garantem n linhas completas (a primeira pode estar cortada)
+        while posicao > 0 and final.count(b"\n") <= n:
+            leitura = min(tamanho_bloco, posicao)
+            posicao -= leitura
+            f.seek(posicao)
+            final = f.read(leitura) + final
+    
+    linhas = final.decode("utf-8", errors="replace").splitlines(keepends=True)
+    return linhas[-n:], total
+
+
 def visualizar_logs():
     """Visualiza os logs do sistema"""
     print_header("VISUALIZAR LOGS")
     
-    # Listar todos os arquivos de log organizados por ano/mês
-    arquivos_log = sorted(LOGS_DIR.glob("**/*.log"), key=os.path.getmtime, reverse=True)
+    # Descarregar o buffer para que o log do CLI apareça atualizado
+    _log_buffer.flush()
+    
+    # Listar todos os arquivos de log organizados por ano/mês, do mais recente
+    # ao mais antigo (tamanho e data vêm do mesmo stat da listagem)
+    arquivos_log = _listar_logs_por_mtime(LOGS_DIR)[::-1]
     
     if not arquivos_log:
         print_warning("Nenhum arquivo de log encontrado.")
         return
     
     print("Arquivos de log disponíveis:")
-    for i, arquivo in enumerate(arquivos_log, 1):
-        tamanho = os.path.getsize(arquivo) / 1024  # KB
-        data_mod = datetime.fromtimestamp(os.path.getmtime(arquivo)).strftime("%Y-%m-%d %H:%M:%S")
-        print(f"{Fore.CYAN}{i}.{Style.RESET_ALL} {arquivo.name} ({tamanho:.1f} KB) - {data_mod}")
+    for i, (arquivo, mtime, tamanho) in enumerate(arquivos_log, 1):
+        data_mod = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
+        print(f"{Fore.CYAN}{i}.{Style.RESET_ALL} {os.path.basename(arquivo)} ({tamanho / 1024:.1f} KB) - {data_mod}")
     print()
     
     try:
         escolha = int(input("Escolha um arquivo (número): "))
         if 1 <= escolha <= len(arquivos_log):
-            arquivo = arquivos_log[escolha - 1]
+            arquivo = Path(arquivos_log[escolha - 1][0])
             
-            # Ler conteúdo do log
-            with open(arquivo, "r", encoding="utf-8") as f:
-                linhas = f.readlines()
+            # Ler apenas o final do log
+            linhas, total_linhas = _ler_ultimas_linhas(arquivo, 50)
             
             # Se o arquivo for muito grande, mostrar apenas as últimas 50 linhas
-            if len(linhas) > 50:
-                print_info(f"Arquivo grande ({len(linhas)} linhas). Mostrando as últimas 50 linhas.")
-                linhas = linhas[-50:]
+            if total_linhas > 50:
+                print_info(f"Arquivo grande ({total_linhas} linhas). Mostrando as últimas 50 linhas.")
             
             print_header(f"CONTEÚDO DE {arquivo.name}")
+            # Colorir cada linha de acordo com o nível de log (primeiro nível encontrado)
+            cores = {"ERROR": Fore.RED, "WARNING": Fore.YELLOW, "INFO": Fore.GREEN}
+            buscar_nivel = _RE_NIVEL_LOG.search
+            saida = []
             for linha in linhas:
-                # Colorir linha de acordo com o nível de log
-                if "ERROR" in linha:
-                    print(f"{Fore.RED}{linha.strip()}{Style.RESET_ALL}")
-                elif "WARNING" in linha:
-                    print(f"{Fore.YELLOW}{linha.strip()}{Style.RESET_ALL}")
-                elif "INFO" in linha:
-                    print(f"{Fore.GREEN}{linha.strip()}{Style.RESET_ALL}")
+                nivel = buscar_nivel(linha)
+                if nivel:
+                    saida.append(cores[nivel.group()] + linha.strip() + Style.RESET_ALL)
                 else:
-                    print(linha.strip())
+                    saida.append(linha.strip())
+            
+            # Uma única escrita no terminal para todas as linhas
+            if saida:
+                sys.stdout.write("\n".join(saida) + "\n")
+                sys.stdout.flush()
             
             # Perguntar se deseja exportar
             if input("\nDeseja exportar este log? (s/n) [n]: ").lower() == "s":
@@ -1147,10 +1617,10 @@ def visualizar_logs():
                     print_error(f"O diretório '{diretorio}' não existe!")
                     return
                 
-                # Copiar arquivo
+                # Copiar apenas o conteúdo (sendfile no Linux), sem replicar metadados
                 import shutil
                 destino = os.path.join(diretorio, arquivo.name)
-                shutil.copy2(arquivo, destino)
+                shutil.copyfile(arquivo, destino)
                 
                 print_success(f"Log exportado para '{destino}'")
         else:
@@ -1162,16 +1632,39 @@ def visualizar_logs():
         logger.exception("Erro ao visualizar log")
 
 
+def _remover_arquivos(caminhos):
+    """
+    Remove os arquivos informados. Listas grandes são removidas em paralelo
+    por um pool de threads (unlink libera o GIL durante a chamada ao sistema).
+    
+    Returns:
+        tuple: (arquivos removidos, arquivos que falharam)
+    """
+    def remover(caminho):
+        try:
+            os.unlink(caminho)
+            return True
+        except OSError as e:
+            logger.error(f"Erro ao remover '{caminho}': {e}")
+            return False
+    
+    if len(caminhos) < 32:
+        resultados = [remover(caminho) for caminho in caminhos]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            resultados = list(executor.map(remover, caminhos))
+    
+    removidos = sum(resultados)
+    return removidos, len(resultados) - removidos
+
+
 def menu_logs():
     """Menu de logs e monitoramento"""
     while True:
         clear_screen()
         print_header("LOGS E MONITORAMENTO")
-        print(f"{Fore.CYAN}1.{Style.RESET_ALL} Visualizar logs do sistema")
-        print(f"{Fore.CYAN}2.{Style.RESET_ALL} Verificar estatísticas de coleta")
-        print(f"{Fore.CYAN}3.{Style.RESET_ALL} Limpar logs antigos")
-        print(f"{Fore.CYAN}0.{Style.RESET_ALL} Voltar")
-        print()
+        print(_texto_menu(_OPCOES_LOGS))
         opcao = input("Escolha uma opção: ")
         
         if opcao == "1":
@@ -1182,7 +1675,7 @@ def menu_logs():
             print_header("ESTATÍSTICAS DE COLETA")
             
             # Contar arquivos por região
-            dados_por_regiao = {}
+            dados_por_regiao = defaultdict(lambda: {"atual": 0, "historico": 0, "fonte": Counter()})
             
             # Procurar no diretório de dados
             for fonte in ["openweather", "inmet"]:
@@ -1190,30 +1683,18 @@ def menu_logs():
                 if not fonte_dir.exists():
                     continue
                 
-                for arquivo in fonte_dir.glob("**/*.csv"):
-                    nome_arquivo = arquivo.name
+                # Históricos podem estar em Parquet; os .parquet de dados atuais são
+                # apenas cache de leitura dos CSVs e não entram na contagem
+                for arquivo in chain(fonte_dir.glob("**/*.csv"), fonte_dir.glob("**/historico_*.parquet")):
+                    # Formato: tipo_regiao_data.csv ou tipo_regiao_data_timestamp.csv
+                    nome = _RE_ARQUIVO_DADOS.match(arquivo.name)
+                    if not nome:
+                        continue
                     
-                    # Extrair região do nome do arquivo
-                    partes = nome_arquivo.split("_")
-                    if len(partes) >= 3 and partes[0] in ["atual", "historico"]:
-                        # Obter região a partir do nome do arquivo
-                        # Formato: tipo_regiao_data.csv ou tipo_regiao_parte1_data.csv
-                        primeiro_indice = nome_arquivo.find('_') + 1
-                        ultimo_indice = nome_arquivo.rfind('_')
-                        regiao = nome_arquivo[primeiro_indice:ultimo_indice]
-                        
-                        if regiao not in dados_por_regiao:
-                            dados_por_regiao[regiao] = {"atual": 0, "historico": 0, "fonte": {}}
-                        
-                        # Adicionar a fonte
-                        if fonte not in dados_por_regiao[regiao]["fonte"]:
-                            dados_por_regiao[regiao]["fonte"][fonte] = 0
-                        
-                        dados_por_regiao[regiao]["fonte"][fonte] += 1
-                        
-                        # Incrementar contador por tipo
-                        tipo = partes[0]  # "atual" ou "historico"
-                        dados_por_regiao[regiao][tipo] += 1
+                    tipo, regiao = nome.groups()  # tipo: "atual" ou "historico"
+                    stats = dados_por_regiao[regiao]
+                    stats["fonte"][fonte] += 1
+                    stats[tipo] += 1
             
             # Mostrar estatísticas
             if not dados_por_regiao:
@@ -1236,8 +1717,8 @@ def menu_logs():
         elif opcao == "3":
             print_header("LIMPAR LOGS ANTIGOS")
             
-            # Listar todos os arquivos de log organizados por ano/mês
-            arquivos_log = sorted(LOGS_DIR.glob("**/*.log"), key=os.path.getmtime)
+            # Listar todos os arquivos de log organizados por ano/mês (um stat por arquivo)
+            arquivos_log = _listar_logs_por_mtime(LOGS_DIR)
             
             if not arquivos_log:
                 print_warning("Nenhum arquivo de log encontrado.")
@@ -1267,44 +1748,46 @@ def menu_logs():
                 continue
             
             try:
-                data_limite = None
+                limite = None
                 manter_qtd = None
                 
                 if escolha == "1":
                     # Manter logs dos últimos 7 dias
-                    data_limite = datetime.now() - timedelta(days=7)
+                    limite = (datetime.now() - timedelta(days=7)).timestamp()
                 elif escolha == "2":
                     # Manter logs do último mês
-                    data_limite = datetime.now() - timedelta(days=30)
+                    limite = (datetime.now() - timedelta(days=30)).timestamp()
                 elif escolha == "3":
                     # Manter 10 logs mais recentes
                     manter_qtd = 10
                 elif escolha == "4":
                     # Limpar todos
-                    data_limite = datetime.now()
                     manter_qtd = 0
                 else:
                     print_warning("Opção inválida!")
                     pause()
                     continue
                 
-                # Processar exclusão
-                excluidos = 0
+                # Selecionar arquivos (a lista está ordenada do mais antigo ao mais recente)
+                a_excluir = []
                 if manter_qtd is not None:
                     # Excluir com base na quantidade
-                    for arquivo in arquivos_log[:-manter_qtd] if manter_qtd > 0 else arquivos_log:
-                        os.remove(arquivo)
-                        excluidos += 1
+                    a_excluir = [arquivo for arquivo, _, _ in
+                                 islice(arquivos_log, max(len(arquivos_log) - manter_qtd, 0))]
                 
-                elif data_limite is not None:
-                    # Excluir com base na data
-                    for arquivo in arquivos_log:
-                        data_mod = datetime.fromtimestamp(os.path.getmtime(arquivo))
-                        if data_mod < data_limite:
-                            os.remove(arquivo)
-                            excluidos += 1
+                elif limite is not None:
+                    # Excluir com base na data: compara o mtime (float) já obtido na
+                    # listagem, sem criar um datetime nem fazer outro stat por arquivo
+                    for arquivo, mtime, _ in arquivos_log:
+                        if mtime >= limite:
+                            break
+                        a_excluir.append(arquivo)
+                
+                excluidos, falhas = _remover_arquivos(a_excluir)
                 
                 print_success(f"{excluidos} arquivos de log removidos!")
+                if falhas:
+                    print_warning(f"{falhas} arquivos não puderam ser removidos. Verifique os logs.")
             
             except Exception as e:
                 print_error(f"Erro ao limpar logs: {e}")
@@ -1326,9 +1809,9 @@ def configurar_credenciais():
     try:
         # Carregar credenciais atuais
         credenciais = {}
+        caminho = CONFIG_DIR / "credenciais.json"
         try:
-            with open(CONFIG_DIR / "credenciais.json", "r", encoding="utf-8") as f:
-                credenciais = json.load(f)
+            credenciais = _json_loads(caminho.read_bytes())
         except FileNotFoundError:
             print_info("Arquivo de credenciais não encontrado. Será criado um novo.")
         except json.JSONDecodeError:
@@ -1356,9 +1839,8 @@ def configurar_credenciais():
                 credenciais["inmet"] = {}
             credenciais["inmet"]["token"] = novo_inmet_token
         
-        # Salvar arquivo
-        with open(CONFIG_DIR / "credenciais.json", "w", encoding="utf-8") as f:
-            json.dump(credenciais, f, indent=2)
+        # Salvar arquivo (já serializado em bytes)
+        caminho.write_bytes(_json_dumps(credenciais))
         
         print_success("Credenciais atualizadas com sucesso!")
     
@@ -1372,11 +1854,7 @@ def menu_configuracoes():
     while True:
         clear_screen()
         print_header("CONFIGURAÇÕES")
-        print(f"{Fore.CYAN}1.{Style.RESET_ALL} Configurar credenciais de API")
-        print(f"{Fore.CYAN}2.{Style.RESET_ALL} Configurar frequência de coleta")
-        print(f"{Fore.CYAN}3.{Style.RESET_ALL} Verificar diretórios do sistema")
-        print(f"{Fore.CYAN}0.{Style.RESET_ALL} Voltar")
-        print()
+        print(_texto_menu(_OPCOES_CONFIGURACOES))
         opcao = input("Escolha uma opção: ")
         
         if opcao == "1":
@@ -1393,9 +1871,9 @@ def menu_configuracoes():
             
             print("\nExemplo de configuração para crontab:")
             print(f"{Fore.GREEN}# Coleta diária às 2:00 da manhã")
-            print(f"0 2 * * * cd {BASE_DIR} && python cli.py coleta atual > /dev/null 2>&1")
+            print(f"0 2 * * * cd {BASE_DIR} && python cli.py coleta --modo atual > /dev/null 2>&1")
             print(f"\n# Coleta histórica semanal (domingo às 3:00)")
-            print(f"0 3 * * 0 cd {BASE_DIR} && python cli.py coleta historico > /dev/null 2>&1{Style.RESET_ALL}")
+            print(f"0 3 * * 0 cd {BASE_DIR} && python cli.py coleta --modo historico > /dev/null 2>&1{Style.RESET_ALL}")
             
             pause()
         
@@ -1414,31 +1892,28 @@ def menu_configuracoes():
             }
             
             tabela = []
+            diretorios_ausentes = []
             for nome, diretorio in diretorios.items():
                 existe = os.path.exists(diretorio)
                 status = f"{Fore.GREEN}OK{Style.RESET_ALL}" if existe else f"{Fore.RED}Não encontrado{Style.RESET_ALL}"
                 
-                # Verificar permissões
+                # Verificar permissões com uma única chamada (sem criar arquivo de teste).
+                # Em alguns sistemas de arquivos de rede (NFS) o resultado pode não
+                # refletir as permissões efetivas do servidor.
                 permissao = "N/A"
                 if existe:
-                    try:
-                        # Testar escrita
-                        test_file = os.path.join(diretorio, ".test_write")
-                        with open(test_file, "w") as f:
-                            f.write("test")
-                        os.remove(test_file)
+                    if os.access(diretorio, os.W_OK | os.X_OK):
                         permissao = f"{Fore.GREEN}Leitura/Escrita{Style.RESET_ALL}"
-                    except PermissionError:
+                    else:
                         permissao = f"{Fore.YELLOW}Somente leitura{Style.RESET_ALL}"
-                    except Exception:
-                        permissao = f"{Fore.RED}Erro{Style.RESET_ALL}"
+                else:
+                    diretorios_ausentes.append(nome)
                 
                 tabela.append([nome, str(diretorio), status, permissao])
             
             print_table(tabela, ["Diretório", "Caminho", "Status", "Permissões"])
             
             # Opção para criar diretórios ausentes
-            diretorios_ausentes = [d for d, p in diretorios.items() if not os.path.exists(p)]
             if diretorios_ausentes:
                 print_warning(f"Diretórios ausentes: {', '.join(diretorios_ausentes)}")
                 if confirm_action("Deseja criar os diretórios ausentes?"):
@@ -1489,6 +1964,7 @@ def mostrar_ajuda():
         elif escolha == "2":
             # Abrir no navegador
             try:
+                import webbrowser
                 url = "file://" + str(DOCS_DIR / "DOCUMENTACAO.md")
                 webbrowser.open(url)
                 print_info("Documentação aberta no navegador padrão.")
@@ -1534,12 +2010,45 @@ def coleta_comando(args):
         return 1
 
 
+def _ajuda_interativa():
+    """Mostra a ajuda a partir do menu principal"""
+    mostrar_ajuda()
+    pause()
+
+
+# Tabela de despacho do menu principal (a opção "0" é tratada no laço)
+_ACOES_PRINCIPAL = {
+    "1": menu_coleta,
+    "2": menu_consulta,
+    "3": menu_regioes,
+    "4": menu_exportacao,
+    "5": menu_logs,
+    "6": menu_configuracoes,
+    "7": _ajuda_interativa,
+}
+
+
 def main():
     """Função principal do CLI"""
+    # --no-color pode aparecer em qualquer posição e vale para ambos os modos
+    argv = sys.argv[1:]
+    if _cores_habilitadas(argv):
+        _init_cores()
+    argv = [arg for arg in argv if arg != "--no-color"]
+    
+    # "ajuda" não tem opções: dispensa a montagem do parser
+    if argv == ["ajuda"]:
+        mostrar_ajuda()
+        return 0
+    
     # Verificar se há argumentos de linha de comando
-    if len(sys.argv) > 1:
-        # Modo de comando (não interativo)
+    if argv:
+        # Modo de comando (não interativo); argparse só é carregado aqui
+        import argparse
+        
         parser = argparse.ArgumentParser(description="Sistema de Dados Climáticos - CLI")
+        parser.add_argument("--no-color", action="store_true",
+                            help="Desativar cores na saída (também via variável NO_COLOR)")
         subparsers = parser.add_subparsers(dest="comando", help="Comandos disponíveis")
         
         # Comando de coleta
@@ -1555,15 +2064,18 @@ def main():
         # Comando de análise
         analise_parser = subparsers.add_parser("analise", help="Iniciar análise interativa")
         
-        args = parser.parse_args()
+        args = parser.parse_args(argv)
         
         if args.comando == "coleta":
             return coleta_comando(args)
         elif args.comando == "analise":
-            # Iniciar análise interativa
-            import subprocess
-            subprocess.run([sys.executable, str(SRC_DIR / "exemplo_analise.py")])
-            return 0
+            # Iniciar análise interativa (no próprio processo)
+            try:
+                return executar_analise_interativa()
+            except Exception as e:
+                print_error(f"Erro ao iniciar interface de análise: {e}")
+                logger.exception("Erro na análise interativa")
+                return 1
         elif args.comando == "ajuda":
             mostrar_ajuda()
             return 0
@@ -1575,29 +2087,17 @@ def main():
     while True:
         opcao = mostrar_menu_principal()
         
-        if opcao == "1":
-            menu_coleta()
-        elif opcao == "2":
-            menu_consulta()
-        elif opcao == "3":
-            menu_regioes()
-        elif opcao == "4":
-            menu_exportacao()
-        elif opcao == "5":
-            menu_logs()
-        elif opcao == "6":
-            menu_configuracoes()
-        elif opcao == "7":
-            mostrar_ajuda()
-            pause()
-        elif opcao == "0":
+        if opcao == "0":
             clear_screen()
             print(f"{Fore.CYAN}Obrigado por usar o Sistema de Dados Climáticos!{Style.RESET_ALL}")
             return 0
-        else:
+        
+        acao = _ACOES_PRINCIPAL.get(opcao)
+        if acao is None:
             print_warning("Opção inválida!")
             pause()
-
+        else:
+            acao()
 
 if __name__ == "__main__":
     try:
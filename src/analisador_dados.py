@@ -5,98 +5,537 @@ Permite visualizar gráficos de temperatura, umidade e precipitação.
 
 import os
 import sys
-import pandas as pd
-import matplotlib.pyplot as plt
-import glob
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
+
+# pandas e matplotlib são importados dentro das funções que os usam, para que
+# a listagem de regiões e a ajuda da linha de comando não paguem o custo de
+# importação dessas bibliotecas
+
+# Colunas de data/hora de cada fonte (OpenWeather: data + hora; INMET: DATETIME)
+COLUNAS_DATA = {"data", "hora", "DATETIME"}
+
+# Colunas usadas nos gráficos (OpenWeather e INMET)
+COLUNAS_GRAFICOS = {"temperatura", "temp_min", "temp_max", "TEM_INS",
+                    "umidade", "UMD_INS", "chuva_1h", "CHUVA"}
+
+# Cache em Parquet dos CSVs diários (desativado com --no-cache). Fica em um
+# diretório próprio, fora das pastas de dados, que podem ser somente leitura
+# ou lidas por outras ferramentas
+_cache_parquet = {"habilitado": True}
+DIRETORIO_CACHE_PARQUET = Path(__file__).parent.parent / "dados" / "cache" / "analisador"
+
+# Leitura dos CSVs com o leitor multithread do pyarrow (ativada com --fast-io)
+_leitura_arrow = {"habilitada": False}
+
+# Se o pyarrow está instalado (verificado na primeira necessidade)
+_pyarrow = {"disponivel": None}
+
+# Tipos das colunas conhecidas dos CSVs coletados; as demais são inferidas
+TIPOS_COLUNAS = {
+    "data": str,
+    "hora": str,
+    "DATETIME": str,
+    "temperatura": "float64",
+    "sensacao_termica": "float64",
+    "temp_min": "float64",
+    "temp_max": "float64",
+    "pressao": "float64",
+    "umidade": "float64",
+    "ponto_orvalho": "float64",
+    "indice_uv": "float64",
+    "visibilidade": "float64",
+    "velocidade_vento": "float64",
+    "direcao_vento": "float64",
+    "rajada_vento": "float64",
+    "nuvens": "float64",
+    "chuva_1h": "float64",
+    "neve_1h": "float64",
+    "latitude": "float64",
+    "longitude": "float64",
+    "TEM_INS": "float64",
+    "UMD_INS": "float64",
+    "CHUVA": "float64",
+}
+
+# Colunas com um único valor por arquivo (convertidas para category)
+COLUNAS_CATEGORICAS = ("fonte", "regiao")
+
+
+# Última listagem de regiões e a assinatura (mtime) dos diretórios de mês usada nela
+_cache_regioes = {"chave": None, "val": None}
 
 
 def listar_regioes_disponiveis():
-    """Lista todas as regiões disponíveis nos dados coletados."""
+    """
+    Lista todas as regiões disponíveis nos dados coletados.
+    
+    O resultado é reaproveitado enquanto nenhum diretório de mês for criado,
+    removido ou alterado (o mtime de um diretório muda quando um arquivo é
+    adicionado ou removido nele), evitando listar todos os arquivos de novo.
+    """
+    caminho_base = Path(__file__).parent.parent / "dados"
+    
+    # Layout conhecido: dados/<fonte>/<ano>/<mes>/atual_<regiao>_<data>.csv
+    meses = [mes for fonte in ("openweather", "inmet")
+             for mes in _diretorios_meses(caminho_base / fonte)]
+    chave = tuple(meses)
+    
+    if _cache_regioes["chave"] != chave:
+        regioes = set()
+        for caminho_mes, _ in meses:
+            try:
+                with os.scandir(caminho_mes) as arquivos:
+                    for entrada in arquivos:
+                        nome_arquivo = entrada.name
+                        if (nome_arquivo.startswith("atual_") and nome_arquivo.endswith(".csv")
+                                and entrada.is_file()):
+                            regioes.add(nome_arquivo[6:].rsplit("_", 1)[0])
+            except FileNotFoundError:
+                continue
+        _cache_regioes["chave"] = chave
+        _cache_regioes["val"] = sorted(regioes)
+    
+    return list(_cache_regioes["val"])
+
+
+def _diretorios_meses(diretorio_fonte):
+    """Retorna (caminho, mtime em ns) de cada diretório <fonte>/<ano>/<mes>/, usando os.scandir"""
+    try:
+        with os.scandir(diretorio_fonte) as entradas:
+            anos = [e.path for e in entradas if e.is_dir()]
+    except FileNotFoundError:
+        return []
+    
+    meses = []
+    for ano in sorted(anos):
+        with os.scandir(ano) as entradas:
+            meses.extend((e.path, e.stat().st_mtime_ns) for e in entradas if e.is_dir())
+    meses.sort()
+    return meses
+
+
+def _arquivos_dados_recentes(regiao, dias):
+    """
+    Lista os arquivos diários de uma região nos últimos `dias` dias,
+    do mais recente para o mais antigo. Para cada dia é usado o arquivo do
+    OpenWeather e, na falta dele, o do INMET (backup).
+    
+    Cada diretório de mês é listado uma única vez; a existência de cada
+    arquivo é então verificada em memória, sem um stat por dia.
+    """
+    import pandas as pd
+    
     caminho_base = Path(__file__).parent.parent / "dados"
     
-    regioes = set()
+    # Calcular intervalo de datas (do mais recente para o mais antigo)
+    datas = pd.date_range(end=pd.Timestamp(datetime.now().date()), periods=dias, freq="D")[::-1]
+    intervalo_datas = zip(datas.strftime("%Y%m%d"), datas.strftime("%Y"), datas.strftime("%m"))
+    
+    # (fonte, ano, mes) -> nomes dos arquivos do diretório
+    listagens = {}
+    
+    def arquivos_do_mes(fonte, ano, mes):
+        chave = (fonte, ano, mes)
+        if chave not in listagens:
+            try:
+                listagens[chave] = set(os.listdir(caminho_base / fonte / ano / mes))
+            except FileNotFoundError:
+                listagens[chave] = set()
+        return listagens[chave]
+    
+    arquivos = []
+    for data_str, ano, mes in intervalo_datas:
+        padrao_arquivo = f"atual_{regiao}_{data_str}.csv"
+        
+        # OpenWeather
+        if padrao_arquivo in arquivos_do_mes("openweather", ano, mes):
+            arquivos.append(caminho_base / "openweather" / ano / mes / padrao_arquivo)
+            continue  # Se tiver dados OpenWeather, não precisa do INMET
+        
+        # INMET (backup)
+        if padrao_arquivo in arquivos_do_mes("inmet", ano, mes):
+            arquivos.append(caminho_base / "inmet" / ano / mes / padrao_arquivo)
+    
+    return arquivos
+
+
+def _processar_datas(dados):
+    """
+    Cria a coluna 'datetime' conforme o formato da fonte.
+    
+    Returns:
+        bool: False se o formato de data não for reconhecido
+    """
+    import pandas as pd
+    
+    # Formatos gravados pelo coletor; se algum arquivo fugir deles, a data é
+    # interpretada sem formato explícito (mais lento, porém tolerante)
+    try:
+        if 'data' in dados.columns and 'hora' in dados.columns:
+            # Dados OpenWeather: data e hora convertidas separadamente, sem concatenar strings
+            dados['datetime'] = (pd.to_datetime(dados['data'], format="%Y-%m-%d", cache=True)
+                                 + pd.to_timedelta(dados['hora']))
+        elif 'DATETIME' in dados.columns:
+            # Dados INMET
+            dados['datetime'] = pd.to_datetime(dados['DATETIME'], format="%Y-%m-%d %H:%M:%S", cache=True)
+        else:
+            return False
+    except ValueError:
+        if 'DATETIME' in dados.columns and 'data' not in dados.columns:
+            dados['datetime'] = _datas_iso8601(dados['DATETIME'])
+        else:
+            dados['datetime'] = _datas_iso8601(dados['data'] + ' ' + dados['hora'])
+    return True
+
+
+def _datas_iso8601(valores):
+    """
+    Interpreta datas ISO 8601 que podem variar de precisão entre linhas (ex.:
+    '2026-10-15 09:00:00.000000' e '2026-10-15 11:00:00' no mesmo arquivo).
+    """
+    import pandas as pd
+    
+    try:
+        return pd.to_datetime(valores, format="ISO8601")
+    except (TypeError, ValueError):
+        # pandas < 2.0 não conhece format="ISO8601", mas já aceita a mistura
+        # de precisões sem formato explícito
+        return pd.to_datetime(valores)
+
+
+def _pyarrow_disponivel():
+    """Verifica (uma única vez) se o pyarrow está instalado"""
+    if _pyarrow["disponivel"] is None:
+        import importlib.util
+        _pyarrow["disponivel"] = importlib.util.find_spec("pyarrow") is not None
+    return _pyarrow["disponivel"]
+
+
+def _caminho_cache_parquet(arquivo):
+    """Caminho do Parquet em cache para um CSV (nome derivado do caminho absoluto)"""
+    import hashlib
+    
+    chave = os.path.abspath(arquivo).encode("utf-8")
+    return DIRETORIO_CACHE_PARQUET / f"{hashlib.blake2b(chave, digest_size=16).hexdigest()}.parquet"
+
+
+def _identidade_csv(estado):
+    """Metadados que identificam a versão do CSV de origem gravada no cache"""
+    return {b"origem_mtime_ns": str(estado.st_mtime_ns).encode(),
+            b"origem_tamanho": str(estado.st_size).encode()}
+
+
+def _ler_cache_parquet(arquivo):
+    """
+    Retorna o DataFrame em cache para o CSV, se existir e tiver sido gerado a
+    partir desta mesma versão do arquivo (mtime em nanossegundos e tamanho
+    iguais aos gravados nos metadados); caso contrário retorna None.
+    """
+    import pyarrow.parquet as pq
+    
+    cache = _caminho_cache_parquet(arquivo)
+    try:
+        esperado = _identidade_csv(os.stat(arquivo))
+        metadados = pq.read_schema(cache).metadata or {}
+        if any(metadados.get(chave) != valor for chave, valor in esperado.items()):
+            return None
+        return pq.read_table(cache).to_pandas()
+    except (OSError, ValueError):
+        return None
+
+
+def _gravar_cache_parquet(arquivo, dados, estado):
+    """
+    Grava o DataFrame lido do CSV no diretório de cache, com o mtime e o
+    tamanho do CSV (`estado`, obtido antes da leitura) nos metadados
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    cache = _caminho_cache_parquet(arquivo)
+    temporario = cache.with_name(cache.name + ".tmp")
+    try:
+        tabela = pa.Table.from_pandas(dados, preserve_index=False)
+        tabela = tabela.replace_schema_metadata({**(tabela.schema.metadata or {}),
+                                                 **_identidade_csv(estado)})
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(tabela, temporario)
+        os.replace(temporario, cache)
+    except (OSError, ValueError, pa.ArrowException):
+        # Cache é apenas uma otimização: falhas são ignoradas
+        try:
+            os.remove(temporario)
+        except OSError:
+            pass
+
+
+def _ler_csv_dados(arquivo, colunas=None):
+    """
+    Lê um CSV diário com o parser C e tipos fixos para as colunas conhecidas,
+    evitando a inferência de tipos. Se `colunas` for informado, apenas essas
+    colunas (mais as de data/hora) são lidas; as ausentes no arquivo são ignoradas.
+
+    Com o pyarrow instalado e o cache habilitado, o arquivo completo é mantido
+    também em Parquet no diretório de cache e reutilizado enquanto o CSV não mudar.
+    """
+    import pandas as pd
+    
+    usecols = None
+    if colunas is not None:
+        necessarias = set(colunas) | COLUNAS_DATA
+        usecols = necessarias.__contains__
+
+    if not (_cache_parquet["habilitado"] and _pyarrow_disponivel()):
+        return pd.read_csv(arquivo, engine="c", dtype=TIPOS_COLUNAS, usecols=usecols)
+
+    dados = _ler_cache_parquet(arquivo)
+    if dados is None:
+        # Estado do CSV obtido antes da leitura: se ele mudar durante a leitura,
+        # o cache gravado não corresponderá à nova versão e será descartado
+        estado = os.stat(arquivo)
+        dados = pd.read_csv(arquivo, engine="c", dtype=TIPOS_COLUNAS)
+        _gravar_cache_parquet(arquivo, dados, estado)
+    if usecols is not None:
+        dados = dados[[coluna for coluna in dados.columns if usecols(coluna)]]
+    return dados
+
+
+def _ler_arquivos_dados(arquivos, colunas=None):
+    """
+    Lê vários CSVs diários, mantendo a ordem de `arquivos`.
     
-    # Procurar em OpenWeather
-    for arquivo_csv in glob.glob(str(caminho_base / "openweather" / "**" / "*.csv"), recursive=True):
-        nome_arquivo = os.path.basename(arquivo_csv)
-        if nome_arquivo.startswith("atual_"):
-            regiao = nome_arquivo.split("_", 1)[1].rsplit("_", 1)[0]
-            regioes.add(regiao)
+    O parser C do pandas libera o GIL durante a leitura, então os arquivos
+    são lidos em paralelo por threads quando há mais de um.
+    """
+    if len(arquivos) < 2:
+        return [_ler_csv_dados(arquivo, colunas) for arquivo in arquivos]
     
-    # Procurar em INMET
-    for arquivo_csv in glob.glob(str(caminho_base / "inmet" / "**" / "*.csv"), recursive=True):
-        nome_arquivo = os.path.basename(arquivo_csv)
-        if nome_arquivo.startswith("atual_"):
-            regiao = nome_arquivo.split("_", 1)[1].rsplit("_", 1)[0]
-            regioes.add(regiao)
+    from concurrent.futures import ThreadPoolExecutor
     
-    return sorted(list(regioes))
+    with ThreadPoolExecutor(max_workers=min(8, len(arquivos))) as executor:
+        return list(executor.map(lambda arquivo: _ler_csv_dados(arquivo, colunas), arquivos))
+
+
+def _ler_arquivos_arrow(arquivos, colunas=None):
+    """
+    Lê vários CSVs diários com o leitor do pyarrow (análise em blocos, em
+    várias threads) e converte o resultado para pandas uma única vez.
+    
+    Os tipos das colunas conhecidas são os mesmos de TIPOS_COLUNAS; colunas
+    ausentes em alguns arquivos ficam nulas nas linhas desses arquivos.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    
+    tipos = {coluna: pa.string() if tipo is str else pa.float64()
+             for coluna, tipo in TIPOS_COLUNAS.items()}
+    necessarias = None if colunas is None else set(colunas) | COLUNAS_DATA
+    
+    tabelas = []
+    for arquivo in arquivos:
+        tabela = pacsv.read_csv(arquivo, convert_options=pacsv.ConvertOptions(column_types=tipos))
+        if necessarias is not None:
+            tabela = tabela.select([c for c in tabela.column_names if c in necessarias])
+        tabelas.append(tabela)
+    
+    try:
+        tabela = pa.concat_tables(tabelas, promote_options="default")
+    except TypeError:
+        # pyarrow < 14 não tem promote_options
+        tabela = pa.concat_tables(tabelas, promote=True)
+    return tabela.to_pandas()
 
 
-def carregar_dados_recentes(regiao, dias=7):
+def _reduzir_numericos(dados):
+    """
+    Converte, no próprio DataFrame, as colunas float64 para float32 e as int64
+    para o menor inteiro que comporte os valores.
+    """
+    import pandas as pd
+    
+    for coluna in dados.columns:
+        tipo = dados[coluna].dtype
+        if tipo == "float64":
+            dados[coluna] = dados[coluna].astype("float32")
+        elif tipo == "int64":
+            dados[coluna] = pd.to_numeric(dados[coluna], downcast="integer")
+    return dados
+
+
+def carregar_dados_recentes(regiao, dias=7, colunas=None, reduzir_memoria=False):
     """
     Carrega os dados recentes de uma região específica.
     
     Args:
         regiao (str): Nome da região
         dias (int): Número de dias para carregar
+        colunas (iterable, optional): Colunas a carregar (as de data/hora são
+            sempre incluídas). Por padrão, todas.
+        reduzir_memoria (bool): Usa float32 e category para reduzir o uso de
+            memória (útil para gráficos; a precisão exibida fica menor)
         
     Returns:
         pd.DataFrame: DataFrame combinado com dados da região
     """
-    caminho_base = Path(__file__).parent.parent / "dados"
-    hoje = datetime.now()
-    
-    # Calcular intervalo de datas
-    intervalo_datas = [(hoje - timedelta(days=i)).strftime("%Y%m%d") for i in range(dias)]
+    import pandas as pd
     
     # Procurar arquivos que correspondem à região e datas
-    todos_dados = []
-    
-    # Primeiro OpenWeather
-    for data_str in intervalo_datas:
-        ano = data_str[:4]
-        mes = data_str[4:6]
-        padrao_arquivo = f"atual_{regiao}_{data_str}.csv"
-        
-        # Caminho para OpenWeather
-        caminho_ow = caminho_base / "openweather" / ano / mes / padrao_arquivo
-        if caminho_ow.exists():
-            df = pd.read_csv(caminho_ow)
-            todos_dados.append(df)
-            continue  # Se tiver dados OpenWeather, não precisa do INMET
-        
-        # Caminho para INMET (backup)
-        caminho_inmet = caminho_base / "inmet" / ano / mes / padrao_arquivo
-        if caminho_inmet.exists():
-            df = pd.read_csv(caminho_inmet)
-            todos_dados.append(df)
+    arquivos = _arquivos_dados_recentes(regiao, dias)
     
-    if not todos_dados:
+    if not arquivos:
         print(f"Nenhum dado encontrado para a região {regiao} nos últimos {dias} dias.")
         return None
     
-    # Combinar todos os DataFrames
-    dados_combinados = pd.concat(todos_dados, ignore_index=True)
+    if _leitura_arrow["habilitada"] and _pyarrow_disponivel():
+        dados_combinados = _ler_arquivos_arrow(arquivos, colunas)
+        if reduzir_memoria:
+            _reduzir_numericos(dados_combinados)
+    else:
+        todos_dados = _ler_arquivos_dados(arquivos, colunas)
+        
+        # Tipos menores já em cada arquivo, para que a concatenação também use menos memória
+        if reduzir_memoria:
+            todos_dados = [_reduzir_numericos(df) for df in todos_dados]
+        
+        # Combinar todos os DataFrames (com um único arquivo, sem a cópia do concat)
+        if len(todos_dados) == 1:
+            dados_combinados = todos_dados[0]
+        else:
+            dados_combinados = pd.concat(todos_dados, ignore_index=True)
+    
+    if reduzir_memoria:
+        for coluna in COLUNAS_CATEGORICAS:
+            if coluna in dados_combinados.columns:
+                dados_combinados[coluna] = dados_combinados[coluna].astype("category")
     
     # Processar datas
-    if 'data' in dados_combinados.columns and 'hora' in dados_combinados.columns:
-        # Dados OpenWeather
-        dados_combinados['datetime'] = pd.to_datetime(dados_combinados['data'] + ' ' + dados_combinados['hora'])
-    elif 'DATETIME' in dados_combinados.columns:
-        # Dados INMET
-        dados_combinados['datetime'] = pd.to_datetime(dados_combinados['DATETIME'])
-    else:
+    if not _processar_datas(dados_combinados):
         print("Formato de data não reconhecido nos dados.")
         return dados_combinados
     
-    # Ordenar por data
-    return dados_combinados.sort_values('datetime')
+    # Ordenar por data, sem cópia; a ordenação estável aproveita os trechos já
+    # ordenados de cada arquivo diário
+    dados_combinados.sort_values('datetime', inplace=True, kind="mergesort")
+    return dados_combinados
+
+
+def carregar_dados_recentes_iter(regiao, dias=7, chunksize=100_000):
+    """
+    Versão em blocos de carregar_dados_recentes, para exportações grandes.
+    
+    Os arquivos diários são lidos do mais antigo para o mais recente e
+    agrupados em DataFrames de aproximadamente `chunksize` linhas, de modo
+    que apenas um bloco fique em memória por vez.
+    
+    Todos os blocos têm as mesmas colunas: a união dos cabeçalhos de todos os
+    arquivos do período, lida antes do primeiro bloco. Assim, dias do INMET e
+    do OpenWeather podem ser gravados em sequência no mesmo arquivo sem perder
+    colunas; as ausentes em um bloco ficam vazias.
+    
+    Args:
+        regiao (str): Nome da região
+        dias (int): Número de dias para carregar
+        chunksize (int): Número aproximado de linhas por bloco
+        
+    Yields:
+        pd.DataFrame: Bloco de dados ordenado por data
+    """
+    arquivos = _arquivos_dados_recentes(regiao, dias)[::-1]
+    colunas = _colunas_arquivos(arquivos)
+    
+    bloco = []
+    linhas = 0
+    
+    for arquivo in arquivos:
+        df = _ler_csv_dados(arquivo)
+        bloco.append(df)
+        linhas += len(df)
+        
+        if linhas >= chunksize:
+            yield _finalizar_bloco(bloco, colunas)
+            bloco = []
+            linhas = 0
+    
+    if bloco:
+        yield _finalizar_bloco(bloco, colunas)
+
+
+def _colunas_arquivos(arquivos):
+    """
+    Retorna a união das colunas dos CSVs, na ordem em que aparecem, lendo
+    apenas a linha de cabeçalho de cada arquivo. Inclui a coluna 'datetime'
+    criada por _processar_datas quando houver colunas de data.
+    """
+    import csv
+    
+    colunas = {}
+    for arquivo in arquivos:
+        with open(arquivo, newline="", encoding="utf-8") as f:
+            colunas.update(dict.fromkeys(next(csv.reader(f), [])))
+    if "datetime" not in colunas and not COLUNAS_DATA.isdisjoint(colunas):
+        colunas["datetime"] = None
+    return list(colunas)
+
+
+def _finalizar_bloco(bloco, colunas=None):
+    """
+    Combina os DataFrames de um bloco e ordena por data quando possível. Se
+    `colunas` for informado, o bloco sai exatamente com essas colunas.
+    """
+    import pandas as pd
+    
+    dados = bloco[0] if len(bloco) == 1 else pd.concat(bloco, ignore_index=True)
+    if _processar_datas(dados):
+        dados.sort_values('datetime', inplace=True, kind="mergesort")
+    if colunas is not None and list(dados.columns) != colunas:
+        dados = dados.reindex(columns=colunas)
+    return dados
+
+
+def _preparar_figura(figura=None):
+    """Torna `figura` a figura atual, limpando-a, ou cria uma nova se não for informada"""
+    import matplotlib.pyplot as plt
+    
+    if figura is None:
+        return plt.figure(figsize=(12, 6))
+    figura.clear()
+    plt.figure(figura.number)
+    return figura
+
+
+def _finalizar_grafico(regiao, tipo, caminho_salvar=None):
+    """
+    Salva o gráfico atual em `caminho_salvar` ou, se não informado, na pasta
+    Downloads do usuário (com timestamp no nome) e o exibe.
+    """
+    import matplotlib.pyplot as plt
+    
+    if caminho_salvar:
+        plt.savefig(caminho_salvar)
+        print(f"Gráfico salvo em: {caminho_salvar}")
+        return
+
+    diretorio = os.path.join(os.path.expanduser("~"), "Downloads")
+    if not os.path.exists(diretorio):
+        print("Pasta Downloads não encontrada. Mostrando gráfico sem salvar.")
+    else:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        caminho_arquivo = os.path.join(diretorio, f'{tipo}_{regiao}_{timestamp}.png')
+        plt.savefig(caminho_arquivo)
+        print(f"Gráfico salvo em: {caminho_arquivo}")
+    plt.tight_layout()
+    plt.show()
+
+
+def _eixo_grafico(figura=None, ax=None):
+    """Retorna o eixo onde desenhar: `ax`, se informado, ou o de uma figura avulsa"""
+    if ax is not None:
+        return ax
+    return _preparar_figura(figura).add_subplot()
 
 
-def plotar_temperatura(dados, regiao, caminho_salvar=None):
+def plotar_temperatura(dados, regiao, caminho_salvar=None, figura=None, ax=None):
     """
     Plota gráfico de temperatura para uma região.
     
@@ -104,9 +543,10 @@ def plotar_temperatura(dados, regiao, caminho_salvar=None):
         dados (pd.DataFrame): DataFrame com os dados
         regiao (str): Nome da região
         caminho_salvar (str, optional): Caminho para salvar o gráfico
+        figura (Figure, optional): Figura a ser reaproveitada (limpa antes do uso)
+        ax (Axes, optional): Eixo de uma figura maior; o gráfico é apenas
+            desenhado nele, sem salvar nem exibir
     """
-    plt.figure(figsize=(12, 6))
-    
     if 'temperatura' in dados.columns:
         # OpenWeather
         coluna_temp = 'temperatura'
@@ -117,43 +557,27 @@ def plotar_temperatura(dados, regiao, caminho_salvar=None):
         print("Coluna de temperatura não encontrada nos dados.")
         return
     
-    plt.plot(dados['datetime'], dados[coluna_temp], 'r-', label='Temperatura')
+    eixo = _eixo_grafico(figura, ax)
+    eixo.plot(dados['datetime'], dados[coluna_temp], 'r-', label='Temperatura')
     
     # Adicionar min/max se disponível
     if 'temp_min' in dados.columns and 'temp_max' in dados.columns:
-        plt.plot(dados['datetime'], dados['temp_min'], 'b--', alpha=0.5, label='Mínima')
-        plt.plot(dados['datetime'], dados['temp_max'], 'r--', alpha=0.5, label='Máxima')
-    
-    plt.title(f'Temperatura em {regiao.replace("_", " ")}')
-    plt.xlabel('Data')
-    plt.ylabel('Temperatura (°C)')
-    plt.grid(True, alpha=0.3)
-    plt.legend()
-    
-    # Formatar eixo x para melhor visualização de datas
-    plt.gcf().autofmt_xdate()
-    
-    if caminho_salvar:
-        plt.savefig(caminho_salvar)
-        print(f"Gráfico salvo em: {caminho_salvar}")
-    else:
-        # Salvar no diretório Downloads do usuário se não for especificado
-        diretorio = os.path.join(os.path.expanduser("~"), "Downloads")
-        if not os.path.exists(diretorio):
-            print("Pasta Downloads não encontrada. Mostrando gráfico sem salvar.")
-            plt.tight_layout()
-            plt.show()
-        else:
-            # Criar nome de arquivo com timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            caminho_arquivo = os.path.join(diretorio, f'temperatura_{regiao}_{timestamp}.png')
-            plt.savefig(caminho_arquivo)
-            print(f"Gráfico salvo em: {caminho_arquivo}")
-            plt.tight_layout()
-            plt.show()
+        eixo.plot(dados['datetime'], dados['temp_min'], 'b--', alpha=0.5, label='Mínima')
+        eixo.plot(dados['datetime'], dados['temp_max'], 'r--', alpha=0.5, label='Máxima')
+    
+    eixo.set_title(f'Temperatura em {regiao.replace("_", " ")}')
+    eixo.set_xlabel('Data')
+    eixo.set_ylabel('Temperatura (°C)')
+    eixo.grid(True, alpha=0.3)
+    eixo.legend()
+    
+    if ax is None:
+        # Formatar eixo x para melhor visualização de datas
+        eixo.figure.autofmt_xdate()
+        _finalizar_grafico(regiao, 'temperatura', caminho_salvar)
 
 
-def plotar_umidade(dados, regiao, caminho_salvar=None):
+def plotar_umidade(dados, regiao, caminho_salvar=None, figura=None, ax=None):
     """
     Plota gráfico de umidade para uma região.
     
@@ -161,9 +585,10 @@ def plotar_umidade(dados, regiao, caminho_salvar=None):
         dados (pd.DataFrame): DataFrame com os dados
         regiao (str): Nome da região
         caminho_salvar (str, optional): Caminho para salvar o gráfico
+        figura (Figure, optional): Figura a ser reaproveitada (limpa antes do uso)
+        ax (Axes, optional): Eixo de uma figura maior; o gráfico é apenas
+            desenhado nele, sem salvar nem exibir
     """
-    plt.figure(figsize=(12, 6))
-    
     if 'umidade' in dados.columns:
         # OpenWeather
         coluna_umidade = 'umidade'
@@ -174,39 +599,23 @@ def plotar_umidade(dados, regiao, caminho_salvar=None):
         print("Coluna de umidade não encontrada nos dados.")
         return
     
-    plt.plot(dados['datetime'], dados[coluna_umidade], 'b-', label='Umidade')
-    
-    plt.title(f'Umidade em {regiao.replace("_", " ")}')
-    plt.xlabel('Data')
-    plt.ylabel('Umidade (%)')
-    plt.ylim(0, 100)
-    plt.grid(True, alpha=0.3)
-    plt.legend()
+    eixo = _eixo_grafico(figura, ax)
+    eixo.plot(dados['datetime'], dados[coluna_umidade], 'b-', label='Umidade')
     
-    # Formatar eixo x para melhor visualização de datas
-    plt.gcf().autofmt_xdate()
+    eixo.set_title(f'Umidade em {regiao.replace("_", " ")}')
+    eixo.set_xlabel('Data')
+    eixo.set_ylabel('Umidade (%)')
+    eixo.set_ylim(0, 100)
+    eixo.grid(True, alpha=0.3)
+    eixo.legend()
     
-    if caminho_salvar:
-        plt.savefig(caminho_salvar)
-        print(f"Gráfico salvo em: {caminho_salvar}")
-    else:
-        # Salvar no diretório Downloads do usuário se não for especificado
-        diretorio = os.path.join(os.path.expanduser("~"), "Downloads")
-        if not os.path.exists(diretorio):
-            print("Pasta Downloads não encontrada. Mostrando gráfico sem salvar.")
-            plt.tight_layout()
-            plt.show()
-        else:
-            # Criar nome de arquivo com timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            caminho_arquivo = os.path.join(diretorio, f'umidade_{regiao}_{timestamp}.png')
-            plt.savefig(caminho_arquivo)
-            print(f"Gráfico salvo em: {caminho_arquivo}")
-            plt.tight_layout()
-            plt.show()
+    if ax is None:
+        # Formatar eixo x para melhor visualização de datas
+        eixo.figure.autofmt_xdate()
+        _finalizar_grafico(regiao, 'umidade', caminho_salvar)
 
 
-def plotar_precipitacao(dados, regiao, caminho_salvar=None):
+def plotar_precipitacao(dados, regiao, caminho_salvar=None, figura=None, ax=None):
     """
     Plota gráfico de precipitação para uma região.
     
@@ -214,9 +623,10 @@ def plotar_precipitacao(dados, regiao, caminho_salvar=None):
         dados (pd.DataFrame): DataFrame com os dados
         regiao (str): Nome da região
         caminho_salvar (str, optional): Caminho para salvar o gráfico
+        figura (Figure, optional): Figura a ser reaproveitada (limpa antes do uso)
+        ax (Axes, optional): Eixo de uma figura maior; o gráfico é apenas
+            desenhado nele, sem salvar nem exibir
     """
-    plt.figure(figsize=(12, 6))
-    
     coluna_chuva = None
     
     # Verificar qual coluna usar para precipitação
@@ -231,34 +641,71 @@ def plotar_precipitacao(dados, regiao, caminho_salvar=None):
         print("Coluna de precipitação não encontrada nos dados.")
         return
     
-    plt.bar(dados['datetime'], dados[coluna_chuva], width=0.02, color='blue', alpha=0.7)
+    import numpy as np
+    from matplotlib.dates import date2num
     
-    plt.title(f'Precipitação em {regiao.replace("_", " ")}')
-    plt.xlabel('Data')
-    plt.ylabel('Precipitação (mm)')
-    plt.grid(True, alpha=0.3)
+    # Datas convertidas uma única vez para o formato numérico do matplotlib (dias)
+    x = date2num(dados['datetime'].to_numpy())
     
-    # Formatar eixo x para melhor visualização de datas
-    plt.gcf().autofmt_xdate()
+    # Largura das barras conforme o intervalo típico entre as medições
+    # (1 hora se não for possível calcular)
+    intervalos = np.diff(x)
+    intervalos = intervalos[intervalos > 0]
+    largura = float(np.median(intervalos)) * 0.8 if len(intervalos) else 1 / 24
     
-    if caminho_salvar:
-        plt.savefig(caminho_salvar)
-        print(f"Gráfico salvo em: {caminho_salvar}")
-    else:
-        # Salvar no diretório Downloads do usuário se não for especificado
-        diretorio = os.path.join(os.path.expanduser("~"), "Downloads")
-        if not os.path.exists(diretorio):
-            print("Pasta Downloads não encontrada. Mostrando gráfico sem salvar.")
-            plt.tight_layout()
-            plt.show()
-        else:
-            # Criar nome de arquivo com timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            caminho_arquivo = os.path.join(diretorio, f'precipitacao_{regiao}_{timestamp}.png')
-            plt.savefig(caminho_arquivo)
-            print(f"Gráfico salvo em: {caminho_arquivo}")
-            plt.tight_layout()
-            plt.show()
+    eixo = _eixo_grafico(figura, ax)
+    eixo.bar(x, dados[coluna_chuva].to_numpy(), width=largura, align='center', color='blue', alpha=0.7)
+    eixo.xaxis_date()
+    
+    eixo.set_title(f'Precipitação em {regiao.replace("_", " ")}')
+    eixo.set_xlabel('Data')
+    eixo.set_ylabel('Precipitação (mm)')
+    eixo.grid(True, alpha=0.3)
+    
+    if ax is None:
+        # Formatar eixo x para melhor visualização de datas
+        eixo.figure.autofmt_xdate()
+        _finalizar_grafico(regiao, 'precipitacao', caminho_salvar)
+
+
+# Funções de plotagem por tipo de gráfico
+_PLOTADORES = {
+    "temperatura": plotar_temperatura,
+    "umidade": plotar_umidade,
+    "precipitacao": plotar_precipitacao,
+}
+
+
+def exportar_graficos(dados, regiao, caminhos):
+    """
+    Salva vários gráficos de uma região, em sequência, reaproveitando uma
+    única figura para todos eles.
+    
+    Args:
+        dados (pd.DataFrame): DataFrame com os dados
+        regiao (str): Nome da região
+        caminhos (dict): Tipo do gráfico ('temperatura', 'umidade',
+            'precipitacao') -> caminho do arquivo PNG
+        
+    Returns:
+        dict: Tipo do gráfico -> exceção ocorrida, ou None em caso de sucesso
+    """
+    import matplotlib.pyplot as plt
+    
+    resultados = {}
+    
+    figura = plt.figure(figsize=(12, 6))
+    try:
+        for tipo, caminho in caminhos.items():
+            try:
+                _PLOTADORES[tipo](dados, regiao, caminho, figura=figura)
+                resultados[tipo] = None
+            except Exception as e:
+                resultados[tipo] = e
+    finally:
+        plt.close(figura)
+    
+    return resultados
 
 
 if __name__ == "__main__":
@@ -271,9 +718,18 @@ if __name__ == "__main__":
     parser.add_argument('--grafico', choices=['temp', 'umidade', 'chuva', 'todos'], 
                         default='todos', help='Tipo de gráfico a gerar')
     parser.add_argument('--salvar-dir', type=str, help='Diretório para salvar gráficos')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Não usar nem gravar o cache Parquet dos CSVs')
+    parser.add_argument('--fast-io', action='store_true',
+                        help='Ler os CSVs com o leitor multithread do pyarrow (se instalado)')
     
     args = parser.parse_args()
     
+    if args.no_cache:
+        _cache_parquet["habilitado"] = False
+    if args.fast_io:
+        _leitura_arrow["habilitada"] = True
+    
     if args.listar_regioes:
         regioes = listar_regioes_disponiveis()
         if regioes:
@@ -288,8 +744,9 @@ if __name__ == "__main__":
         print("Erro: Especifique uma região com --regiao ou liste regiões disponíveis com --listar-regioes")
         sys.exit(1)
     
-    # Carregar dados
-    dados = carregar_dados_recentes(args.regiao, args.dias)
+    # Carregar dados (apenas as colunas usadas nos gráficos)
+    dados = carregar_dados_recentes(args.regiao, args.dias, colunas=COLUNAS_GRAFICOS,
+                                    reduzir_memoria=True)
     
     if dados is None or len(dados) == 0:
         print(f"Nenhum dado encontrado para a região {args.regiao}.")
@@ -300,28 +757,45 @@ if __name__ == "__main__":
     if args.salvar_dir:
         diretorio_salvar = Path(args.salvar_dir)
         diretorio_salvar.mkdir(exist_ok=True, parents=True)
+        
+        # Os gráficos só são gravados em arquivo: o backend sem interface evita
+        # carregar Qt/Tk e dispensa um display (execuções em servidor/cron)
+        import matplotlib
+        matplotlib.use("Agg")
     
     # Gerar gráficos
-    if args.grafico in ['temp', 'todos']:
+    if args.grafico == 'todos':
+        # Uma única figura com os três gráficos e o eixo de datas compartilhado
+        import matplotlib.pyplot as plt
+        
+        figura, (eixo_temp, eixo_umidade, eixo_chuva) = plt.subplots(3, 1, figsize=(12, 18), sharex=True)
+        plotar_temperatura(dados, args.regiao, ax=eixo_temp)
+        plotar_umidade(dados, args.regiao, ax=eixo_umidade)
+        plotar_precipitacao(dados, args.regiao, ax=eixo_chuva)
+        figura.autofmt_xdate()
+        
+        caminho_graficos = None
+        if diretorio_salvar:
+            caminho_graficos = diretorio_salvar / f"graficos_{args.regiao}.png"
+            figura.tight_layout()
+        _finalizar_grafico(args.regiao, 'graficos', caminho_graficos)
+    
+    if args.grafico == 'temp':
         caminho_temp = None
         if diretorio_salvar:
             caminho_temp = diretorio_salvar / f"temperatura_{args.regiao}.png"
         plotar_temperatura(dados, args.regiao, caminho_temp)
     
-    if args.grafico in ['umidade', 'todos']:
+    if args.grafico == 'umidade':
         caminho_umidade = None
         if diretorio_salvar:
             caminho_umidade = diretorio_salvar / f"umidade_{args.regiao}.png"
         plotar_umidade(dados, args.regiao, caminho_umidade)
     
-    if args.grafico in ['chuva', 'todos']:
+    if args.grafico == 'chuva':
         caminho_chuva = None
         if diretorio_salvar:
             caminho_chuva = diretorio_salvar / f"precipitacao_{args.regiao}.png"
         plotar_precipitacao(dados, args.regiao, caminho_chuva)
     
-    # Se não estiver salvando, mostra os gráficos interativamente
-    if not args.salvar_dir and args.grafico == 'todos':
-        plt.show()
-    
     print(f"\nAnálise de {args.regiao} concluída.")
\ No newline at end of file
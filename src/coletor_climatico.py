@@ -15,21 +15,60 @@ Funcionalidades:
 """
 
 import os
+import csv
 import sys
+import gzip
 import json
+import hashlib
 import time
 import logging
-import requests
-import pandas as pd
+import threading
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
-# Tentar importar biblioteca inmetpy - usada como fonte secundária
+# pandas, requests e inmetpy são importados nas funções que os usam, para
+# que a inicialização (ex.: --help) não pague o custo de importá-los
+import importlib.util
+
+# Biblioteca inmetpy - usada como fonte secundária (importada só ao coletar)
+INMET_DISPONIVEL = importlib.util.find_spec("inmetpy") is not None
+
+# pyarrow permite gravar os dados históricos em Parquet (importado só ao gravar)
+PYARROW_DISPONIVEL = importlib.util.find_spec("pyarrow") is not None
+
+# Tentar importar aiohttp - permite coletar as regiões concorrentemente
 try:
-    from inmetpy import INMET
-    INMET_DISPONIVEL = True
+    import asyncio
+    import aiohttp
+    AIOHTTP_DISPONIVEL = True
 except ImportError:
-    INMET_DISPONIVEL = False
+    AIOHTTP_DISPONIVEL = False
+
+# ijson é opcional: lê as respostas históricas em streaming (importado só ao coletar)
+IJSON_DISPONIVEL = importlib.util.find_spec("ijson") is not None
+
+# orjson é opcional: acelera a interpretação das respostas JSON das APIs
+try:
+    import orjson
+    ORJSON_DISPONIVEL = True
+except ImportError:
+    ORJSON_DISPONIVEL = False
+
+
+def _json_loads(conteudo):
+    """Interpreta JSON a partir de bytes (orjson se disponível)"""
+    if ORJSON_DISPONIVEL:
+        return orjson.loads(conteudo)
+    return json.loads(conteudo)
+
+
+def _json_dumps(obj):
+    """Serializa para JSON compacto em bytes UTF-8 (orjson se disponível)"""
+    if ORJSON_DISPONIVEL:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
 
 # Configuração de Logging
 DIRETORIO_BASE = Path(__file__).parent.parent
@@ -40,8 +79,7 @@ hoje = datetime.now()
 diretorio_log_ano = DIRETORIO_LOGS / str(hoje.year)
 diretorio_log_mes = diretorio_log_ano / f"{hoje.month:02d}"
 
-# Criar diretórios de log se não existirem
-diretorio_log_ano.mkdir(exist_ok=True, parents=True)
+# Criar diretório de log do mês (e os superiores) se não existir
 diretorio_log_mes.mkdir(exist_ok=True, parents=True)
 
 arquivo_log = diretorio_log_mes / f"coletor_{hoje.strftime('%Y%m%d')}.log"
@@ -56,72 +94,84 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Configurações do Sistema
-CHAVE_API_OPENWEATHER = ""  # Será preenchido a partir de credenciais.json
-TOKEN_INMET = ""  # Será preenchido a partir de credenciais.json
-
 # Diretórios de dados
 DIRETORIO_DADOS = DIRETORIO_BASE / "dados"
 DIRETORIO_OPENWEATHER = DIRETORIO_DADOS / "openweather"
 DIRETORIO_INMET = DIRETORIO_DADOS / "inmet"
 DIRETORIO_CONFIG = DIRETORIO_BASE / "config"
+DIRETORIO_CACHE_HISTORICO = DIRETORIO_DADOS / "cache" / "openweather_historico"
+DIRETORIO_CACHE_INDICES = DIRETORIO_DADOS / "cache" / "indices_inmet"
 
-# Garantir que os diretórios existam
-DIRETORIO_OPENWEATHER.mkdir(exist_ok=True, parents=True)
-DIRETORIO_INMET.mkdir(exist_ok=True, parents=True)
-DIRETORIO_LOGS.mkdir(exist_ok=True, parents=True)
+# Garantir que os diretórios existam (DIRETORIO_LOGS já foi criado junto com o log do mês)
+for diretorio in (DIRETORIO_OPENWEATHER, DIRETORIO_INMET):
+    diretorio.mkdir(exist_ok=True, parents=True)
 
-# Carregar credenciais das APIs
-arquivo_credenciais = DIRETORIO_CONFIG / "credenciais.json"
-if arquivo_credenciais.exists():
+@lru_cache(maxsize=1)
+def _carregar_config():
+    """
+    Lê credenciais.json e regioes.json uma única vez por processo.
+    
+    Returns:
+        tuple: (credenciais, regioes) - dict de credenciais (vazio se ausente
+        ou inválido) e lista de regiões agrícolas. Use
+        _carregar_config.cache_clear() para forçar uma nova leitura.
+    """
+    # Carregar credenciais das APIs
+    credenciais = {}
+    arquivo_credenciais = DIRETORIO_CONFIG / "credenciais.json"
+    if arquivo_credenciais.exists():
+        try:
+            credenciais = _json_loads(arquivo_credenciais.read_bytes())
+        except Exception as e:
+            logger.warning(f"Erro ao carregar arquivo de credenciais: {e}")
+            logger.warning("Algumas funcionalidades podem não funcionar corretamente sem credenciais")
+    else:
+        logger.warning(f"Arquivo de credenciais não encontrado: {arquivo_credenciais}")
+        logger.warning("Crie um arquivo 'credenciais.json' no diretório config/ com suas chaves de API")
+    
+    # Carregar regiões agrícolas do arquivo de configuração
     try:
-        with open(arquivo_credenciais, "r", encoding="utf-8") as f:
-            credenciais = json.load(f)
-            CHAVE_API_OPENWEATHER = credenciais.get("openweather", {}).get("api_key", "")
-            TOKEN_INMET = credenciais.get("inmet", {}).get("token", "")
-            
-            if CHAVE_API_OPENWEATHER:
-                logger.info("Chave API OpenWeather carregada com sucesso")
-            else:
-                logger.warning("Chave API OpenWeather não encontrada no arquivo de credenciais")
-                
-            if TOKEN_INMET:
-                logger.info("Token INMET carregado com sucesso")
-            else:
-                logger.warning("Token INMET não encontrado no arquivo de credenciais")
+        config_regioes = _json_loads((DIRETORIO_CONFIG / "regioes.json").read_bytes())
+        regioes = config_regioes.get("regioes_agricolas", [])
+        logger.info(f"Carregadas {len(regioes)} regiões do arquivo de configuração")
     except Exception as e:
-        logger.warning(f"Erro ao carregar arquivo de credenciais: {e}")
-        logger.warning("Algumas funcionalidades podem não funcionar corretamente sem credenciais")
-else:
-    logger.warning(f"Arquivo de credenciais não encontrado: {arquivo_credenciais}")
-    logger.warning("Crie um arquivo 'credenciais.json' no diretório config/ com suas chaves de API")
+        logger.error(f"Erro ao carregar arquivo de regiões: {e}")
+        # Configuração padrão caso o arquivo não exista ou tenha erro
+        logger.warning("Usando configuração padrão de regiões")
+        regioes = [
+            {
+                "nome": "Ribeirao_Preto_SP",
+                "descricao": "Região de Ribeirão Preto - SP (Cana-de-açúcar)",
+                "latitude": -21.17,
+                "longitude": -47.81,
+                "estacao_inmet": "A711" 
+            },
+            {
+                "nome": "Brasilia_DF",
+                "descricao": "Região de Brasília - DF (Soja e Milho)",
+                "latitude": -15.78,
+                "longitude": -47.93,
+                "estacao_inmet": "A001"
+            }
+        ]
+    
+    return credenciais, regioes
 
-# Carregar regiões agrícolas do arquivo de configuração
-try:
-    with open(DIRETORIO_CONFIG / "regioes.json", "r", encoding="utf-8") as arquivo_regioes:
-        config_regioes = json.load(arquivo_regioes)
-        REGIOES_AGRICOLAS = config_regioes.get("regioes_agricolas", [])
-        logger.info(f"Carregadas {len(REGIOES_AGRICOLAS)} regiões do arquivo de configuração")
-except Exception as e:
-    logger.error(f"Erro ao carregar arquivo de regiões: {e}")
-    # Configuração padrão caso o arquivo não exista ou tenha erro
-    logger.warning("Usando configuração padrão de regiões")
-    REGIOES_AGRICOLAS = [
-        {
-            "nome": "Ribeirao_Preto_SP",
-            "descricao": "Região de Ribeirão Preto - SP (Cana-de-açúcar)",
-            "latitude": -21.17,
-            "longitude": -47.81,
-            "estacao_inmet": "A711" 
-        },
-        {
-            "nome": "Brasilia_DF",
-            "descricao": "Região de Brasília - DF (Soja e Milho)",
-            "latitude": -15.78,
-            "longitude": -47.93,
-            "estacao_inmet": "A001"
-        }
-    ]
+
+_credenciais, REGIOES_AGRICOLAS = _carregar_config()
+CHAVE_API_OPENWEATHER = _credenciais.get("openweather", {}).get("api_key", "")
+TOKEN_INMET = _credenciais.get("inmet", {}).get("token", "")
+
+if _credenciais:
+    if CHAVE_API_OPENWEATHER:
+        logger.info("Chave API OpenWeather carregada com sucesso")
+    else:
+        logger.warning("Chave API OpenWeather não encontrada no arquivo de credenciais")
+        
+    if TOKEN_INMET:
+        logger.info("Token INMET carregado com sucesso")
+    else:
+        logger.warning("Token INMET não encontrado no arquivo de credenciais")
 
 # Constantes de Configuração
 MAX_TENTATIVAS = 3        # Número máximo de tentativas para requisições de API
@@ -129,6 +179,305 @@ ATRASO_TENTATIVA = 5      # Segundos entre tentativas
 ANOS_HISTORICO = 15       # Anos de dados históricos a coletar
 DIAS_DADOS_RECENTES = 7   # Dias de dados recentes a buscar
 PERIODO_PESQUISA_INMET = 5 # Anos máximos para busca de dados horários INMET
+MAX_REGIOES_SIMULTANEAS = 8  # Regiões coletadas ao mesmo tempo no modo assíncrono
+MAX_PERIODOS_SIMULTANEOS = 5 # Períodos históricos requisitados ao mesmo tempo por região
+MAX_MESES_INMET_SIMULTANEOS = 8  # Meses de dados horários INMET requisitados ao mesmo tempo
+
+# Endpoints do OpenWeather (os parâmetros vão em params=)
+URL_OPENWEATHER_ATUAL = "https://api.openweathermap.org/data/2.5/weather"
+URL_OPENWEATHER_HISTORICO = "https://api.openweathermap.org/data/3.0/onecall/timemachine"  # One Call 3.0 timemachine
+
+
+# Locks por arquivo de dados, para as regiões coletadas em threads
+_travas_arquivos = {}
+_trava_travas = threading.Lock()
+
+# Faixas plausíveis (coluna, mínimo, máximo, descrição) verificadas por fonte.
+# As colunas do INMET dependem do que é retornado pela API
+_FAIXAS_CONSISTENCIA = {
+    'openweather': (
+        ('temperatura', -40, 55, "Temperaturas"),
+        ('umidade', 0, 100, "Umidade"),
+    ),
+    'inmet': (
+        ('TEM_INS', -40, 55, "Temperaturas"),
+        ('UMD_INS', 0, 100, "Umidade"),
+    ),
+}
+
+
+def _registro_openweather_atual(dados, regiao, agora=None):
+    """
+    Converte a resposta da API de clima atual do OpenWeather em um registro
+    (dict), carimbado com o instante 'agora' (padrão: o momento da chamada).
+    """
+    agora = agora or datetime.now()
+    principal = dados['main']
+    # Blocos opcionais da resposta: ausentes viram {} e os campos, None
+    vento = dados.get('wind') or {}
+    nuvens = dados.get('clouds') or {}
+    clima = (dados.get('weather') or [{}])[0]
+    chuva = dados.get('rain') or {}
+    return {
+        'data': agora.strftime("%Y-%m-%d"),
+        'hora': agora.strftime("%H:%M:%S"),
+        'temperatura': principal['temp'],
+        'sensacao_termica': principal['feels_like'],
+        'temp_min': principal['temp_min'],
+        'temp_max': principal['temp_max'],
+        'pressao': principal['pressure'],
+        'umidade': principal['humidity'],
+        'velocidade_vento': vento.get('speed'),
+        'direcao_vento': vento.get('deg'),
+        'nuvens': nuvens.get('all'),
+        'clima_principal': clima.get('main'),
+        'clima_descricao': clima.get('description'),
+        'chuva_1h': chuva.get('1h', 0),
+        'fonte': 'openweather',
+        'regiao': regiao['nome'],
+        'latitude': regiao['latitude'],
+        'longitude': regiao['longitude']
+    }
+
+
+# Campos de cada ponto da API histórica do OpenWeather -> colunas salvas
+_COLUNAS_HISTORICO_OPENWEATHER = {
+    'temp': 'temperatura',
+    'feels_like': 'sensacao_termica',
+    'pressure': 'pressao',
+    'humidity': 'umidade',
+    'dew_point': 'ponto_orvalho',
+    'uvi': 'indice_uv',
+    'clouds': 'nuvens',
+    'visibility': 'visibilidade',
+    'wind_speed': 'velocidade_vento',
+    'wind_deg': 'direcao_vento',
+    'wind_gust': 'rajada_vento',
+}
+
+# Campos do primeiro item de 'weather' -> colunas salvas
+_COLUNAS_CLIMA_OPENWEATHER = {
+    'id': 'clima_id',
+    'main': 'clima_principal',
+    'description': 'clima_descricao',
+    'icon': 'clima_icone',
+}
+
+
+def _dataframe_openweather_historico(pontos, regiao):
+    """
+    Monta o DataFrame histórico a partir da lista de pontos brutos da API do
+    OpenWeather, com operações vetorizadas em vez de um dict por ponto.
+    """
+    import pandas as pd
+    from dateutil.tz import tzlocal
+    
+    # Campos aninhados viram colunas 'rain.1h' e 'snow.1h'
+    brutos = pd.json_normalize(pontos)
+    dados = pd.DataFrame(index=brutos.index)
+    
+    # Converter timestamp em data e hora (horário local, como datetime.fromtimestamp)
+    if 'dt' in brutos.columns:
+        timestamps = brutos['dt'].fillna(0).astype('int64')
+    else:
+        timestamps = pd.Series(0, index=brutos.index, dtype='int64')
+    momentos = pd.to_datetime(timestamps, unit='s', utc=True).dt.tz_convert(tzlocal())
+    dados['data'] = momentos.dt.strftime("%Y-%m-%d")
+    dados['hora'] = momentos.dt.strftime("%H:%M:%S")
+    
+    for campo, coluna in _COLUNAS_HISTORICO_OPENWEATHER.items():
+        dados[coluna] = brutos[campo] if campo in brutos.columns else None
+    
+    dados['fonte'] = 'openweather'
+    dados['regiao'] = regiao['nome']
+    dados['latitude'] = regiao['latitude']
+    dados['longitude'] = regiao['longitude']
+    dados['timestamp'] = timestamps
+    
+    # Adicionar informações de clima se disponíveis (primeiro item de 'weather')
+    if 'weather' in brutos.columns:
+        clima = pd.json_normalize([w[0] if isinstance(w, list) and w else {} for w in brutos['weather']])
+        for campo, coluna in _COLUNAS_CLIMA_OPENWEATHER.items():
+            if campo in clima.columns:
+                dados[coluna] = clima[campo].to_numpy()
+    
+    # Adicionar informações de chuva e neve se disponíveis
+    if 'rain.1h' in brutos.columns:
+        dados['chuva_1h'] = brutos['rain.1h']
+    if 'snow.1h' in brutos.columns:
+        dados['neve_1h'] = brutos['snow.1h']
+    
+    return dados
+
+
+def _parametros_openweather(regiao):
+    """
+    Parâmetros de consulta comuns às APIs do OpenWeather para a região. São
+    montados uma vez por região; a API histórica acrescenta apenas 'dt'.
+    """
+    return {
+        'lat': regiao['latitude'],
+        'lon': regiao['longitude'],
+        'appid': CHAVE_API_OPENWEATHER,
+        'units': 'metric',
+        'lang': 'pt_br',
+    }
+
+
+def _periodos_historico():
+    """
+    Gera os períodos anuais (inicio, fim, encerrado) dos últimos ANOS_HISTORICO
+    anos. `encerrado` é False apenas para o período que termina agora.
+    
+    Os limites são alinhados à hora cheia, para que execuções diferentes
+    requisitem os mesmos timestamps e o cache de respostas seja reaproveitado.
+    """
+    data_fim = datetime.now().replace(minute=0, second=0, microsecond=0)
+    data_atual = data_fim.replace(year=data_fim.year - ANOS_HISTORICO)
+    while data_atual < data_fim:
+        # Próximo período: 1 ano ou até a data fim, o que for menor
+        proximo_periodo = min(data_atual.replace(year=data_atual.year + 1), data_fim)
+        yield data_atual, proximo_periodo, proximo_periodo < data_fim
+        data_atual = proximo_periodo
+
+
+def _caminho_cache_historico(regiao, timestamp):
+    """Arquivo do cache da resposta histórica do OpenWeather para (lat, lon, timestamp)"""
+    chave = f"{regiao['latitude']},{regiao['longitude']},{timestamp}".encode()
+    return DIRETORIO_CACHE_HISTORICO / f"{hashlib.blake2b(chave, digest_size=16).hexdigest()}.json.gz"
+
+
+def _ler_cache_historico(regiao, timestamp):
+    """Retorna os pontos em cache para o período, ou None se não houver"""
+    try:
+        return _json_loads(gzip.decompress(_caminho_cache_historico(regiao, timestamp).read_bytes()))
+    except (OSError, ValueError):
+        return None
+
+
+def _gravar_cache_historico(regiao, timestamp, pontos):
+    """Grava no cache os pontos de um período já encerrado (não mudam mais)"""
+    caminho = _caminho_cache_historico(regiao, timestamp)
+    temporario = caminho.with_name(caminho.name + ".tmp")
+    try:
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        temporario.write_bytes(gzip.compress(_json_dumps(pontos)))
+        os.replace(temporario, caminho)
+    except OSError as e:
+        logger.warning(f"Não foi possível gravar o cache histórico {caminho}: {e}")
+
+
+def _trava_arquivo(caminho_arquivo):
+    """Lock exclusivo de um arquivo de dados (criado no primeiro uso)"""
+    with _trava_travas:
+        return _travas_arquivos.setdefault(Path(caminho_arquivo), threading.Lock())
+
+
+def _instantes_inmet(serie):
+    """DatetimeIndex (UTC, sem fuso) a partir da coluna DATETIME do INMET"""
+    import pandas as pd
+    
+    return pd.DatetimeIndex(pd.to_datetime(serie, utc=True)).tz_convert(None)
+
+
+def _caminho_indice_vistos(caminho_arquivo):
+    """Arquivo auxiliar com os instantes já gravados no CSV (nome derivado do caminho absoluto)"""
+    chave = os.path.abspath(caminho_arquivo).encode("utf-8")
+    return DIRETORIO_CACHE_INDICES / f"{hashlib.blake2b(chave, digest_size=16).hexdigest()}.npz"
+
+
+def _identidade_arquivo(caminho_arquivo):
+    """mtime em nanossegundos e tamanho do arquivo, para validar o índice auxiliar"""
+    estado = os.stat(caminho_arquivo)
+    return [estado.st_mtime_ns, estado.st_size]
+
+
+def _ler_indice_vistos(caminho_arquivo):
+    """
+    Retorna o índice de instantes já gravados, ou None se o arquivo auxiliar
+    não existir ou tiver sido gerado para outra versão do CSV (mtime em
+    nanossegundos ou tamanho diferentes, ex.: CSV alterado ou restaurado por fora).
+    """
+    import numpy as np
+    import pandas as pd
+    
+    try:
+        with np.load(_caminho_indice_vistos(caminho_arquivo)) as indice:
+            if indice["origem"].tolist() != _identidade_arquivo(caminho_arquivo):
+                return None
+            return pd.DatetimeIndex(indice["instantes"])
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _gravar_indice_vistos(caminho_arquivo, indice):
+    """
+    Grava o índice de instantes já gravados (datetime64 ordenado), junto com
+    o mtime e o tamanho atuais do CSV. Deve ser chamado logo após gravar o
+    CSV, com a trava do arquivo ainda adquirida.
+    """
+    import numpy as np
+    
+    caminho_indice = _caminho_indice_vistos(caminho_arquivo)
+    temporario = caminho_indice.with_name(caminho_indice.name + ".tmp")
+    try:
+        caminho_indice.parent.mkdir(parents=True, exist_ok=True)
+        with open(temporario, "wb") as arquivo:
+            np.savez(arquivo,
+                     instantes=indice.to_numpy(dtype="datetime64[ns]"),
+                     origem=np.array(_identidade_arquivo(caminho_arquivo), dtype=np.int64))
+        os.replace(temporario, caminho_indice)
+    except OSError as e:
+        logger.warning(f"Não foi possível gravar o índice {caminho_indice}: {e}")
+
+
+def _indice_data_hora(dados):
+    """DatetimeIndex a partir das colunas 'data' e 'hora' do OpenWeather"""
+    import pandas as pd
+    
+    # Data e hora são convertidas separadamente (sem concatenar strings); as
+    # datas se repetem muito, daí o cache de conversão
+    dias = pd.to_datetime(dados['data'].astype(str), format="%Y-%m-%d", cache=True)
+    horas = pd.to_timedelta(dados['hora'].astype(str))
+    return pd.DatetimeIndex(dias + horas)
+
+
+def _ultima_linha_csv(caminho_arquivo, tamanho_bloco=4096):
+    """
+    Lê apenas o final do arquivo e retorna os campos da última linha do CSV
+    (ou None se o arquivo estiver vazio).
+    """
+    with open(caminho_arquivo, "rb") as arquivo:
+        arquivo.seek(0, os.SEEK_END)
+        arquivo.seek(max(0, arquivo.tell() - tamanho_bloco))
+        linhas = arquivo.read().decode("utf-8", errors="replace").splitlines()
+    
+    linhas = [linha for linha in linhas if linha.strip()]
+    if not linhas:
+        return None
+    return next(csv.reader([linhas[-1]]), None)
+
+
+def _politica_retry():
+    """
+    Política de retry das requisições síncronas: backoff exponencial com jitter
+    em falhas de conexão e nos status 429/5xx, respeitando o Retry-After.
+    """
+    from urllib3.util.retry import Retry
+    
+    opcoes = dict(
+        total=MAX_TENTATIVAS - 1,  # MAX_TENTATIVAS conta a requisição original
+        backoff_factor=ATRASO_TENTATIVA,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,  # O status final chega ao raise_for_status
+    )
+    try:
+        return Retry(backoff_jitter=1.0, **opcoes)
+    except TypeError:
+        # urllib3 < 2.0 não suporta jitter
+        return Retry(**opcoes)
 
 
 class ColetorDadosClimaticos:
@@ -138,17 +487,41 @@ class ColetorDadosClimaticos:
     
     def __init__(self):
         """Inicializa o coletor de dados climáticos."""
+        import requests
+        from requests.adapters import HTTPAdapter
+        
         logger.info("Inicializando o sistema de coleta de dados climáticos")
         # Verificar credenciais
         if not CHAVE_API_OPENWEATHER:
             logger.warning("ATENÇÃO: API Key do OpenWeather não configurada")
         if not TOKEN_INMET and INMET_DISPONIVEL:
             logger.warning("ATENÇÃO: Token do INMET não configurado")
+        
+        # Sessão HTTP compartilhada: reaproveita conexões TCP/TLS (keep-alive)
+        # entre os períodos históricos e entre as regiões
+        self.sessao = requests.Session()
+        adaptador = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=_politica_retry())
+        self.sessao.mount("https://", adaptador)
+        self.sessao.mount("http://", adaptador)
+        
+        # Diretórios de destino já garantidos nesta instância (evita mkdir a cada gravação)
+        self._diretorios_criados = set()
+    
+    def _garantir_diretorio(self, diretorio):
+        """Cria o diretório (e os pais) apenas na primeira vez em que é usado"""
+        # mkdir com exist_ok é idempotente e set.add é atômico: seguro entre threads
+        if diretorio not in self._diretorios_criados:
+            diretorio.mkdir(parents=True, exist_ok=True)
+            self._diretorios_criados.add(diretorio)
     
     def coletar_para_todas_regioes(self, modo="atual", regioes_especificas=None):
         """
         Coleta dados para todas as regiões configuradas ou apenas para as regiões especificadas.
         
+        Com o aiohttp instalado, as requisições ao OpenWeather das várias regiões
+        são feitas concorrentemente; caso contrário, as regiões são processadas
+        em paralelo por um pool de threads.
+        
         Args:
             modo (str): "atual" para dados dos últimos 7 dias, "historico" para dados históricos
             regioes_especificas (list): Lista opcional de nomes de regiões específicas para coletar
@@ -165,112 +538,186 @@ class ColetorDadosClimaticos:
                 logger.warning(f"Nenhuma das regiões especificadas foi encontrada na configuração. Verifique os nomes.")
                 return
         
-        for regiao in regioes_a_processar:
-            logger.info(f"Processando região: {regiao['nome']}")
-            
-            sucesso = False
-            
-            # Tentativa com OpenWeather (API Principal)
-            try:
-                logger.info(f"Tentando coleta com OpenWeather para {regiao['nome']}")
-                if modo == "atual":
-                    dados = self.coletar_openweather_atual(regiao)
-                else:
-                    dados = self.coletar_openweather_historico(regiao)
-                    
-                if dados is not None and not dados.empty:
-                    self.salvar_dados(dados, regiao['nome'], "openweather", modo)
-                    sucesso = True
-                    logger.info(f"Coleta com OpenWeather bem-sucedida para {regiao['nome']}")
-                else:
-                    logger.warning(f"OpenWeather retornou dados vazios para {regiao['nome']}")
-            
-            except Exception as e:
-                logger.error(f"Erro na coleta com OpenWeather para {regiao['nome']}: {str(e)}")
+        # Mesmo instante para todas as regiões desta execução
+        agora = datetime.now()
+        
+        if AIOHTTP_DISPONIVEL:
+            asyncio.run(self._coletar_regioes_async(regioes_a_processar, modo, agora))
+            return
+        
+        # Sem aiohttp, as regiões são processadas em threads: o I/O de rede libera o GIL
+        with ThreadPoolExecutor(max_workers=min(MAX_REGIOES_SIMULTANEAS, len(regioes_a_processar))) as executor:
+            list(executor.map(lambda regiao: self._coletar_uma_regiao(regiao, modo, agora), regioes_a_processar))
+    
+    def _coletar_uma_regiao(self, regiao, modo, agora=None):
+        """
+        Coleta e salva os dados de uma região, usando o INMET como fallback
+        quando o OpenWeather falha.
+        """
+        logger.info(f"Processando região: {regiao['nome']}")
+        
+        # Tentativa com OpenWeather (API Principal)
+        try:
+            logger.info(f"Tentando coleta com OpenWeather para {regiao['nome']}")
+            if modo == "atual":
+                dados = self.coletar_openweather_atual(regiao, agora)
+            else:
+                dados = self.coletar_openweather_historico(regiao)
+        except Exception as e:
+            logger.error(f"Erro na coleta com OpenWeather para {regiao['nome']}: {str(e)}")
+            dados = None
+        
+        if not self._salvar_openweather(dados, regiao, modo):
+            self._coletar_inmet_fallback(regiao, modo)
+    
+    async def _coletar_regioes_async(self, regioes, modo, agora=None):
+        """Coleta as regiões concorrentemente, compartilhando uma sessão HTTP"""
+        limite = asyncio.Semaphore(MAX_REGIOES_SIMULTANEAS)
+        
+        async with aiohttp.ClientSession() as sessao:
+            async def processar(regiao):
+                async with limite:
+                    await self._processar_regiao_async(sessao, regiao, modo, agora)
             
-            # Se falhou com OpenWeather, tenta com INMET (API Backup)
-            if not sucesso:
-                logger.info(f"Ativando sistema de fallback para {regiao['nome']}")
-                try:
-                    logger.info(f"Tentando coleta com INMET para {regiao['nome']}")
-                    if modo == "atual":
-                        dados = self.coletar_inmet_atual(regiao)
-                    else:
-                        dados = self.coletar_inmet_historico(regiao)
-                        
-                    if dados is not None and not dados.empty:
-                        self.salvar_dados(dados, regiao['nome'], "inmet", modo)
-                        sucesso = True
-                        logger.info(f"Coleta com INMET bem-sucedida para {regiao['nome']}")
-                    else:
-                        logger.warning(f"INMET retornou dados vazios para {regiao['nome']}")
+            await asyncio.gather(*(processar(regiao) for regiao in regioes))
+    
+    async def _processar_regiao_async(self, sessao, regiao, modo, agora=None):
+        """Coleta uma região com OpenWeather (assíncrono) e, se falhar, com INMET"""
+        logger.info(f"Processando região: {regiao['nome']}")
+        
+        # Tentativa com OpenWeather (API Principal)
+        try:
+            logger.info(f"Tentando coleta com OpenWeather para {regiao['nome']}")
+            if modo == "atual":
+                dados = await self.coletar_openweather_atual_async(sessao, regiao, agora)
+            else:
+                dados = await self.coletar_openweather_historico_async(sessao, regiao)
+        except Exception as e:
+            logger.error(f"Erro na coleta com OpenWeather para {regiao['nome']}: {str(e)}")
+            dados = None
+        
+        # A gravação (leitura/reescrita do CSV, Parquet histórico) e o inmetpy são
+        # síncronos: executados em uma thread para não bloquear as demais regiões
+        if not await asyncio.to_thread(self._salvar_openweather, dados, regiao, modo):
+            await asyncio.to_thread(self._coletar_inmet_fallback, regiao, modo)
+    
+    def _salvar_openweather(self, dados, regiao, modo):
+        """Salva os dados do OpenWeather; retorna False se não houver dados válidos"""
+        try:
+            if dados is not None and not dados.empty:
+                self.salvar_dados(dados, regiao['nome'], "openweather", modo)
+                logger.info(f"Coleta com OpenWeather bem-sucedida para {regiao['nome']}")
+                return True
+            logger.warning(f"OpenWeather retornou dados vazios para {regiao['nome']}")
+        except Exception as e:
+            logger.error(f"Erro na coleta com OpenWeather para {regiao['nome']}: {str(e)}")
+        return False
+    
+    def _coletar_inmet_fallback(self, regiao, modo):
+        """Coleta uma região com o INMET (API Backup) após falha do OpenWeather"""
+        logger.info(f"Ativando sistema de fallback para {regiao['nome']}")
+        try:
+            logger.info(f"Tentando coleta com INMET para {regiao['nome']}")
+            if modo == "atual":
+                dados = self.coletar_inmet_atual(regiao)
+            else:
+                dados = self.coletar_inmet_historico(regiao)
                 
-                except Exception as e:
-                    logger.error(f"Erro na coleta com INMET para {regiao['nome']}: {str(e)}")
-            
-            if not sucesso:
-                logger.error(f"FALHA COMPLETA: Não foi possível obter dados para {regiao['nome']} usando nenhuma API")
+            if dados is not None and not dados.empty:
+                self.salvar_dados(dados, regiao['nome'], "inmet", modo)
+                logger.info(f"Coleta com INMET bem-sucedida para {regiao['nome']}")
+                return
+            logger.warning(f"INMET retornou dados vazios para {regiao['nome']}")
+        
+        except Exception as e:
+            logger.error(f"Erro na coleta com INMET para {regiao['nome']}: {str(e)}")
+        
+        logger.error(f"FALHA COMPLETA: Não foi possível obter dados para {regiao['nome']} usando nenhuma API")
     
-    def coletar_openweather_atual(self, regiao):
+    def coletar_openweather_atual(self, regiao, agora=None):
         """
         Coleta dados climáticos atuais da API OpenWeather.
         
         Args:
             regiao (dict): Dicionário com informações da região
+            agora (datetime): Instante da coleta gravado em data/hora (padrão: agora)
             
         Returns:
             pandas.DataFrame: DataFrame com os dados coletados ou None em caso de falha
         """
-        latitude = regiao['latitude']
-        longitude = regiao['longitude']
+        import pandas as pd
+        import requests
+        
+        # Parâmetros da consulta de dados atuais
+        parametros = _parametros_openweather(regiao)
         
-        # URL para dados atuais
-        url = f"https://api.openweathermap.org/data/2.5/weather?lat={latitude}&lon={longitude}&appid={CHAVE_API_OPENWEATHER}&units=metric&lang=pt_br"
+        # O retry com backoff fica a cargo do HTTPAdapter da sessão
+        try:
+            logger.debug(f"Requisição OpenWeather atual: {regiao['nome']}")
+            resposta = self.sessao.get(URL_OPENWEATHER_ATUAL, params=parametros, timeout=10)
+            resposta.raise_for_status()
+            dados = _json_loads(resposta.content)
+            
+            # Transformar os dados em DataFrame
+            return pd.DataFrame([_registro_openweather_atual(dados, regiao, agora)])
+            
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Falha após {MAX_TENTATIVAS} tentativas com OpenWeather: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Erro inesperado ao processar dados OpenWeather: {e}")
+            return None
+    
+    async def _obter_json_async(self, sessao, url, parametros, timeout, descricao, espera_exponencial=False):
+        """
+        Faz um GET assíncrono com retry e retorna o JSON da resposta.
         
-        # Fazer a requisição com retry em caso de falha
+        Returns:
+            dict: Resposta decodificada ou None após esgotar as tentativas
+        """
         for tentativa in range(MAX_TENTATIVAS):
             try:
-                logger.debug(f"Tentativa {tentativa+1} para OpenWeather atual: {url}")
-                resposta = requests.get(url, timeout=10)
-                resposta.raise_for_status()
-                dados = resposta.json()
-                
-                # Transformar os dados em DataFrame
-                agora = datetime.now()
-                dados_climaticos = {
-                    'data': agora.strftime("%Y-%m-%d"),
-                    'hora': agora.strftime("%H:%M:%S"),
-                    'temperatura': dados['main']['temp'],
-                    'sensacao_termica': dados['main']['feels_like'],
-                    'temp_min': dados['main']['temp_min'],
-                    'temp_max': dados['main']['temp_max'],
-                    'pressao': dados['main']['pressure'],
-                    'umidade': dados['main']['humidity'],
-                    'velocidade_vento': dados['wind']['speed'] if 'wind' in dados else None,
-                    'direcao_vento': dados['wind']['deg'] if 'wind' in dados else None,
-                    'nuvens': dados['clouds']['all'] if 'clouds' in dados else None,
-                    'clima_principal': dados['weather'][0]['main'] if 'weather' in dados and len(dados['weather']) > 0 else None,
-                    'clima_descricao': dados['weather'][0]['description'] if 'weather' in dados and len(dados['weather']) > 0 else None,
-                    'chuva_1h': dados['rain']['1h'] if 'rain' in dados and '1h' in dados['rain'] else 0,
-                    'fonte': 'openweather',
-                    'regiao': regiao['nome'],
-                    'latitude': latitude,
-                    'longitude': longitude
-                }
-                
-                return pd.DataFrame([dados_climaticos])
-                
-            except (requests.exceptions.HTTPError, requests.exceptions.ConnectionError, 
-                   requests.exceptions.Timeout, requests.exceptions.RequestException) as e:
-                logger.warning(f"Erro ao acessar OpenWeather (tentativa {tentativa+1}): {e}")
-                if tentativa < MAX_TENTATIVAS - 1:
-                    time.sleep(ATRASO_TENTATIVA)
-                else:
-                    logger.error(f"Falha após {MAX_TENTATIVAS} tentativas com OpenWeather")
-                    return None
-            except Exception as e:
-                logger.error(f"Erro inesperado ao processar dados OpenWeather: {e}")
+                logger.debug(f"Tentativa {tentativa+1} para {descricao}: {url}")
+                async with sessao.get(url, params=parametros, timeout=aiohttp.ClientTimeout(total=timeout)) as resposta:
+                    resposta.raise_for_status()
+                    return _json_loads(await resposta.read())
+            except ValueError as e:
+                logger.error(f"Resposta inválida de {descricao}: {e}")
                 return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"Erro ao acessar {descricao} (tentativa {tentativa+1}): {e}")
+                if tentativa < MAX_TENTATIVAS - 1:
+                    # Espera fixa ou exponencial (5s, 10s, 20s...) entre tentativas
+                    tempo_espera = ATRASO_TENTATIVA * (2 ** tentativa) if espera_exponencial else ATRASO_TENTATIVA
+                    await asyncio.sleep(tempo_espera)
+        
+        logger.error(f"Falha após {MAX_TENTATIVAS} tentativas com {descricao}")
+        return None
+    
+    async def coletar_openweather_atual_async(self, sessao, regiao, agora=None):
+        """
+        Versão assíncrona de coletar_openweather_atual.
+        
+        Args:
+            sessao (aiohttp.ClientSession): Sessão HTTP compartilhada
+            regiao (dict): Dicionário com informações da região
+            agora (datetime): Instante da coleta gravado em data/hora (padrão: agora)
+            
+        Returns:
+            pandas.DataFrame: DataFrame com os dados coletados ou None em caso de falha
+        """
+        import pandas as pd
+        
+        dados = await self._obter_json_async(sessao, URL_OPENWEATHER_ATUAL, _parametros_openweather(regiao),
+                                             10, "OpenWeather atual")
+        if dados is None:
+            return None
+        
+        try:
+            return pd.DataFrame([_registro_openweather_atual(dados, regiao, agora)])
+        except Exception as e:
+            logger.error(f"Erro inesperado ao processar dados OpenWeather: {e}")
+            return None
     
     def coletar_openweather_historico(self, regiao):
         """
@@ -282,8 +729,8 @@ class ColetorDadosClimaticos:
         Returns:
             pandas.DataFrame: DataFrame com os dados coletados ou None em caso de falha
         """
-        latitude = regiao['latitude']
-        longitude = regiao['longitude']
+        import pandas as pd
+        import requests
         
         # Lista para armazenar todos os dados coletados
         todos_dados = []
@@ -292,104 +739,50 @@ class ColetorDadosClimaticos:
         data_fim = datetime.now()
         data_inicio = data_fim.replace(year=data_fim.year - ANOS_HISTORICO)
         
-        # Dividir em chunks anuais para evitar requisições muito grandes
-        # e problemas de limite de API
-        data_atual = data_inicio
-        
         logger.info(f"Iniciando coleta de {ANOS_HISTORICO} anos de dados históricos para {regiao['nome']}")
         logger.info(f"Período: {data_inicio.strftime('%Y-%m-%d')} até {data_fim.strftime('%Y-%m-%d')}")
         
-        while data_atual < data_fim:
-            # Calcular próximo período (1 ano ou até data fim, o que for menor)
-            proximo_periodo = min(
-                data_atual.replace(year=data_atual.year + 1),
-                data_fim
-            )
-            
+        parametros_regiao = _parametros_openweather(regiao)
+        
+        # Dividir em chunks anuais para evitar requisições muito grandes
+        # e problemas de limite de API
+        for data_atual, proximo_periodo, encerrado in _periodos_historico():
             # Converter para timestamp Unix (segundos desde 1970-01-01)
-            timestamp_inicio = int(data_atual.timestamp())
             timestamp_fim = int(proximo_periodo.timestamp())
             
-            # URL para a API de dados históricos
-            # Usando a API 3.0 que permite acesso a dados históricos
-            url = f"https://api.openweathermap.org/data/3.0/onecall/timemachine?lat={latitude}&lon={longitude}&dt={timestamp_fim}&appid={CHAVE_API_OPENWEATHER}&units=metric&lang=pt_br"
+            # Períodos encerrados já baixados em execuções anteriores vêm do cache
+            if encerrado:
+                pontos = _ler_cache_historico(regiao, timestamp_fim)
+                if pontos is not None:
+                    todos_dados.extend(pontos)
+                    logger.info(f"Usando cache para {regiao['nome']} - {data_atual.strftime('%Y-%m-%d')} ({len(pontos)} pontos)")
+                    continue
+            
+            # Parâmetros da API de dados históricos (API 3.0): só 'dt' muda por período
+            parametros = {**parametros_regiao, 'dt': timestamp_fim}
             
             logger.info(f"Coletando dados para {regiao['nome']} - período: {data_atual.strftime('%Y-%m-%d')} a {proximo_periodo.strftime('%Y-%m-%d')}")
             
-            # Fazer a requisição com retry em caso de falha
-            for tentativa in range(MAX_TENTATIVAS):
-                try:
-                    logger.debug(f"Tentativa {tentativa+1} para OpenWeather histórico: {url}")
-                    resposta = requests.get(url, timeout=30)  # Timeout maior para dados históricos
-                    resposta.raise_for_status()
-                    dados = resposta.json()
+            # O retry com backoff fica a cargo do HTTPAdapter da sessão
+            try:
+                logger.debug(f"Requisição OpenWeather histórico: {regiao['nome']} dt={timestamp_fim}")
+                pontos = self._obter_pontos_historico(parametros)
+                
+                # Verificar se recebemos dados
+                if pontos:
+                    # Os pontos brutos são convertidos em DataFrame de uma só vez no final
+                    todos_dados.extend(pontos)
+                    if encerrado:
+                        _gravar_cache_historico(regiao, timestamp_fim, pontos)
                     
-                    # Verificar se recebemos dados
-                    if 'data' in dados and len(dados['data']) > 0:
-                        # Processar cada ponto de dados
-                        for ponto in dados['data']:
-                            # Converter timestamp em data e hora
-                            dt = datetime.fromtimestamp(ponto.get('dt', 0))
-                            
-                            # Criar dicionário de dados
-                            dados_climaticos = {
-                                'data': dt.strftime("%Y-%m-%d"),
-                                'hora': dt.strftime("%H:%M:%S"),
-                                'temperatura': ponto.get('temp', None),
-                                'sensacao_termica': ponto.get('feels_like', None),
-                                'pressao': ponto.get('pressure', None),
-                                'umidade': ponto.get('humidity', None),
-                                'ponto_orvalho': ponto.get('dew_point', None),
-                                'indice_uv': ponto.get('uvi', None),
-                                'nuvens': ponto.get('clouds', None),
-                                'visibilidade': ponto.get('visibility', None),
-                                'velocidade_vento': ponto.get('wind_speed', None),
-                                'direcao_vento': ponto.get('wind_deg', None),
-                                'rajada_vento': ponto.get('wind_gust', None),
-                                'fonte': 'openweather',
-                                'regiao': regiao['nome'],
-                                'latitude': latitude,
-                                'longitude': longitude,
-                                'timestamp': ponto.get('dt', 0)
-                            }
-                            
-                            # Adicionar informações de clima se disponíveis
-                            if 'weather' in ponto and len(ponto['weather']) > 0:
-                                dados_climaticos['clima_id'] = ponto['weather'][0].get('id', None)
-                                dados_climaticos['clima_principal'] = ponto['weather'][0].get('main', None)
-                                dados_climaticos['clima_descricao'] = ponto['weather'][0].get('description', None)
-                                dados_climaticos['clima_icone'] = ponto['weather'][0].get('icon', None)
-                            
-                            # Adicionar informações de chuva e neve se disponíveis
-                            if 'rain' in ponto:
-                                dados_climaticos['chuva_1h'] = ponto['rain'].get('1h', 0)
-                            if 'snow' in ponto:
-                                dados_climaticos['neve_1h'] = ponto['snow'].get('1h', 0)
-                            
-                            # Adicionar ao conjunto de dados
-                            todos_dados.append(dados_climaticos)
-                        
-                        logger.info(f"Coletados {len(dados['data'])} pontos de dados para {regiao['nome']} - {data_atual.strftime('%Y-%m-%d')}")
-                        break  # Sair do loop de tentativas se bem-sucedido
-                    else:
-                        logger.warning(f"Sem dados para o período {data_atual.strftime('%Y-%m-%d')} a {proximo_periodo.strftime('%Y-%m-%d')}")
-                        
-                except (requests.exceptions.HTTPError, requests.exceptions.ConnectionError, 
-                       requests.exceptions.Timeout, requests.exceptions.RequestException) as e:
-                    logger.warning(f"Erro ao acessar OpenWeather histórico (tentativa {tentativa+1}): {e}")
-                    if tentativa < MAX_TENTATIVAS - 1:
-                        # Espera exponencial entre tentativas (5s, 10s, 20s...)
-                        tempo_espera = ATRASO_TENTATIVA * (2 ** tentativa)
-                        logger.info(f"Aguardando {tempo_espera}s antes da próxima tentativa...")
-                        time.sleep(tempo_espera)
-                    else:
-                        logger.error(f"Falha após {MAX_TENTATIVAS} tentativas com OpenWeather para período {data_atual.strftime('%Y-%m-%d')}")
-                except Exception as e:
-                    logger.error(f"Erro inesperado ao processar dados históricos OpenWeather: {e}")
-                    break
-            
-            # Avançar para o próximo período
-            data_atual = proximo_periodo
+                    logger.info(f"Coletados {len(pontos)} pontos de dados para {regiao['nome']} - {data_atual.strftime('%Y-%m-%d')}")
+                else:
+                    logger.warning(f"Sem dados para o período {data_atual.strftime('%Y-%m-%d')} a {proximo_periodo.strftime('%Y-%m-%d')}")
+                    
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Falha após {MAX_TENTATIVAS} tentativas com OpenWeather para período {data_atual.strftime('%Y-%m-%d')}: {e}")
+            except Exception as e:
+                logger.error(f"Erro inesperado ao processar dados históricos OpenWeather: {e}")
             
             # Aguardar entre períodos para evitar limitação de API
             time.sleep(1)
@@ -401,7 +794,90 @@ class ColetorDadosClimaticos:
         
         # Criar DataFrame com todos os dados coletados
         logger.info(f"Total de {len(todos_dados)} pontos de dados históricos coletados para {regiao['nome']}")
-        return pd.DataFrame(todos_dados)
+        return _dataframe_openweather_historico(todos_dados, regiao)
+    
+    def _obter_pontos_historico(self, parametros):
+        """
+        Requisita um período da API histórica e retorna a lista 'data'. Com o
+        ijson instalado, a resposta é lida em streaming, sem montar a árvore
+        JSON completa em memória.
+        
+        Returns:
+            list: Pontos horários do período (vazia se não houver dados)
+        """
+        if not IJSON_DISPONIVEL:
+            resposta = self.sessao.get(URL_OPENWEATHER_HISTORICO, params=parametros, timeout=30)  # Timeout maior para dados históricos
+            resposta.raise_for_status()
+            return _json_loads(resposta.content).get('data') or []
+        
+        import ijson
+        
+        with self.sessao.get(URL_OPENWEATHER_HISTORICO, params=parametros, timeout=30, stream=True) as resposta:
+            resposta.raise_for_status()
+            # Descompactar gzip/deflate ao ler o corpo bruto
+            resposta.raw.decode_content = True
+            return list(ijson.items(resposta.raw, 'data.item', use_float=True))
+    
+    async def coletar_openweather_historico_async(self, sessao, regiao):
+        """
+        Versão assíncrona de coletar_openweather_historico.
+        
+        Args:
+            sessao (aiohttp.ClientSession): Sessão HTTP compartilhada
+            regiao (dict): Dicionário com informações da região
+            
+        Returns:
+            pandas.DataFrame: DataFrame com os dados coletados
+        """
+        import pandas as pd
+        
+        logger.info(f"Iniciando coleta de {ANOS_HISTORICO} anos de dados históricos para {regiao['nome']}")
+        
+        # Os períodos anuais são independentes: requisitados concorrentemente,
+        # limitados por um semáforo para respeitar o limite da API
+        limite = asyncio.Semaphore(MAX_PERIODOS_SIMULTANEOS)
+        parametros_regiao = _parametros_openweather(regiao)
+        
+        async def coletar_periodo(data_atual, proximo_periodo, encerrado):
+            timestamp_fim = int(proximo_periodo.timestamp())
+            parametros = {**parametros_regiao, 'dt': timestamp_fim}
+            periodo = f"{data_atual.strftime('%Y-%m-%d')} a {proximo_periodo.strftime('%Y-%m-%d')}"
+            
+            # Períodos encerrados já baixados em execuções anteriores vêm do cache
+            if encerrado:
+                pontos = _ler_cache_historico(regiao, timestamp_fim)
+                if pontos is not None:
+                    logger.info(f"Usando cache para {regiao['nome']} - {data_atual.strftime('%Y-%m-%d')} ({len(pontos)} pontos)")
+                    return pontos
+            
+            async with limite:
+                logger.info(f"Coletando dados para {regiao['nome']} - período: {periodo}")
+                dados = await self._obter_json_async(sessao, URL_OPENWEATHER_HISTORICO, parametros, 30, "OpenWeather histórico",
+                                                     espera_exponencial=True)
+                # Intervalo mínimo por vaga do semáforo, para evitar limitação de API
+                await asyncio.sleep(1)
+            
+            if dados is None:
+                return []
+            if not dados.get('data'):
+                logger.warning(f"Sem dados para o período {periodo}")
+                return []
+            
+            logger.info(f"Coletados {len(dados['data'])} pontos de dados para {regiao['nome']} - {data_atual.strftime('%Y-%m-%d')}")
+            if encerrado:
+                _gravar_cache_historico(regiao, timestamp_fim, dados['data'])
+            return dados['data']
+        
+        # gather preserva a ordem dos períodos
+        resultados = await asyncio.gather(*(coletar_periodo(*periodo) for periodo in _periodos_historico()))
+        todos_dados = [ponto for pontos in resultados for ponto in pontos]
+        
+        if not todos_dados:
+            logger.warning(f"Nenhum dado histórico coletado para {regiao['nome']}")
+            return pd.DataFrame()
+        
+        logger.info(f"Total de {len(todos_dados)} pontos de dados históricos coletados para {regiao['nome']}")
+        return _dataframe_openweather_historico(todos_dados, regiao)
     
     def coletar_inmet_atual(self, regiao):
         """
@@ -413,12 +889,16 @@ class ColetorDadosClimaticos:
         Returns:
             pandas.DataFrame: DataFrame com os dados coletados ou None em caso de falha
         """
+        import pandas as pd
+        
         codigo_estacao = regiao['estacao_inmet']
         
         # Verificar se a biblioteca INMET está disponível
         if not INMET_DISPONIVEL:
             logger.error("Biblioteca inmetpy não instalada. Não é possível acessar dados do INMET.")
             return None
+        
+        from inmetpy import INMET
             
         # Inicializar cliente INMET
         inmet = INMET(token=TOKEN_INMET) if TOKEN_INMET else INMET()
@@ -471,12 +951,16 @@ class ColetorDadosClimaticos:
         Returns:
             pandas.DataFrame: DataFrame com os dados históricos ou None em caso de falha
         """
+        import pandas as pd
+        
         codigo_estacao = regiao['estacao_inmet']
         
         # Verificar se a biblioteca INMET está disponível
         if not INMET_DISPONIVEL:
             logger.error("Biblioteca inmetpy não instalada. Não é possível acessar dados do INMET.")
             return None
+        
+        from inmetpy import INMET
             
         # Inicializar cliente INMET
         inmet = INMET(token=TOKEN_INMET) if TOKEN_INMET else INMET()
@@ -576,45 +1060,22 @@ class ColetorDadosClimaticos:
                     # Limitando a quantidade para não sobrecarregar
                     anos_coleta = min(PERIODO_PESQUISA_INMET, ANOS_HISTORICO)  # Limitamos a quantidade de dados horários
                     
-                    data_atual = data_fim.replace(year=data_fim.year - anos_coleta)
+                    meses = pd.date_range(end=data_fim, periods=anos_coleta * 12, freq='MS', normalize=True)
                     
-                    while data_atual < data_fim:
-                        # Avança mês a mês
-                        mes_atual = data_atual.month
-                        ano_atual = data_atual.year
-                        
-                        data_mes_str = f"{ano_atual}-{mes_atual:02d}-01"
-                        logger.info(f"Coletando dados horários INMET para {regiao['nome']} - mês: {data_mes_str}")
-                        
-                        try:
-                            dados_horarios = inmet.hourly_data_for_date(
-                                station_code=codigo_estacao,
-                                date=data_mes_str
-                            )
-                            
-                            if dados_horarios is not None and not dados_horarios.empty:
-                                # Adicionar metadados da região
-                                dados_horarios['fonte'] = 'inmet'
-                                dados_horarios['regiao'] = regiao['nome']
-                                dados_horarios['latitude'] = regiao['latitude']
-                                dados_horarios['longitude'] = regiao['longitude']
-                                
-                                todos_dados.append(dados_horarios)
-                                logger.info(f"Coletados {len(dados_horarios)} registros horários INMET para {regiao['nome']} - mês {data_mes_str}")
-                            else:
-                                logger.warning(f"Sem dados horários INMET para {regiao['nome']} no mês {data_mes_str}")
-                        
-                        except Exception as e:
-                            logger.error(f"Erro ao coletar dados horários INMET para {regiao['nome']} - mês {data_mes_str}: {e}")
-                        
-                        # Avançar para o próximo mês
-                        if mes_atual == 12:
-                            data_atual = data_atual.replace(year=ano_atual + 1, month=1)
-                        else:
-                            data_atual = data_atual.replace(month=mes_atual + 1)
-                        
-                        # Aguardar entre requisições
-                        time.sleep(1)
+                    # O inmetpy faz HTTP bloqueante: os meses são requisitados em paralelo
+                    with ThreadPoolExecutor(max_workers=MAX_MESES_INMET_SIMULTANEOS) as executor:
+                        futuros = {
+                            executor.submit(self._coletar_inmet_mes, inmet, regiao, mes.strftime("%Y-%m-%d")): mes
+                            for mes in meses
+                        }
+                        dados_por_mes = {}
+                        for futuro in as_completed(futuros):
+                            dados_horarios = futuro.result()
+                            if dados_horarios is not None:
+                                dados_por_mes[futuros[futuro]] = dados_horarios
+                    
+                    # Manter a ordem cronológica dos meses
+                    todos_dados.extend(dados_por_mes[mes] for mes in sorted(dados_por_mes))
                 else:
                     logger.error(f"Não foi possível encontrar método adequado na biblioteca inmetpy para dados históricos")
         
@@ -626,16 +1087,48 @@ class ColetorDadosClimaticos:
             logger.warning(f"Nenhum dado histórico do INMET coletado para {regiao['nome']}")
             return pd.DataFrame()
         
-        # Combinar todos os DataFrames coletados
-        dados_combinados = pd.concat(todos_dados, ignore_index=True)
+        # Combinar todos os DataFrames coletados (um único concat; com um só
+        # bloco, como no método historical_data, a cópia é evitada)
+        dados_combinados = todos_dados[0] if len(todos_dados) == 1 else pd.concat(todos_dados, ignore_index=True)
         
         # Remover possíveis duplicatas (por data/hora)
         if 'DATETIME' in dados_combinados.columns:
-            dados_combinados = dados_combinados.drop_duplicates(subset=['DATETIME'])
+            dados_combinados = dados_combinados[~dados_combinados['DATETIME'].duplicated()]
         
         logger.info(f"Total de {len(dados_combinados)} registros históricos do INMET coletados para {regiao['nome']}")
         return dados_combinados
     
+    def _coletar_inmet_mes(self, inmet, regiao, data_mes_str):
+        """
+        Coleta os dados horários INMET de um mês para uma região.
+        
+        Returns:
+            pandas.DataFrame: Dados do mês ou None se vazio/em caso de falha
+        """
+        logger.info(f"Coletando dados horários INMET para {regiao['nome']} - mês: {data_mes_str}")
+        
+        try:
+            dados_horarios = inmet.hourly_data_for_date(
+                station_code=regiao['estacao_inmet'],
+                date=data_mes_str
+            )
+        except Exception as e:
+            logger.error(f"Erro ao coletar dados horários INMET para {regiao['nome']} - mês {data_mes_str}: {e}")
+            return None
+        
+        if dados_horarios is None or dados_horarios.empty:
+            logger.warning(f"Sem dados horários INMET para {regiao['nome']} no mês {data_mes_str}")
+            return None
+        
+        # Adicionar metadados da região
+        dados_horarios['fonte'] = 'inmet'
+        dados_horarios['regiao'] = regiao['nome']
+        dados_horarios['latitude'] = regiao['latitude']
+        dados_horarios['longitude'] = regiao['longitude']
+        
+        logger.info(f"Coletados {len(dados_horarios)} registros horários INMET para {regiao['nome']} - mês {data_mes_str}")
+        return dados_horarios
+    
     def salvar_dados(self, dados, nome_regiao, fonte, modo):
         """
         Salva os dados coletados em formato CSV.
@@ -646,6 +1139,8 @@ class ColetorDadosClimaticos:
             fonte (str): Fonte dos dados (openweather ou inmet)
             modo (str): Modo de coleta (atual ou historico)
         """
+        import pandas as pd
+        
         if dados is None or dados.empty:
             logger.warning(f"Não há dados para salvar: {nome_regiao}, {fonte}, {modo}")
             return
@@ -658,68 +1153,208 @@ class ColetorDadosClimaticos:
         diretorio_ano = diretorio_destino / str(hoje.year)
         diretorio_mes = diretorio_ano / f"{hoje.month:02d}"
         
-        diretorio_ano.mkdir(exist_ok=True)
-        diretorio_mes.mkdir(exist_ok=True)
+        self._garantir_diretorio(diretorio_mes)
         
         # Nome do arquivo baseado no modo, região e data
         data_str = hoje.strftime("%Y%m%d")
         caminho_arquivo = diretorio_mes / f"{modo}_{nome_regiao}_{data_str}.csv"
         
-        # Verificar se já existe arquivo para evitar duplicação
-        if caminho_arquivo.exists() and modo == "atual":
-            # Para dados atuais, podemos querer atualizar o arquivo existente
-            # Lê o arquivo existente
-            dados_existentes = pd.read_csv(caminho_arquivo)
-            
-            # Se estamos lidando com INMET, temos que verificar duplicação por DATETIME
-            if fonte == "inmet" and "DATETIME" in dados.columns and "DATETIME" in dados_existentes.columns:
-                # Convertendo para datetime para comparação
-                dados['DATETIME'] = pd.to_datetime(dados['DATETIME'])
-                dados_existentes['DATETIME'] = pd.to_datetime(dados_existentes['DATETIME'])
+        # Gravações concorrentes (threads) no mesmo arquivo são serializadas
+        with _trava_arquivo(caminho_arquivo):
+            # Verificar se já existe arquivo para evitar duplicação
+            if caminho_arquivo.exists() and modo == "atual":
+                # OpenWeather: apenas as linhas novas são acrescentadas ao final do
+                # arquivo, sem reler e regravar o arquivo inteiro
+                if (fonte == "openweather" and "data" in dados.columns and "hora" in dados.columns
+                        and self._anexar_novos_registros(dados, caminho_arquivo)):
+                    return
                 
-                # Filtra apenas registros novos
-                novos_dados = dados[~dados['DATETIME'].isin(dados_existentes['DATETIME'])]
-                if not novos_dados.empty:
-                    # Concatena e salva
-                    dados_combinados = pd.concat([dados_existentes, novos_dados])
-                    dados_combinados.to_csv(caminho_arquivo, index=False)
-                    logger.info(f"Adicionados {len(novos_dados)} novos registros a {caminho_arquivo}")
-                else:
-                    logger.info(f"Nenhum novo registro para adicionar a {caminho_arquivo}")
-            
-            # Para OpenWeather, verificamos por data e hora
-            elif fonte == "openweather" and "data" in dados.columns and "hora" in dados.columns:
-                if "data" in dados_existentes.columns and "hora" in dados_existentes.columns:
-                    # Criar chave composta para comparação
-                    dados['chave_datetime'] = dados['data'] + " " + dados['hora']
-                    dados_existentes['chave_datetime'] = dados_existentes['data'] + " " + dados_existentes['hora']
+                # INMET: idem, com os instantes já gravados mantidos em um índice auxiliar
+                if (fonte == "inmet" and "DATETIME" in dados.columns
+                        and self._anexar_novos_registros_inmet(dados, caminho_arquivo)):
+                    return
+                
+                # Para dados atuais, podemos querer atualizar o arquivo existente
+                # Lê o arquivo existente (DATETIME do INMET já convertido na leitura)
+                with open(caminho_arquivo, newline="", encoding="utf-8") as arquivo:
+                    cabecalho = next(csv.reader(arquivo), [])
+                datas = ["DATETIME"] if fonte == "inmet" and "DATETIME" in cabecalho else None
+                dados_existentes = pd.read_csv(caminho_arquivo, parse_dates=datas)
+                
+                # Se estamos lidando com INMET, temos que verificar duplicação por DATETIME
+                if fonte == "inmet" and "DATETIME" in dados.columns and "DATETIME" in dados_existentes.columns:
+                    # Convertendo para datetime e indexando pelo instante para comparação
+                    dados['DATETIME'] = pd.to_datetime(dados['DATETIME'])
+                    dados = dados.set_index('DATETIME', drop=False)
                     
-                    # Filtra apenas registros novos
-                    novos_dados = dados[~dados['chave_datetime'].isin(dados_existentes['chave_datetime'])]
+                    # Filtra apenas registros novos (diferença entre índices)
+                    novos_indices = dados.index.difference(pd.DatetimeIndex(dados_existentes['DATETIME']), sort=False)
+                    novos_dados = dados.loc[novos_indices].reset_index(drop=True)
                     if not novos_dados.empty:
-                        # Remove a coluna auxiliar antes de salvar
-                        novos_dados = novos_dados.drop('chave_datetime', axis=1)
-                        dados_existentes = dados_existentes.drop('chave_datetime', axis=1)
-                        
-                        # Concatena e salva
-                        dados_combinados = pd.concat([dados_existentes, novos_dados])
-                        dados_combinados.to_csv(caminho_arquivo, index=False)
+                        self._regravar_com_novos(dados_existentes, novos_dados, caminho_arquivo)
                         logger.info(f"Adicionados {len(novos_dados)} novos registros a {caminho_arquivo}")
                     else:
                         logger.info(f"Nenhum novo registro para adicionar a {caminho_arquivo}")
+                
+                # Para OpenWeather, verificamos por data e hora
+                elif fonte == "openweather" and "data" in dados.columns and "hora" in dados.columns:
+                    if "data" in dados_existentes.columns and "hora" in dados_existentes.columns:
+                        # Índice de data/hora montado uma vez, sem coluna auxiliar
+                        dados = dados.set_index(_indice_data_hora(dados))
+                        indice_existente = _indice_data_hora(dados_existentes)
+                        
+                        # Filtra apenas registros novos (diferença entre índices)
+                        novos_indices = dados.index.difference(indice_existente, sort=False)
+                        novos_dados = dados.loc[novos_indices].reset_index(drop=True)
+                        if not novos_dados.empty:
+                            self._regravar_com_novos(dados_existentes, novos_dados, caminho_arquivo)
+                            logger.info(f"Adicionados {len(novos_dados)} novos registros a {caminho_arquivo}")
+                        else:
+                            logger.info(f"Nenhum novo registro para adicionar a {caminho_arquivo}")
+                    else:
+                        # Estrutura diferente, salva como novo arquivo
+                        dados.to_csv(caminho_arquivo, index=False)
+                        logger.info(f"Substituído arquivo existente {caminho_arquivo} (estrutura diferente)")
                 else:
-                    # Estrutura diferente, salva como novo arquivo
-                    dados.to_csv(caminho_arquivo, index=False)
-                    logger.info(f"Substituído arquivo existente {caminho_arquivo} (estrutura diferente)")
+                    # Caso não consiga determinar duplicação, salva como arquivo separado
+                    caminho_arquivo_alt = diretorio_mes / f"{modo}_{nome_regiao}_{data_str}_{int(time.time())}.csv"
+                    dados.to_csv(caminho_arquivo_alt, index=False)
+                    logger.info(f"Criado novo arquivo alternativo {caminho_arquivo_alt}")
             else:
-                # Caso não consiga determinar duplicação, salva como arquivo separado
-                caminho_arquivo_alt = diretorio_mes / f"{modo}_{nome_regiao}_{data_str}_{int(time.time())}.csv"
-                dados.to_csv(caminho_arquivo_alt, index=False)
-                logger.info(f"Criado novo arquivo alternativo {caminho_arquivo_alt}")
+                # Salva novo arquivo
+                caminho_arquivo = self._escrever_dados(dados, caminho_arquivo, modo)
+                logger.info(f"Criado novo arquivo {caminho_arquivo}")
+        
+    
+    def _regravar_com_novos(self, dados_existentes, novos_dados, caminho_arquivo):
+        """
+        Regrava o arquivo com os dados existentes seguidos dos novos, com a
+        união das colunas (como pd.concat), mas escrevendo cada parte
+        diretamente, sem montar o DataFrame combinado em memória.
+        """
+        colunas = list(dados_existentes.columns)
+        colunas += [coluna for coluna in novos_dados.columns if coluna not in dados_existentes.columns]
+        
+        with open(caminho_arquivo, "w", buffering=1 << 20, newline="", encoding="utf-8") as arquivo:
+            dados_existentes.reindex(columns=colunas).to_csv(arquivo, index=False)
+            novos_dados.reindex(columns=colunas).to_csv(arquivo, header=False, index=False)
+    
+    def _anexar_novos_registros(self, dados, caminho_arquivo):
+        """
+        Acrescenta ao CSV existente os registros do OpenWeather cuja data/hora
+        ainda não está nele, em uma única escrita com buffer. O arquivo é
+        mantido em ordem de data/hora, de modo que o caso comum (registros mais
+        novos que o último gravado) só precisa ler a última linha.
+        
+        Returns:
+            bool: False se o cabeçalho do arquivo não comportar os dados (o
+            chamador então regrava o arquivo completo)
+        """
+        import pandas as pd
+        
+        with open(caminho_arquivo, newline="", encoding="utf-8") as arquivo:
+            cabecalho = next(csv.reader(arquivo), [])
+        
+        if "data" not in cabecalho or "hora" not in cabecalho or not set(dados.columns) <= set(cabecalho):
+            return False
+        
+        chaves_novas = list(zip(dados["data"].astype(str), dados["hora"].astype(str)))
+        
+        # O arquivo cresce em ordem cronológica: se todos os registros são
+        # posteriores ao último gravado, basta ler a última linha
+        ultima_linha = _ultima_linha_csv(caminho_arquivo)
+        todos_posteriores = False
+        if ultima_linha is not None and len(ultima_linha) == len(cabecalho) and ultima_linha != cabecalho:
+            ultima_chave = (ultima_linha[cabecalho.index("data")], ultima_linha[cabecalho.index("hora")])
+            todos_posteriores = all(chave > ultima_chave for chave in chaves_novas)
+        
+        if todos_posteriores:
+            novos_dados = dados
+        else:
+            # Apenas as colunas de data/hora do arquivo existente são lidas
+            existentes = pd.read_csv(caminho_arquivo, usecols=["data", "hora"], dtype=str)
+            chaves_existentes = set(zip(existentes["data"], existentes["hora"]))
+            mascara_novos = [chave not in chaves_existentes for chave in chaves_novas]
+            novos_dados = dados[mascara_novos]
+            
+            # Registro anterior ao fim do arquivo: regrava em ordem cronológica
+            # para que a leitura apenas da última linha continue válida
+            ultima_existente = max(chaves_existentes, default=None)
+            if ultima_existente is not None and any(
+                    chave < ultima_existente for chave, novo in zip(chaves_novas, mascara_novos) if novo):
+                dados_combinados = pd.concat([pd.read_csv(caminho_arquivo), novos_dados], ignore_index=True)
+                dados_combinados = dados_combinados.sort_values(["data", "hora"], kind="mergesort")
+                dados_combinados.reindex(columns=cabecalho).to_csv(caminho_arquivo, index=False)
+                logger.info(f"Adicionados {len(novos_dados)} novos registros a {caminho_arquivo}")
+                return True
+        
+        if novos_dados.empty:
+            logger.info(f"Nenhum novo registro para adicionar a {caminho_arquivo}")
+            return True
+        
+        with open(caminho_arquivo, "a", buffering=1 << 20, newline="", encoding="utf-8") as arquivo:
+            novos_dados.reindex(columns=cabecalho).to_csv(arquivo, header=False, index=False)
+        logger.info(f"Adicionados {len(novos_dados)} novos registros a {caminho_arquivo}")
+        return True
+    
+    def _anexar_novos_registros_inmet(self, dados, caminho_arquivo):
+        """
+        Acrescenta ao CSV existente os registros do INMET cujo DATETIME ainda
+        não está nele. Os instantes já gravados ficam em um índice auxiliar
+        (em dados/cache/indices_inmet), de modo que o CSV só é relido se o
+        índice estiver ausente ou não corresponder à versão atual do arquivo.
+        Instantes repetidos dentro do próprio lote são gravados uma única vez.
+        
+        Returns:
+            bool: False se o cabeçalho do arquivo não comportar os dados (o
+            chamador então regrava o arquivo completo)
+        """
+        import pandas as pd
+        
+        with open(caminho_arquivo, newline="", encoding="utf-8") as arquivo:
+            cabecalho = next(csv.reader(arquivo), [])
+        
+        if "DATETIME" not in cabecalho or not set(dados.columns) <= set(cabecalho):
+            return False
+        
+        vistos = _ler_indice_vistos(caminho_arquivo)
+        if vistos is None:
+            vistos = _instantes_inmet(pd.read_csv(caminho_arquivo, usecols=["DATETIME"])["DATETIME"])
+        
+        instantes = _instantes_inmet(dados["DATETIME"])
+        mascara_novos = ~instantes.isin(vistos) & ~instantes.duplicated()
+        novos_dados = dados[mascara_novos]
+        
+        if not novos_dados.empty:
+            with open(caminho_arquivo, "a", buffering=1 << 20, newline="", encoding="utf-8") as arquivo:
+                novos_dados.reindex(columns=cabecalho).to_csv(arquivo, header=False, index=False)
+            vistos = vistos.append(instantes[mascara_novos])
+            logger.info(f"Adicionados {len(novos_dados)} novos registros a {caminho_arquivo}")
         else:
-            # Salva novo arquivo
-            dados.to_csv(caminho_arquivo, index=False)
-            logger.info(f"Criado novo arquivo {caminho_arquivo}")
+            logger.info(f"Nenhum novo registro para adicionar a {caminho_arquivo}")
+        
+        # Gravado depois do CSV, com o mtime e o tamanho da versão recém-gravada
+        _gravar_indice_vistos(caminho_arquivo, vistos.unique().sort_values())
+        return True
+    
+    def _escrever_dados(self, dados, caminho_arquivo, modo):
+        """
+        Grava um novo arquivo de dados. Dados históricos (grandes) são gravados
+        em Parquet com compressão snappy quando o pyarrow está disponível;
+        os demais, em CSV.
+        
+        Returns:
+            Path: Caminho do arquivo efetivamente gravado
+        """
+        if modo == "historico" and PYARROW_DISPONIVEL:
+            caminho_parquet = caminho_arquivo.with_suffix(".parquet")
+            dados.to_parquet(caminho_parquet, engine="pyarrow", compression="snappy", index=False)
+            # O Parquet substitui um CSV do mesmo dia gravado anteriormente
+            caminho_arquivo.unlink(missing_ok=True)
+            return caminho_parquet
+        
+        dados.to_csv(caminho_arquivo, index=False)
+        return caminho_arquivo
     
     def verificar_consistencia_dados(self, dados, fonte):
         """
@@ -732,6 +1367,8 @@ class ColetorDadosClimaticos:
         Returns:
             bool: True se os dados parecem consistentes, False caso contrário
         """
+        import numpy as np
+        
         if dados is None or dados.empty:
             logger.warning(f"Dados vazios de {fonte}")
             return False
@@ -744,34 +1381,25 @@ class ColetorDadosClimaticos:
                 return False
             
             # Verificar valores missing
-            percentuais_ausentes = dados.isna().mean() * 100
-            alta_ausencia = percentuais_ausentes[percentuais_ausentes > 50].index.tolist()
+            # Colunas numéricas: contagem de NaN direto no array numpy; as demais
+            # (texto) pelo isna() do pandas. Mais de 50% ausentes <=> 2*n > total
+            colunas_numericas = dados.select_dtypes('number').columns
+            ausentes = dict(zip(colunas_numericas, np.isnan(
+                dados[colunas_numericas].to_numpy(dtype="float64", na_value=np.nan)).sum(axis=0)))
+            ausentes.update(dados[dados.columns.difference(colunas_numericas, sort=False)].isna().sum())
+            alta_ausencia = [coluna for coluna in dados.columns if 2 * ausentes[coluna] > len(dados)]
             if alta_ausencia:
                 logger.warning(f"Colunas com mais de 50% de valores ausentes em {fonte}: {alta_ausencia}")
                 # Não retorna False aqui, apenas alerta
             
-            # Verificações específicas por fonte
-            if fonte == 'openweather':
-                # Verificar se temperaturas estão em um intervalo razoável
-                if 'temperatura' in dados.columns and (dados['temperatura'].min() < -40 or dados['temperatura'].max() > 55):
-                    logger.warning(f"Temperaturas fora do intervalo esperado em {fonte}")
-                    return False
-                
-                # Verificar umidade
-                if 'umidade' in dados.columns and (dados['umidade'].min() < 0 or dados['umidade'].max() > 100):
-                    logger.warning(f"Umidade fora do intervalo esperado em {fonte}")
-                    return False
-                
-            elif fonte == 'inmet':
-                # Verificações específicas para dados do INMET
-                # As colunas exatas dependem do que é retornado pela API
-                if 'TEM_INS' in dados.columns and (dados['TEM_INS'].min() < -40 or dados['TEM_INS'].max() > 55):
-                    logger.warning(f"Temperaturas fora do intervalo esperado em {fonte}")
-                    return False
-                
-                # Verificar umidade
-                if 'UMD_INS' in dados.columns and (dados['UMD_INS'].min() < 0 or dados['UMD_INS'].max() > 100):
-                    logger.warning(f"Umidade fora do intervalo esperado em {fonte}")
+            # Verificações específicas por fonte: cada coluna presente deve estar
+            # na faixa esperada (uma comparação vetorizada por coluna)
+            for coluna, minimo, maximo, descricao in _FAIXAS_CONSISTENCIA.get(fonte, ()):
+                if coluna not in dados.columns:
+                    continue
+                valores = dados[coluna].to_numpy(dtype="float64", na_value=np.nan)
+                if ((valores < minimo) | (valores > maximo)).any():
+                    logger.warning(f"{descricao} fora do intervalo esperado em {fonte}")
                     return False
                 
             logger.info(f"Verificação de consistência concluída para {fonte} - dados parecem válidos")
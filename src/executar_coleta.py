@@ -7,76 +7,85 @@ Este script é ideal para uso via linha de comando ou agendador (cron).
 import argparse
 import sys
 import logging
-from datetime import datetime
+import time
 from pathlib import Path
-from coletor_climatico import ColetorDadosClimaticos
 
-# Configurar logger para este script
+# O coletor (pandas, requests, inmetpy) e a configuração do log são carregados
+# só ao executar a coleta: --help e erros de argumentos respondem de imediato
 DIRETORIO_BASE = Path(__file__).parent.parent
 DIRETORIO_LOGS = DIRETORIO_BASE / "logs"
 
-# Organizar logs por ano/mês, semelhante aos dados
-hoje = datetime.now()
-diretorio_log_ano = DIRETORIO_LOGS / str(hoje.year)
-diretorio_log_mes = diretorio_log_ano / f"{hoje.month:02d}"
-
-# Criar diretórios de log se não existirem
-diretorio_log_ano.mkdir(exist_ok=True, parents=True)
-diretorio_log_mes.mkdir(exist_ok=True, parents=True)
-
-arquivo_log = diretorio_log_mes / f"execucao_{hoje.strftime('%Y%m%d_%H%M%S')}.log"
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(arquivo_log),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
 logger = logging.getLogger(__name__)
 
-def main():
-    """Função principal para execução da coleta"""
-    parser = argparse.ArgumentParser(description="Execução de Coleta de Dados Climáticos")
-    parser.add_argument('--modo', choices=['atual', 'historico', 'ambos'], 
-                        default='atual', help='Modo de coleta de dados')
-    parser.add_argument('--regioes', nargs='+', help='Lista de regiões específicas (opcional)')
-    parser.add_argument('--dias', type=int, default=7, 
-                        help='Número de dias para coleta de dados atuais (1-30)')
-    parser.add_argument('--anos', type=int, default=15, 
-                        help='Número de anos para coleta de dados históricos (1-30)')
+def _configurar_log():
+    """Cria o diretório de logs do mês e configura o log desta execução"""
+    # Log já configurado (ex.: pelo coletor): basicConfig não teria efeito
+    if logging.getLogger().handlers:
+        return
+    
+    # Organizar logs por ano/mês, semelhante aos dados
+    agora = time.localtime()
+    diretorio_log_mes = DIRETORIO_LOGS / time.strftime("%Y", agora) / time.strftime("%m", agora)
+    
+    # Criar diretórios de log se não existirem
+    diretorio_log_mes.mkdir(exist_ok=True, parents=True)
+    
+    arquivo_log = diretorio_log_mes / time.strftime("execucao_%Y%m%d_%H%M%S.log", agora)
     
-    args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.FileHandler(arquivo_log),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+
+def run(modo="atual", regioes=None, dias=7, anos=15):
+    """
+    Executa a coleta de dados climáticos
     
+    Args:
+        modo: 'atual', 'historico' ou 'ambos'
+        regioes: lista de nomes de regiões (opcional)
+        dias: número de dias para coleta atual (1-30)
+        anos: número de anos para coleta histórica (1-30)
+        
+    Returns:
+        int: 0 em caso de sucesso, 1 em caso de erro
+    """
     # Validação de parâmetros
-    if args.dias < 1 or args.dias > 30:
+    if dias < 1 or dias > 30:
         logger.error("O número de dias deve estar entre 1 e 30")
         return 1
     
-    if args.anos < 1 or args.anos > 30:
+    if anos < 1 or anos > 30:
         logger.error("O número de anos deve estar entre 1 e 30")
         return 1
     
-    logger.info(f"Iniciando execução no modo: {args.modo}")
-    logger.info(f"Configurações: dias={args.dias}, anos={args.anos}")
+    # Importado (e o log configurado) apenas depois da validação dos parâmetros
+    from coletor_climatico import ColetorDadosClimaticos
+    _configurar_log()
     
-    if args.regioes:
-        logger.info(f"Regiões específicas: {', '.join(args.regioes)}")
+    logger.info(f"Iniciando execução no modo: {modo}")
+    logger.info(f"Configurações: dias={dias}, anos={anos}")
+    
+    if regioes:
+        logger.info(f"Regiões específicas: {', '.join(regioes)}")
     
     try:
         # Inicializar o coletor
         coletor = ColetorDadosClimaticos()
         
         # Executar coleta conforme modo
-        if args.modo in ('atual', 'ambos'):
+        if modo in ('atual', 'ambos'):
             logger.info("Iniciando coleta de dados atuais")
-            coletor.coletar_para_todas_regioes(modo="atual", regioes_especificas=args.regioes)
+            coletor.coletar_para_todas_regioes(modo="atual", regioes_especificas=regioes)
             logger.info("Coleta de dados atuais finalizada")
         
-        if args.modo in ('historico', 'ambos'):
+        if modo in ('historico', 'ambos'):
             logger.info("Iniciando coleta de dados históricos")
-            coletor.coletar_para_todas_regioes(modo="historico", regioes_especificas=args.regioes)
+            coletor.coletar_para_todas_regioes(modo="historico", regioes_especificas=regioes)
             logger.info("Coleta de dados históricos finalizada")
         
         logger.info("Execução concluída com sucesso")
@@ -86,5 +95,20 @@ def main():
         logger.error(f"Erro durante a execução: {str(e)}")
         return 1
 
+def main(argv=None):
+    """Função principal para execução da coleta via linha de comando"""
+    parser = argparse.ArgumentParser(description="Execução de Coleta de Dados Climáticos")
+    parser.add_argument('--modo', choices=['atual', 'historico', 'ambos'], 
+                        default='atual', help='Modo de coleta de dados')
+    parser.add_argument('--regioes', nargs='+', help='Lista de regiões específicas (opcional)')
+    parser.add_argument('--dias', type=int, default=7, 
+                        help='Número de dias para coleta de dados atuais (1-30)')
+    parser.add_argument('--anos', type=int, default=15, 
+                        help='Número de anos para coleta de dados históricos (1-30)')
+    
+    args = parser.parse_args(argv)
+    
+    return run(modo=args.modo, regioes=args.regioes, dias=args.dias, anos=args.anos)
+
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -5,42 +5,140 @@ Este script demonstra como carregar e visualizar os dados coletados pelo sistema
 """
 
 import os
+import re
+import sys
+import importlib.util
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
 from datetime import datetime, timedelta
-import glob
-
-# Configurações para gráficos mais bonitos
-plt.style.use('ggplot')
-sns.set(style="darkgrid")
+from concurrent.futures import ThreadPoolExecutor
 
 # Diretório de dados
 DIRETORIO_DADOS = Path(__file__).parent.parent / "dados"
 
+# Acima disso a série é agregada antes de plotar (~largura do gráfico em pixels)
+MAX_PONTOS_GRAFICO = 2000
+
+# pyarrow é opcional: lê os CSVs com o leitor multithread do Arrow
+PYARROW_DISPONIVEL = importlib.util.find_spec("pyarrow") is not None
+
+def _ler_csv(arquivo):
+    """Lê um CSV de dados, com o leitor do pyarrow quando disponível"""
+    if not PYARROW_DISPONIVEL:
+        return pd.read_csv(arquivo)
+    
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    
+    # Colunas de data/hora permanecem texto, como no pd.read_csv
+    tipos = {coluna: pa.string() for coluna in ('data', 'hora', 'DATETIME')}
+    # strings_can_be_null: campos vazios viram nulos, como no pd.read_csv
+    opcoes = pacsv.ConvertOptions(column_types=tipos, strings_can_be_null=True)
+    tabela = pacsv.read_csv(arquivo, convert_options=opcoes)
+    
+    # Textos continuam armazenados no Arrow (offsets + buffer) em vez de objetos
+    # Python; as colunas numéricas viram arrays numpy, como antes
+    texto_arrow = pd.StringDtype(storage="pyarrow")
+    return tabela.to_pandas(self_destruct=True,
+                            types_mapper=lambda tipo: texto_arrow if tipo == pa.string() else None)
+
+# Nome de arquivo de dados: tipo_regiao_AAAAMMDD[_timestamp].csv (ou .parquet, histórico)
+_RE_ARQUIVO_REGIAO = re.compile(r"^(?:atual|historico)_(.+)_\d{8}(?:_\d+)?\.(?:csv|parquet)$")
+
+# Última listagem de regiões e a assinatura (mtime) dos diretórios de mês usada nela
+_cache_regioes = {"chave": None, "val": None}
+
+
+def _diretorios_meses(diretorio_fonte):
+    """Retorna (caminho, mtime em ns) de cada diretório <fonte>/<ano>/<mes>/, usando os.scandir"""
+    try:
+        with os.scandir(diretorio_fonte) as entradas:
+            anos = [e.path for e in entradas if e.is_dir()]
+    except FileNotFoundError:
+        return []
+    
+    meses = []
+    for ano in sorted(anos):
+        with os.scandir(ano) as entradas:
+            meses.extend((e.path, e.stat().st_mtime_ns) for e in entradas if e.is_dir())
+    meses.sort()
+    return meses
+
+
 def listar_regioes_disponiveis():
-    """Lista todas as regiões com dados disponíveis"""
-    regioes = set()
+    """
+    Lista todas as regiões com dados disponíveis.
     
-    # Buscar em ambas as fontes de dados
-    for fonte in ['openweather', 'inmet']:
-        padrao_busca = str(DIRETORIO_DADOS / fonte / "**" / "*.csv")
-        for arquivo in glob.glob(padrao_busca, recursive=True):
-            nome_arquivo = os.path.basename(arquivo)
-            if nome_arquivo.startswith(("atual_", "historico_")):
-                partes = nome_arquivo.split("_")
-                if len(partes) >= 3:
-                    # O formato esperado é tipo_regiao_data.csv ou tipo_regiao_parte1_parte2_data.csv
-                    if partes[0] in ["atual", "historico"]:
-                        # Para regiões com nomes compostos (ex: Sao_Paulo_SP)
-                        # vamos extrair tudo entre o primeiro _ e o último _
-                        primeiro_indice = nome_arquivo.find('_') + 1
-                        ultimo_indice = nome_arquivo.rfind('_')
-                        regiao = nome_arquivo[primeiro_indice:ultimo_indice]
-                        regioes.add(regiao)
-    
-    return sorted(list(regioes))
+    O resultado é reaproveitado enquanto nenhum diretório de mês mudar (o
+    mtime de um diretório muda quando um arquivo é adicionado ou removido).
+    """
+    # Layout: dados/<fonte>/<ano>/<mes>/<tipo>_<regiao>_<data>.csv
+    meses = [mes for fonte in ('openweather', 'inmet')
+             for mes in _diretorios_meses(DIRETORIO_DADOS / fonte)]
+    chave = tuple(meses)
+    
+    if _cache_regioes["chave"] != chave:
+        regioes = set()
+        for caminho_mes, _ in meses:
+            try:
+                with os.scandir(caminho_mes) as arquivos:
+                    for entrada in arquivos:
+                        correspondencia = _RE_ARQUIVO_REGIAO.match(entrada.name)
+                        # Para regiões com nomes compostos (ex: Sao_Paulo_SP) o
+                        # grupo captura tudo entre o tipo e a data
+                        if correspondencia and entrada.is_file():
+                            regioes.add(correspondencia.group(1))
+            except FileNotFoundError:
+                continue
+        _cache_regioes["chave"] = chave
+        _cache_regioes["val"] = sorted(regioes)
+    
+    return list(_cache_regioes["val"])
+
+def _arquivos_regiao(fonte, tipo, regiao):
+    """
+    Lista (data AAAAMMDD, caminho) dos arquivos da região, do mais recente
+    para o mais antigo. O nome da região deve coincidir exatamente (uma busca
+    por 'Sao' não inclui 'Sao_Paulo_SP'). Dados históricos podem estar em Parquet.
+    """
+    extensoes = "csv|parquet" if tipo == "historico" else "csv"
+    padrao = re.compile(rf"^{re.escape(tipo)}_{re.escape(regiao)}_(\d{{8}})(?:_\d+)?\.(?:{extensoes})$")
+    
+    arquivos = []
+    for caminho_mes, _ in _diretorios_meses(DIRETORIO_DADOS / fonte):
+        with os.scandir(caminho_mes) as entradas:
+            for entrada in entradas:
+                correspondencia = padrao.match(entrada.name)
+                if correspondencia:
+                    arquivos.append((correspondencia.group(1), entrada.path))
+    
+    arquivos.sort(reverse=True)
+    return arquivos
+
+def _carregar_arquivo(arquivo, fonte, regiao, tipo, data_limite):
+    """Lê um arquivo de dados, completa os metadados e cria a coluna data_hora"""
+    df = pd.read_parquet(arquivo) if arquivo.endswith(".parquet") else _ler_csv(arquivo)
+    
+    # Adicionar metadados se não existir
+    if 'fonte' not in df.columns:
+        df['fonte'] = fonte
+    if 'regiao' not in df.columns:
+        df['regiao'] = regiao
+        
+    # Processar datas
+    if fonte == 'openweather' and 'data' in df.columns and 'hora' in df.columns:
+        df['data_hora'] = pd.to_datetime(df['data'] + ' ' + df['hora'])
+    elif fonte == 'inmet' and 'DATETIME' in df.columns:
+        df['data_hora'] = pd.to_datetime(df['DATETIME'])
+    
+    # Filtrar por data se necessário
+    if 'data_hora' in df.columns and tipo == 'atual':
+        df = df[df['data_hora'] >= data_limite]
+    
+    return df
 
 def carregar_dados(regiao, tipo="atual", dias=30):
     """
@@ -54,48 +152,49 @@ def carregar_dados(regiao, tipo="atual", dias=30):
     Returns:
         DataFrame com os dados combinados ou None se não encontrar
     """
-    todos_dados = []
-    
     # Data limite para filtragem
     data_limite = datetime.now() - timedelta(days=dias)
+    limite_arquivo = data_limite.strftime("%Y%m%d")
     
     # Buscar primeiro em OpenWeather, depois em INMET
+    arquivos = []
     for fonte in ['openweather', 'inmet']:
-        padrao_busca = str(DIRETORIO_DADOS / fonte / "**" / f"{tipo}_{regiao}_*.csv")
-        arquivos = glob.glob(padrao_busca, recursive=True)
-        
-        for arquivo in sorted(arquivos, reverse=True):  # Mais recentes primeiro
-            df = pd.read_csv(arquivo)
-            
-            # Adicionar metadados se não existir
-            if 'fonte' not in df.columns:
-                df['fonte'] = fonte
-            if 'regiao' not in df.columns:
-                df['regiao'] = regiao
-                
-            # Processar datas
-            if fonte == 'openweather' and 'data' in df.columns and 'hora' in df.columns:
-                df['data_hora'] = pd.to_datetime(df['data'] + ' ' + df['hora'])
-            elif fonte == 'inmet' and 'DATETIME' in df.columns:
-                df['data_hora'] = pd.to_datetime(df['DATETIME'])
-            
-            # Filtrar por data se necessário
-            if 'data_hora' in df.columns and tipo == 'atual':
-                df = df[df['data_hora'] >= data_limite]
-            
-            if not df.empty:
-                todos_dados.append(df)
+        for data_arquivo, arquivo in _arquivos_regiao(fonte, tipo, regiao):  # Mais recentes primeiro
+            # Cada arquivo só contém registros até o dia da coleta: a partir do
+            # primeiro anterior ao período, nenhum outro precisa ser aberto
+            if tipo == 'atual' and data_arquivo < limite_arquivo:
+                break
+            arquivos.append((fonte, arquivo))
+    
+    def carregar(fonte_arquivo):
+        fonte, arquivo = fonte_arquivo
+        return _carregar_arquivo(arquivo, fonte, regiao, tipo, data_limite)
+    
+    # O parser C do pandas libera o GIL: sem o pyarrow (que já lê cada arquivo
+    # com várias threads), os arquivos são lidos em paralelo
+    if PYARROW_DISPONIVEL or len(arquivos) < 2:
+        lidos = [carregar(item) for item in arquivos]
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(arquivos))) as executor:
+            lidos = list(executor.map(carregar, arquivos))
+    
+    todos_dados = [df for df in lidos if not df.empty]
     
     if not todos_dados:
         print(f"Nenhum dado encontrado para {regiao} (tipo: {tipo})")
         return None
     
-    # Combinar todos os DataFrames
-    dados_combinados = pd.concat(todos_dados, ignore_index=True)
+    # Combinar todos os DataFrames (com um só arquivo, a cópia do concat é evitada)
+    dados_combinados = todos_dados[0] if len(todos_dados) == 1 else pd.concat(todos_dados, ignore_index=True)
+    
+    # fonte/regiao repetem poucos valores: como category, cada linha guarda só um código
+    for coluna in ('fonte', 'regiao'):
+        if coluna in dados_combinados.columns:
+            dados_combinados[coluna] = dados_combinados[coluna].astype('category')
     
     # Remover duplicatas por data/hora se houver
     if 'data_hora' in dados_combinados.columns:
-        dados_combinados = dados_combinados.drop_duplicates(subset=['data_hora'])
+        dados_combinados = dados_combinados[~dados_combinados['data_hora'].duplicated()]
         dados_combinados = dados_combinados.sort_values('data_hora')
     
     return dados_combinados
@@ -186,9 +285,17 @@ def analisar_precipitacao(dados, regiao, salvar=False):
     plt.figure(figsize=(12, 8))
     
     if 'data_hora' in dados.columns:
-        # Gráfico de barras para precipitação
-        plt.bar(dados['data_hora'], dados[coluna_chuva], width=0.01, 
-                color='blue', alpha=0.7, label='Precipitação (mm)')
+        serie = dados.set_index('data_hora')[coluna_chuva].sort_index()
+        rotulo = 'Precipitação (mm)'
+        
+        # Mais pontos que a largura do gráfico em pixels: totais diários
+        if len(serie) > MAX_PONTOS_GRAFICO:
+            serie = serie.resample('D').sum()
+            rotulo = 'Precipitação diária (mm)'
+        
+        # Área em degraus: um único Path em vez de um retângulo por ponto
+        plt.fill_between(serie.index, 0, serie.to_numpy(dtype="float64", na_value=np.nan), step='mid',
+                         color='blue', alpha=0.7, label=rotulo)
     
     plt.title(f'Análise de Precipitação - {regiao.replace("_", " ")}', fontsize=16)
     plt.xlabel('Data', fontsize=12)
@@ -215,12 +322,18 @@ def analisar_precipitacao(dados, regiao, salvar=False):
     
     # Estatísticas básicas
     print("\n=== Estatísticas de Precipitação ===")
-    estatisticas = dados[coluna_chuva].describe()
-    
-    print(f"Total: {dados[coluna_chuva].sum():.1f} mm")
-    print(f"Média: {estatisticas['mean']:.1f} mm")
-    print(f"Máxima: {estatisticas['max']:.1f} mm")
-    dias_com_chuva = (dados[coluna_chuva] > 0).sum()
+    # Reduções diretas no array numpy (ignorando NaN, como o pandas), em vez
+    # de describe() + sum() + comparação, que percorrem a coluna várias vezes
+    valores = dados[coluna_chuva].to_numpy(dtype="float64", na_value=np.nan)
+    valores = valores[~np.isnan(valores)]
+    total = valores.sum()
+    media = total / valores.size if valores.size else np.nan
+    maxima = valores.max() if valores.size else np.nan
+    
+    print(f"Total: {total:.1f} mm")
+    print(f"Média: {media:.1f} mm")
+    print(f"Máxima: {maxima:.1f} mm")
+    dias_com_chuva = np.count_nonzero(valores > 0)
     print(f"Dias com chuva: {dias_com_chuva}")
 
 def analisar_correlacao(dados, regiao, salvar=False):
@@ -229,8 +342,9 @@ def analisar_correlacao(dados, regiao, salvar=False):
         print("Sem dados para análise de correlação")
         return
     
-    # Identificar colunas numéricas relevantes
+    # Identificar colunas numéricas relevantes (nomes exibidos e colunas de origem)
     colunas_numericas = []
+    colunas_originais = []
     
     # Mapear colunas para OpenWeather
     if 'temperatura' in dados.columns:
@@ -239,6 +353,7 @@ def analisar_correlacao(dados, regiao, salvar=False):
         for col in colunas_interesse:
             if col in dados.columns:
                 colunas_numericas.append(col)
+                colunas_originais.append(col)
     
     # Mapear colunas para INMET
     elif 'TEM_INS' in dados.columns:
@@ -253,16 +368,24 @@ def analisar_correlacao(dados, regiao, salvar=False):
         
         for col_original, nome in colunas_mapeamento.items():
             if col_original in dados.columns:
-                # Renomear para facilitar a análise
-                dados[nome] = dados[col_original]
+                # Nome amigável apenas nos rótulos da matriz (sem copiar a coluna)
                 colunas_numericas.append(nome)
+                colunas_originais.append(col_original)
     
     if len(colunas_numericas) < 2:
         print("Dados insuficientes para análise de correlação")
         return
     
-    # Calcular matriz de correlação
-    corr_matrix = dados[colunas_numericas].corr()
+    # Calcular matriz de correlação: sem valores ausentes, np.corrcoef calcula
+    # todos os pares de uma vez; com ausentes, o pandas usa as observações de
+    # cada par (pairwise), que é mantido
+    valores = dados[colunas_originais].to_numpy(dtype="float64", na_value=np.nan)
+    if np.isnan(valores).any():
+        corr_matrix = dados[colunas_originais].corr()
+    else:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr_matrix = pd.DataFrame(np.corrcoef(valores, rowvar=False))
+    corr_matrix = corr_matrix.set_axis(colunas_numericas, axis=0).set_axis(colunas_numericas, axis=1)
     
     # Plotar heatmap de correlação
     plt.figure(figsize=(10, 8))
@@ -293,14 +416,33 @@ def analisar_correlacao(dados, regiao, salvar=False):
                 print(f"{colunas_numericas[i]} e {colunas_numericas[j]}: {corr:.2f}")
 
 def main():
-    """Função principal para demonstração"""
+    """
+    Função principal para demonstração
+    
+    Returns:
+        int: 0 ao sair normalmente, 1 se não houver dados ou ocorrer um erro
+    """
+    # Estilo dos gráficos aplicado só durante a análise: rc_context restaura
+    # os parâmetros do matplotlib ao sair, sem afetar quem importou o módulo
+    with plt.rc_context():
+        plt.style.use('ggplot')
+        sns.set(style="darkgrid")
+        return _menu_analise()
+
+def _menu_analise():
+    """
+    Interface interativa de análise (executada dentro do estilo de main)
+    
+    Returns:
+        int: 0 ao sair normalmente, 1 se não houver dados ou ocorrer um erro
+    """
     print("=== Sistema de Análise de Dados Climáticos ===\n")
     
     # Listar regiões disponíveis
     regioes = listar_regioes_disponiveis()
     if not regioes:
         print("Nenhuma região com dados encontrada. Execute a coleta primeiro.")
-        return
+        return 1
     
     print("Regiões disponíveis:")
     for i, regiao in enumerate(regioes, 1):
@@ -310,7 +452,7 @@ def main():
         escolha = int(input("\nEscolha uma região (número): ")) - 1
         if escolha < 0 or escolha >= len(regioes):
             print("Opção inválida.")
-            return
+            return 1
         
         regiao_escolhida = regioes[escolha]
         print(f"\nAnalisando dados climáticos para: {regiao_escolhida.replace('_', ' ')}")
@@ -334,7 +476,7 @@ def main():
         
         if dados is None:
             print(f"Não foram encontrados dados do tipo '{tipo}' para {regiao_escolhida}.")
-            return
+            return 1
         
         print(f"\nDados carregados: {len(dados)} registros.")
         
@@ -367,12 +509,13 @@ def main():
                 analisar_correlacao(dados, regiao_escolhida, salvar=True)
                 print("Análises salvas no diretório atual.")
             elif opcao == "0":
-                break
+                return 0
             else:
                 print("Opção inválida!")
     
     except Exception as e:
         print(f"Erro durante a análise: {str(e)}")
+        return 1
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
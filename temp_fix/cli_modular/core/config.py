@@ -3,13 +3,73 @@ Gerenciamento de configuração para o Sistema de Dados Climáticos.
 Centraliza acesso a configurações e credenciais.
 """
 
+import os
 import json
 import logging
+import threading
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Set, Tuple
+
+# orjson é opcional: leitura e escrita mais rápidas dos arquivos de configuração
+try:
+    import orjson
+    ORJSON_DISPONIVEL = True
+except ImportError:
+    ORJSON_DISPONIVEL = False
 
 logger = logging.getLogger(__name__)
 
+def _ler_json(arquivo: Path) -> Any:
+    """Lê um arquivo JSON com uma única leitura em bytes (orjson se disponível)"""
+    with open(arquivo, "rb") as f:
+        conteudo = f.read()
+    if ORJSON_DISPONIVEL:
+        return orjson.loads(conteudo)
+    return json.loads(conteudo)
+
+def _gravar_json(arquivo: Path, obj: Any, duravel: bool = False) -> None:
+    """
+    Grava um objeto como JSON indentado em UTF-8 (orjson se disponível).
+    
+    O conteúdo é escrito em um arquivo temporário no mesmo diretório e só
+    então substitui o destino (os.replace), de modo que uma falha no meio da
+    escrita nunca deixa o arquivo truncado. Com duravel=True, os dados são
+    sincronizados com o disco (fsync) antes da troca.
+    """
+    if ORJSON_DISPONIVEL:
+        conteudo = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        conteudo = json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    
+    temporario = arquivo.with_suffix(arquivo.suffix + ".tmp")
+    try:
+        with open(temporario, "wb") as f:
+            f.write(conteudo)
+            if duravel:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temporario, arquivo)
+    except BaseException:
+        temporario.unlink(missing_ok=True)
+        raise
+
+def _percorrer_arquivos(caminho: str) -> Iterator[os.DirEntry]:
+    """
+    Percorre recursivamente um diretório com os.scandir, sem seguir links
+    simbólicos. O tipo de cada entrada vem da própria listagem, sem stat extra.
+    """
+    try:
+        with os.scandir(caminho) as entradas:
+            for entrada in entradas:
+                if entrada.is_dir(follow_symlinks=False):
+                    yield from _percorrer_arquivos(entrada.path)
+                elif entrada.is_file(follow_symlinks=False):
+                    yield entrada
+    except FileNotFoundError:
+        return
+
 class Config:
     """
     Gerencia configurações do sistema
@@ -34,10 +94,24 @@ class Config:
         self.openweather_dir = self.data_dir / "openweather"
         self.inmet_dir = self.data_dir / "inmet"
         
+        # Diretório base de cada fonte de dados
+        self._source_dirs: Dict[str, Path] = {
+            "openweather": self.openweather_dir,
+            "inmet": self.inmet_dir
+        }
+        
+        # Diretórios já garantidos neste processo (evita mkdir repetidos)
+        self._ensured_dirs: Set[Path] = set()
+        
+        # Diretório do mês corrente por diretório base: (ano, mês, caminho)
+        self._month_dir_cache: Dict[Path, Tuple[int, int, Path]] = {}
+        
         # Verificar e criar diretórios necessários
         self._init_directories()
         
-        # Cache para configurações
+        # Cache para configurações (a trava protege a primeira carga, que
+        # pode ocorrer em paralelo com a pré-carga em segundo plano)
+        self._lock = threading.Lock()
         self._regioes: Optional[List[Dict[str, Any]]] = None
         self._credenciais: Optional[Dict[str, Dict[str, str]]] = None
     
@@ -45,7 +119,6 @@ class Config:
         """Verifica e cria os diretórios necessários se não existirem"""
         directories = [
             self.config_dir,
-            self.data_dir,
             self.openweather_dir,
             self.inmet_dir,
             self.logs_dir,
@@ -53,7 +126,17 @@ class Config:
         ]
         
         for directory in directories:
+            self._ensure_dir(directory)
+        
+        # Criado junto com as pastas das fontes (parents=True)
+        self._ensured_dirs.add(self.data_dir)
+    
+    def _ensure_dir(self, directory: Path) -> Path:
+        """Cria o diretório (e os pais) apenas na primeira vez em que é pedido"""
+        if directory not in self._ensured_dirs:
             directory.mkdir(exist_ok=True, parents=True)
+            self._ensured_dirs.add(directory)
+        return directory
     
     def get_regioes(self, force_reload: bool = False) -> List[Dict[str, Any]]:
         """
@@ -66,30 +149,50 @@ class Config:
             List[Dict[str, Any]]: Lista de regiões configuradas
         """
         if self._regioes is None or force_reload:
-            regioes_file = self.config_dir / "regioes.json"
-            
-            if not regioes_file.exists():
-                logger.warning(f"Arquivo de regiões não encontrado: {regioes_file}")
-                self._regioes = []
-                return self._regioes
-            
-            try:
-                with open(regioes_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self._regioes = data.get("regioes_agricolas", [])
-                    logger.info(f"Carregadas {len(self._regioes)} regiões")
-            except Exception as e:
-                logger.error(f"Erro ao carregar regiões: {e}")
-                self._regioes = []
+            with self._lock:
+                # Outra thread (ex.: a pré-carga) pode ter carregado enquanto esta esperava
+                if self._regioes is None or force_reload:
+                    self._regioes = self._load_regioes()
         
         return self._regioes
     
-    def save_regioes(self, regioes: List[Dict[str, Any]]) -> bool:
+    def _load_regioes(self, preload: bool = False) -> Optional[List[Dict[str, Any]]]:
+        """
+        Lê as regiões do arquivo de configuração
+        
+        Args:
+            preload: Se True (pré-carga em segundo plano), registra o log só em
+                DEBUG e retorna None em caso de falha, para que a carga pelo
+                usuário repita a leitura e exiba os avisos normalmente
+        """
+        regioes_file = self.config_dir / "regioes.json"
+        
+        if not regioes_file.exists():
+            if preload:
+                logger.debug(f"Pré-carga: arquivo de regiões não encontrado: {regioes_file}")
+                return None
+            logger.warning(f"Arquivo de regiões não encontrado: {regioes_file}")
+            return []
+        
+        try:
+            data = _ler_json(regioes_file)
+            regioes = data.get("regioes_agricolas", [])
+            logger.log(logging.DEBUG if preload else logging.INFO, f"Carregadas {len(regioes)} regiões")
+            return regioes
+        except Exception as e:
+            if preload:
+                logger.debug(f"Pré-carga: erro ao carregar regiões: {e}")
+                return None
+            logger.error(f"Erro ao carregar regiões: {e}")
+            return []
+    
+    def save_regioes(self, regioes: List[Dict[str, Any]], durable: bool = False) -> bool:
         """
-        Salva as regiões no arquivo de configuração
+        Salva as regiões no arquivo de configuração (substituição atômica)
         
         Args:
             regioes: Lista de regiões a salvar
+            durable: Se True, sincroniza o arquivo com o disco antes de substituí-lo
             
         Returns:
             bool: True se sucesso, False caso contrário
@@ -97,8 +200,7 @@ class Config:
         regioes_file = self.config_dir / "regioes.json"
         
         try:
-            with open(regioes_file, "w", encoding="utf-8") as f:
-                json.dump({"regioes_agricolas": regioes}, f, indent=2, ensure_ascii=False)
+            _gravar_json(regioes_file, {"regioes_agricolas": regioes}, duravel=durable)
             
             # Atualizar cache
             self._regioes = regioes
@@ -119,29 +221,61 @@ class Config:
             Dict[str, Dict[str, str]]: Credenciais configuradas
         """
         if self._credenciais is None or force_reload:
-            credenciais_file = self.config_dir / "credenciais.json"
-            
-            if not credenciais_file.exists():
-                logger.warning(f"Arquivo de credenciais não encontrado: {credenciais_file}")
-                self._credenciais = {"openweather": {"api_key": ""}, "inmet": {"token": ""}}
-                return self._credenciais
-            
-            try:
-                with open(credenciais_file, "r", encoding="utf-8") as f:
-                    self._credenciais = json.load(f)
-                    logger.info("Credenciais carregadas")
-            except Exception as e:
-                logger.error(f"Erro ao carregar credenciais: {e}")
-                self._credenciais = {"openweather": {"api_key": ""}, "inmet": {"token": ""}}
+            with self._lock:
+                # Outra thread (ex.: a pré-carga) pode ter carregado enquanto esta esperava
+                if self._credenciais is None or force_reload:
+                    self._credenciais = self._load_credenciais()
         
         return self._credenciais
     
-    def save_credenciais(self, credenciais: Dict[str, Dict[str, str]]) -> bool:
+    def _load_credenciais(self, preload: bool = False) -> Optional[Dict[str, Dict[str, str]]]:
+        """
+        Lê as credenciais do arquivo de configuração
+        
+        Args:
+            preload: Se True (pré-carga em segundo plano), registra o log só em
+                DEBUG e retorna None em caso de falha, como em _load_regioes
+        """
+        credenciais_file = self.config_dir / "credenciais.json"
+        
+        if not credenciais_file.exists():
+            if preload:
+                logger.debug(f"Pré-carga: arquivo de credenciais não encontrado: {credenciais_file}")
+                return None
+            logger.warning(f"Arquivo de credenciais não encontrado: {credenciais_file}")
+            return {"openweather": {"api_key": ""}, "inmet": {"token": ""}}
+        
+        try:
+            credenciais = _ler_json(credenciais_file)
+            logger.log(logging.DEBUG if preload else logging.INFO, "Credenciais carregadas")
+            return credenciais
+        except Exception as e:
+            if preload:
+                logger.debug(f"Pré-carga: erro ao carregar credenciais: {e}")
+                return None
+            logger.error(f"Erro ao carregar credenciais: {e}")
+            return {"openweather": {"api_key": ""}, "inmet": {"token": ""}}
+    
+    def preload(self) -> None:
         """
-        Salva as credenciais no arquivo de configuração
+        Pré-carrega regiões e credenciais (ex.: em uma thread em segundo plano
+        enquanto o menu é exibido). Nada é escrito no console: o log fica em
+        DEBUG e, se um arquivo faltar ou for inválido, o cache permanece vazio
+        para que a primeira consulta do usuário repita a leitura e exiba o aviso.
+        """
+        with self._lock:
+            if self._regioes is None:
+                self._regioes = self._load_regioes(preload=True)
+            if self._credenciais is None:
+                self._credenciais = self._load_credenciais(preload=True)
+    
+    def save_credenciais(self, credenciais: Dict[str, Dict[str, str]], durable: bool = False) -> bool:
+        """
+        Salva as credenciais no arquivo de configuração (substituição atômica)
         
         Args:
             credenciais: Credenciais a salvar
+            durable: Se True, sincroniza o arquivo com o disco antes de substituí-lo
             
         Returns:
             bool: True se sucesso, False caso contrário
@@ -149,8 +283,7 @@ class Config:
         credenciais_file = self.config_dir / "credenciais.json"
         
         try:
-            with open(credenciais_file, "w", encoding="utf-8") as f:
-                json.dump(credenciais, f, indent=2, ensure_ascii=False)
+            _gravar_json(credenciais_file, credenciais, duravel=durable)
             
             # Atualizar cache
             self._credenciais = credenciais
@@ -160,24 +293,50 @@ class Config:
             logger.error(f"Erro ao salvar credenciais: {e}")
             return False
     
-    def get_log_dir_for_current_date(self) -> Path:
+    def iter_data_files(self, fonte: str) -> Iterator[os.DirEntry]:
         """
-        Obtém o diretório de logs para a data atual
+        Percorre os arquivos de dados de uma fonte, em todas as pastas ano/mês
+        
+        Prefira este método a Path.iterdir()/rglob() seguidos de is_file():
+        as entradas do os.scandir já trazem o tipo do arquivo (e cacheiam o
+        stat), evitando uma chamada de sistema por arquivo.
         
+        Args:
+            fonte: Nome da fonte de dados ("openweather" ou "inmet")
+            
         Returns:
-            Path: Caminho do diretório de logs para a data atual
+            Iterator[os.DirEntry]: Entradas dos arquivos encontrados
         """
-        from datetime import datetime
+        base_dir = self._source_dirs.get(fonte)
+        if base_dir is None:
+            raise ValueError(f"Fonte inválida: {fonte}")
         
+        return _percorrer_arquivos(str(base_dir))
+    
+    def _month_dir(self, base_dir: Path) -> Path:
+        """
+        Obtém (e cria na primeira vez) o diretório ano/mês corrente dentro de
+        base_dir, reaproveitando o caminho enquanto o mês não mudar
+        """
         hoje = datetime.now()
-        diretorio_log_ano = self.logs_dir / str(hoje.year)
-        diretorio_log_mes = diretorio_log_ano / f"{hoje.month:02d}"
         
-        # Criar diretórios se não existirem
-        diretorio_log_ano.mkdir(exist_ok=True, parents=True)
-        diretorio_log_mes.mkdir(exist_ok=True, parents=True)
+        cache = self._month_dir_cache.get(base_dir)
+        if cache is not None and cache[0] == hoje.year and cache[1] == hoje.month:
+            return cache[2]
+        
+        # parents=True cobre também o diretório do ano
+        diretorio_mes = self._ensure_dir(base_dir / str(hoje.year) / f"{hoje.month:02d}")
+        self._month_dir_cache[base_dir] = (hoje.year, hoje.month, diretorio_mes)
+        return diretorio_mes
+    
+    def get_log_dir_for_current_date(self) -> Path:
+        """
+        Obtém o diretório de logs para a data atual
         
-        return diretorio_log_mes
+        Returns:
+            Path: Caminho do diretório de logs para a data atual
+        """
+        return self._month_dir(self.logs_dir)
     
     def get_data_dir_for_current_date(self, fonte: str) -> Path:
         """
@@ -189,25 +348,25 @@ class Config:
         Returns:
             Path: Caminho do diretório de dados para a data atual
         """
-        from datetime import datetime
-        
-        hoje = datetime.now()
-        
-        if fonte == "openweather":
-            base_dir = self.openweather_dir
-        elif fonte == "inmet":
-            base_dir = self.inmet_dir
-        else:
+        base_dir = self._source_dirs.get(fonte)
+        if base_dir is None:
             raise ValueError(f"Fonte inválida: {fonte}")
         
-        diretorio_ano = base_dir / str(hoje.year)
-        diretorio_mes = diretorio_ano / f"{hoje.month:02d}"
-        
-        # Criar diretórios se não existirem
-        diretorio_ano.mkdir(exist_ok=True, parents=True)
-        diretorio_mes.mkdir(exist_ok=True, parents=True)
-        
-        return diretorio_mes
+        return self._month_dir(base_dir)
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Obtém a instância global de configuração, criada (com os diretórios do
+    sistema) apenas no primeiro uso
+    
+    Returns:
+        Config: Instância compartilhada em todo o sistema
+    """
+    return Config()
 
-# Instância global para acesso em todo o sistema
-config = Config()
\ No newline at end of file
+def __getattr__(nome: str) -> Any:
+    """Mantém `from core.config import config` funcionando (criação tardia)"""
+    if nome == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
\ No newline at end of file
@@ -5,18 +5,16 @@ Ponto de entrada principal para o CLI do Sistema de Dados Climáticos.
 
 import sys
 import logging
-import argparse
 from pathlib import Path
 from datetime import datetime
-import traceback
 
 # Configurar logging
 def configurar_logging():
     """Configura o logging do sistema"""
-    from core.config import config
+    from core.config import get_config
     
     # Obter diretório de logs para data atual
-    diretorio_log = config.get_log_dir_for_current_date()
+    diretorio_log = get_config().get_log_dir_for_current_date()
     
     # Nome do arquivo de log
     hoje = datetime.now()
@@ -27,7 +25,8 @@ def configurar_logging():
         level=logging.INFO,
         format="%(asctime)s - %(levelname)s - %(message)s",
         handlers=[
-            logging.FileHandler(arquivo_log),
+            # delay=True: o arquivo só é aberto no primeiro registro de log
+            logging.FileHandler(arquivo_log, delay=True, encoding="utf-8"),
             logging.StreamHandler(sys.stdout)
         ]
     )
@@ -38,8 +37,14 @@ def configurar_logging():
 # Função principal em modo interativo
 def modo_interativo():
     """Inicia o CLI em modo interativo"""
+    import threading
+    from core.config import get_config
     from ui.menus.principal import MenuPrincipal
     
+    # Pré-carregar regiões e credenciais enquanto o usuário lê o menu
+    config = get_config()
+    threading.Thread(target=config.preload, daemon=True).start()
+    
     # Criar e exibir menu principal
     menu = MenuPrincipal()
     menu.exibir()
@@ -53,8 +58,9 @@ def executar_coleta(args):
     
     try:
         # Adicionar diretório src ao path
-        src_dir = Path(__file__).parent.parent / "src"
-        sys.path.append(str(src_dir))
+        src_dir = str(Path(__file__).parent.parent / "src")
+        if src_dir not in sys.path:
+            sys.path.append(src_dir)
         
         # Importar módulo de execução
         from src.executar_coleta import main as executar_coleta_main
@@ -75,12 +81,12 @@ def executar_analise():
     try:
         # Adicionar diretório src ao path
         src_dir = Path(__file__).parent.parent / "src"
-        sys.path.append(str(src_dir))
+        if str(src_dir) not in sys.path:
+            sys.path.append(str(src_dir))
         
-        # Importar e executar módulo
-        import subprocess
-        resultado = subprocess.run([sys.executable, str(src_dir / "exemplo_analise.py")])
-        return resultado.returncode
+        # Executar no próprio processo, sem iniciar outro interpretador
+        import exemplo_analise
+        return exemplo_analise.main()
     except Exception as e:
         logger.error(f"Erro na análise: {e}")
         from ui.console import print_error
@@ -95,7 +101,9 @@ def main():
     
     # Verificar se há argumentos de linha de comando
     if len(sys.argv) > 1:
-        # Modo de comando (não interativo)
+        # Modo de comando (não interativo); argparse só é carregado aqui
+        import argparse
+        
         parser = argparse.ArgumentParser(description="Sistema de Dados Climáticos - CLI")
         subparsers = parser.add_subparsers(dest="comando", help="Comandos disponíveis")
         
@@ -139,6 +147,7 @@ if __name__ == "__main__":
         sys.exit(1)
     except Exception as e:
         print(f"Erro inesperado: {e}")
+        import traceback
         traceback.print_exc()
         logging.getLogger("cli").exception("Erro inesperado na execução do CLI")
         sys.exit(1)
\ No newline at end of file
@@ -4,6 +4,7 @@ Centraliza formatação, exibição e entrada de dados no terminal.
 """
 
 import os
+import sys
 from typing import List, Dict, Any, Optional
 from colorama import init, Fore, Style
 from tabulate import tabulate
@@ -11,6 +12,23 @@ from tabulate import tabulate
 # Inicializar colorama para cores no terminal
 init(autoreset=True)
 
+# Prefixos de cor das mensagens, montados uma única vez
+_PREFIXO_INFO = f"{Fore.GREEN}ℹ "
+_PREFIXO_AVISO = f"{Fore.YELLOW}⚠ "
+_PREFIXO_ERRO = f"{Fore.RED}✖ "
+_PREFIXO_SUCESSO = f"{Fore.GREEN}✓ "
+_RESET = Style.RESET_ALL
+_MENSAGEM_PAUSA = f"\n{Fore.YELLOW}Pressione ENTER para continuar...{_RESET}"
+_FORMATO_CONFIRMACAO = f"{Fore.YELLOW}{{}} (s/n): {_RESET}"
+_LIMPAR_TELA = "\x1b[2J\x1b[H"
+
+# Régua dos cabeçalhos de print_header
+_LARGURA_CABECALHO = 70
+_LINHA_CABECALHO = "=" * _LARGURA_CABECALHO
+
+# Respostas aceitas como confirmação em confirm_action
+_RESPOSTAS_SIM = frozenset({'s', 'sim', 'y', 'yes'})
+
 # Banner ASCII do sistema
 BANNER = f"""
 {Fore.CYAN}╔═══════════════════════════════════════════════════════════════╗
@@ -27,9 +45,31 @@ BANNER = f"""
 ╚═══════════════════════════════════════════════════════════════╝{Style.RESET_ALL}
 """
 
+# Limpeza de tela seguida do banner, como clear_screen() + show_banner()
+_LIMPAR_TELA_E_BANNER = _LIMPAR_TELA + BANNER + "\n"
+
 def clear_screen() -> None:
     """Limpa a tela do terminal de forma compatível com diferentes sistemas"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # Em terminal, a sequência ANSI (limpar + cursor no início) evita abrir um
+    # shell a cada redesenho; o colorama a traduz nos consoles do Windows
+    if sys.stdout.isatty():
+        sys.stdout.write(_LIMPAR_TELA)
+        sys.stdout.flush()
+    else:
+        os.system('cls' if os.name == 'nt' else 'clear')
+
+def format_header(texto: str) -> str:
+    """
+    Formata um cabeçalho para exibição
+    
+    Args:
+        texto: O texto a ser exibido como cabeçalho
+        
+    Returns:
+        str: O cabeçalho formatado, pronto para ser escrito no terminal
+    """
+    return (f"\n{_LINHA_CABECALHO}\n{Fore.CYAN}{texto.center(_LARGURA_CABECALHO)}{_RESET}\n"
+            f"{_LINHA_CABECALHO}\n\n")
 
 def print_header(texto: str) -> None:
     """
@@ -38,10 +78,7 @@ def print_header(texto: str) -> None:
     Args:
         texto: O texto a ser exibido como cabeçalho
     """
-    largura = 70
-    print("\n" + "=" * largura)
-    print(f"{Fore.CYAN}{texto.center(largura)}{Style.RESET_ALL}")
-    print("=" * largura + "\n")
+    sys.stdout.write(format_header(texto))
 
 def print_info(texto: str) -> None:
     """
@@ -50,7 +87,7 @@ def print_info(texto: str) -> None:
     Args:
         texto: A mensagem informativa
     """
-    print(f"{Fore.GREEN}ℹ {texto}{Style.RESET_ALL}")
+    print(_PREFIXO_INFO + texto + _RESET)
 
 def print_warning(texto: str) -> None:
     """
@@ -59,7 +96,7 @@ def print_warning(texto: str) -> None:
     Args:
         texto: A mensagem de aviso
     """
-    print(f"{Fore.YELLOW}⚠ {texto}{Style.RESET_ALL}")
+    print(_PREFIXO_AVISO + texto + _RESET)
 
 def print_error(texto: str) -> None:
     """
@@ -68,7 +105,7 @@ def print_error(texto: str) -> None:
     Args:
         texto: A mensagem de erro
     """
-    print(f"{Fore.RED}✖ {texto}{Style.RESET_ALL}")
+    print(_PREFIXO_ERRO + texto + _RESET)
 
 def print_success(texto: str) -> None:
     """
@@ -77,21 +114,32 @@ def print_success(texto: str) -> None:
     Args:
         texto: A mensagem de sucesso
     """
-    print(f"{Fore.GREEN}✓ {texto}{Style.RESET_ALL}")
+    print(_PREFIXO_SUCESSO + texto + _RESET)
 
 def print_table(data: List[Any], headers: List[str]) -> None:
     """
     Imprime uma tabela formatada na tela
     
     Args:
-        data: Os dados da tabela
+        data: Os dados da tabela (sequência de linhas)
         headers: Os cabeçalhos da tabela
     """
-    print(tabulate(data, headers=headers, tablefmt="grid"))
+    if sys.stdout.isatty():
+        sys.stdout.write(tabulate(data, headers=headers, tablefmt="grid") + "\n")
+        return
+    
+    # Saída redirecionada (arquivo, pipe): TSV simples, sem desenhar a grade
+    linhas = ["\t".join(map(str, headers))]
+    linhas.extend("\t".join(map(str, linha)) for linha in data)
+    sys.stdout.write("\n".join(linhas) + "\n")
 
 def pause() -> None:
     """Pausa a execução até o usuário pressionar ENTER"""
-    input(f"\n{Fore.YELLOW}Pressione ENTER para continuar...{Style.RESET_ALL}")
+    try:
+        input(_MENSAGEM_PAUSA)
+    except EOFError:
+        # Sem entrada disponível (stdin fechado): não há o que esperar
+        pass
 
 def confirm_action(mensagem: str = "Confirma esta ação?") -> bool:
     """
@@ -103,8 +151,8 @@ def confirm_action(mensagem: str = "Confirma esta ação?") -> bool:
     Returns:
         bool: True se o usuário confirmou, False caso contrário
     """
-    resposta = input(f"{Fore.YELLOW}{mensagem} (s/n): {Style.RESET_ALL}").lower()
-    return resposta in ['s', 'sim', 'y', 'yes']
+    resposta = input(_FORMATO_CONFIRMACAO.format(mensagem)).strip().casefold()
+    return resposta in _RESPOSTAS_SIM
 
 def get_option(prompt: str, options: List[str], default: Optional[int] = None) -> int:
     """
@@ -186,4 +234,15 @@ def display_menu(title: str, options: Dict[str, str]) -> str:
 
 def show_banner() -> None:
     """Exibe o banner do sistema"""
-    print(BANNER)
\ No newline at end of file
+    print(BANNER)
+
+def clear_and_show_banner() -> None:
+    """Limpa a tela e exibe o banner com uma única escrita no terminal"""
+    if sys.stdout.isatty():
+        # Pelo fluxo de texto (e não pelo buffer binário), para que o
+        # colorama continue traduzindo as sequências ANSI no Windows
+        sys.stdout.write(_LIMPAR_TELA_E_BANNER)
+        sys.stdout.flush()
+    else:
+        clear_screen()
+        show_banner()
\ No newline at end of file
@@ -3,15 +3,20 @@ Menu base para o sistema de menus do CLI.
 Define a estrutura e comportamento padrão de todos os menus.
 """
 
+import sys
 from abc import ABC, abstractmethod
 from typing import Dict, List, Callable, Optional, Any, TypeVar, Generic
 from colorama import Fore, Style
 
-from ..console import clear_screen, print_header, pause, print_warning
+from ..console import clear_screen, format_header, pause, print_warning
 
 # Tipo genérico para o resultado de callbacks de menu
 T = TypeVar('T')
 
+# Cores do identificador dos itens, resolvidas uma única vez
+_COR_ID = Fore.CYAN
+_RESET = Style.RESET_ALL
+
 class MenuItem(Generic[T]):
     """
     Representa um item de menu com identificador, texto e função de callback
@@ -42,7 +47,11 @@ class Menu(ABC, Generic[T]):
     def __init__(self, titulo: str):
         self.titulo = titulo
         self.itens: List[MenuItem[T]] = []
+        # Índice por id para despachar a escolha sem percorrer a lista
+        self._itens_por_id: Dict[str, MenuItem[T]] = {}
         self.opcao_voltar = MenuItem("0", "Voltar", lambda: None)
+        # Texto do menu (cabeçalho + itens), montado no primeiro desenho
+        self._quadro: Optional[str] = None
     
     def adicionar_item(self, id: str, texto: str, callback: Callable[[], Optional[T]]) -> None:
         """
@@ -53,40 +62,83 @@ class Menu(ABC, Generic[T]):
             texto: Texto a ser exibido
             callback: Função a ser chamada quando o item for selecionado
         """
-        self.itens.append(MenuItem(id, texto, callback))
+        item = MenuItem(id, texto, callback)
+        self.itens.append(item)
+        # Com ids repetidos vale o primeiro, como na busca sequencial
+        self._itens_por_id.setdefault(id, item)
+        self._quadro = None
     
     def exibir(self) -> None:
         """Exibe o menu e processa a escolha do usuário"""
         while True:
             clear_screen()
-            print_header(self.titulo)
-            
-            # Exibir itens do menu
-            for item in self.itens:
-                self._renderizar_item(item)
             
-            # Exibir opção de voltar
-            self._renderizar_item(self.opcao_voltar)
-            print()
+            # Exibir cabeçalho, itens do menu e opção de voltar
+            sys.stdout.write(self._texto_menu())
             
-            # Capturar escolha do usuário
-            escolha = input("Escolha uma opção: ")
+            # Capturar escolha do usuário (fim da entrada: sai do menu)
+            escolha = self._ler_escolha()
             
             # Processar escolha
-            if escolha == self.opcao_voltar.id:
+            if escolha is None or escolha == self.opcao_voltar.id:
                 return
             
             # Procurar e executar o item correspondente
-            for item in self.itens:
-                if item.id == escolha:
-                    resultado = item.executar()
-                    if resultado is not None:
-                        pause()
-                    break
+            item = self._itens_por_id.get(escolha)
+            if item is not None:
+                resultado = item.executar()
+                if resultado is not None:
+                    pause()
             else:
                 print_warning("Opção inválida!")
                 pause()
     
+    def _ler_escolha(self) -> Optional[str]:
+        """
+        Lê a opção escolhida pelo usuário. ENTER sem texto apenas repete a
+        pergunta, sem redesenhar o menu.
+        
+        Returns:
+            Optional[str]: A opção digitada, ou None se a entrada terminou
+            (EOF, ex.: stdin fechado ou redirecionado)
+        """
+        while True:
+            try:
+                escolha = input("Escolha uma opção: ")
+            except EOFError:
+                return None
+            if escolha:
+                return escolha
+    
+    def _texto_menu(self) -> str:
+        """
+        Obtém o cabeçalho e os itens do menu (com a opção de voltar) já
+        formatados. O texto é montado uma única vez e reaproveitado a cada
+        redesenho, até que um item seja adicionado.
+        
+        Returns:
+            str: Texto do menu pronto para ser escrito no terminal
+        """
+        if self._quadro is None:
+            partes = [format_header(self.titulo)]
+            partes.extend(self._formatar_item(item) for item in self.itens)
+            partes.append(self._formatar_item(self.opcao_voltar))
+            partes.append("\n")
+            self._quadro = "".join(partes)
+        return self._quadro
+    
+    def _formatar_item(self, item: MenuItem[T]) -> str:
+        """
+        Formata um item do menu para exibição
+        
+        Args:
+            item: O item a ser formatado
+            
+        Returns:
+            str: A linha do item, terminada em quebra de linha
+        """
+        return f"{_COR_ID}{item.id}.{_RESET} {item.texto}\n"
+    
     def _renderizar_item(self, item: MenuItem[T]) -> None:
         """
         Renderiza um item do menu no console
@@ -94,7 +146,7 @@ class Menu(ABC, Generic[T]):
         Args:
             item: O item a ser renderizado
         """
-        print(f"{Fore.CYAN}{item.id}.{Style.RESET_ALL} {item.texto}")
+        sys.stdout.write(self._formatar_item(item))
 
 
 class SubMenu(Menu[T]):
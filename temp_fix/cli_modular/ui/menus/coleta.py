@@ -17,6 +17,9 @@ class MenuColeta(SubMenu):
     Menu para operações de coleta de dados
     """
     
+    # Função main de src.executar_coleta, importada na primeira coleta
+    _executar_coleta_main = None
+    
     def __init__(self):
         """Inicializa o menu de coleta"""
         super().__init__("COLETA DE DADOS")
@@ -72,10 +75,10 @@ class MenuColeta(SubMenu):
     
     def coletar_regiao_especifica(self) -> None:
         """Coleta dados para uma região específica"""
-        from ...core.config import config
+        from ...core.config import get_config
         
         # Obter lista de regiões disponíveis
-        regioes = config.get_regioes()
+        regioes = get_config().get_regioes()
         
         if not regioes:
             print_warning("Nenhuma região configurada encontrada!")
@@ -139,9 +142,13 @@ class MenuColeta(SubMenu):
             dias: Número de dias para dados atuais
             anos: Número de anos para dados históricos
         """
-        # Importar o módulo necessário
-        sys.path.append(str(self._get_src_dir()))
-        from src.executar_coleta import main as executar_coleta_main
+        # Importar o módulo necessário (uma única vez por processo)
+        if MenuColeta._executar_coleta_main is None:
+            src_dir = str(self._get_src_dir())
+            if src_dir not in sys.path:
+                sys.path.append(src_dir)
+            from src.executar_coleta import main as executar_coleta_main
+            MenuColeta._executar_coleta_main = executar_coleta_main
         
         # Preparar argumentos
         cmd_args = ["--modo", modo]
@@ -160,7 +167,7 @@ class MenuColeta(SubMenu):
             # Substituir sys.argv com nossos argumentos e executar
             sys.argv = [sys.argv[0]] + cmd_args
             print_info(f"Executando coleta com argumentos: {' '.join(cmd_args)}")
-            executar_coleta_main()
+            MenuColeta._executar_coleta_main()
         finally:
             # Restaurar argumentos originais
             sys.argv = original_args
@@ -3,16 +3,52 @@ Menu principal do Sistema de Dados Climáticos.
 Ponto de entrada para todas as funcionalidades.
 """
 
+import sys
+import threading
+from functools import cached_property
+from pathlib import Path
 from typing import Dict
 
 from .base import Menu, SubMenu
-from ..console import show_banner
-from .coleta import MenuColeta
-from .analise import MenuAnalise
-from .regioes import MenuRegioes
-from .exportacao import MenuExportacao
-from .logs import MenuLogs
-from .config import MenuConfiguracao
+from ..console import (clear_and_show_banner, clear_screen, print_header, print_info,
+                       print_warning, pause, Fore, Style)
+
+# Arquivo de documentação do sistema (resolvido uma única vez)
+_ARQUIVO_DOCUMENTACAO = Path(__file__).resolve().parents[4] / "docs" / "DOCUMENTACAO.md"
+# URL file:// com a codificação correta (unidade no Windows, espaços, acentos)
+_URL_DOCUMENTACAO = _ARQUIVO_DOCUMENTACAO.as_uri()
+_documentacao_encontrada = False
+
+def _documentacao_disponivel() -> bool:
+    """
+    Verifica se a documentação existe. Só o resultado positivo fica em cache:
+    se o arquivo ainda não existir, ele pode ser criado durante a sessão.
+    """
+    global _documentacao_encontrada
+    if not _documentacao_encontrada:
+        _documentacao_encontrada = _ARQUIVO_DOCUMENTACAO.is_file()
+    return _documentacao_encontrada
+
+# Informações fixas exibidas ao final da ajuda
+_RODAPE_AJUDA = """
+=== Sistema de Dados Climáticos ===
+Versão: 1.0.0
+Autor: Equipe de Desenvolvimento
+
+Este sistema permite coletar, analisar e exportar dados climáticos de múltiplas fontes.
+Use o menu principal para navegar entre as funcionalidades.
+
+=== Guia Rápido ===
+1. Configure suas regiões em 'Gerenciar Regiões'
+2. Configure as credenciais das APIs em 'Configurações'
+3. Execute a coleta de dados em 'Coleta de Dados'
+4. Visualize os dados em 'Consulta e Análise'
+5. Exporte relatórios em 'Exportação de Dados'
+
+=== Contato ===
+Para suporte: suporte@exemplo.com.br
+Para relatar bugs: github.com/usuario/sistema_dados_climaticos/issues
+"""
 
 class MenuPrincipal(Menu):
     """
@@ -23,79 +59,93 @@ class MenuPrincipal(Menu):
         """Inicializa o menu principal"""
         super().__init__("MENU PRINCIPAL")
         
-        # Inicializar submenus
-        self.menu_coleta = MenuColeta()
-        self.menu_analise = MenuAnalise()
-        self.menu_regioes = MenuRegioes()
-        self.menu_exportacao = MenuExportacao()
-        self.menu_logs = MenuLogs()
-        self.menu_configuracao = MenuConfiguracao()
-        
-        # Adicionar itens de menu
-        self.adicionar_item("1", "Coleta de Dados", self.menu_coleta.como_callback())
-        self.adicionar_item("2", "Consulta e Análise", self.menu_analise.como_callback())
-        self.adicionar_item("3", "Gerenciar Regiões", self.menu_regioes.como_callback())
-        self.adicionar_item("4", "Exportação de Dados", self.menu_exportacao.como_callback())
-        self.adicionar_item("5", "Logs e Monitoramento", self.menu_logs.como_callback())
-        self.adicionar_item("6", "Configurações", self.menu_configuracao.como_callback())
+        # Adicionar itens de menu (os submenus só são criados ao serem escolhidos)
+        self.adicionar_item("1", "Coleta de Dados", lambda: self.menu_coleta.exibir())
+        self.adicionar_item("2", "Consulta e Análise", lambda: self.menu_analise.exibir())
+        self.adicionar_item("3", "Gerenciar Regiões", lambda: self.menu_regioes.exibir())
+        self.adicionar_item("4", "Exportação de Dados", lambda: self.menu_exportacao.exibir())
+        self.adicionar_item("5", "Logs e Monitoramento", lambda: self.menu_logs.exibir())
+        self.adicionar_item("6", "Configurações", lambda: self.menu_configuracao.exibir())
         self.adicionar_item("7", "Ajuda e Documentação", self.mostrar_ajuda)
         
         # Customizar opção de saída
         self.opcao_voltar.id = "0"
         self.opcao_voltar.texto = "Sair"
     
+    # Submenus: o módulo de cada um é importado e a instância criada no
+    # primeiro acesso, e reaproveitada nos seguintes
+    
+    @cached_property
+    def menu_coleta(self) -> SubMenu:
+        from .coleta import MenuColeta
+        return MenuColeta()
+    
+    @cached_property
+    def menu_analise(self) -> SubMenu:
+        from .analise import MenuAnalise
+        return MenuAnalise()
+    
+    @cached_property
+    def menu_regioes(self) -> SubMenu:
+        from .regioes import MenuRegioes
+        return MenuRegioes()
+    
+    @cached_property
+    def menu_exportacao(self) -> SubMenu:
+        from .exportacao import MenuExportacao
+        return MenuExportacao()
+    
+    @cached_property
+    def menu_logs(self) -> SubMenu:
+        from .logs import MenuLogs
+        return MenuLogs()
+    
+    @cached_property
+    def menu_configuracao(self) -> SubMenu:
+        from .config import MenuConfiguracao
+        return MenuConfiguracao()
+    
     def exibir(self) -> None:
         """Exibe o menu principal com o banner"""
-        from ..console import clear_screen, print_header
-        
         while True:
-            clear_screen()
-            show_banner()
-            print_header(self.titulo)
+            clear_and_show_banner()
             
-            # Exibir itens do menu
-            for item in self.itens:
-                self._renderizar_item(item)
-            
-            # Exibir opção de sair
-            self._renderizar_item(self.opcao_voltar)
-            print()
+            # Exibir cabeçalho, itens do menu e opção de sair
+            sys.stdout.write(self._texto_menu())
             
             # Capturar escolha do usuário
-            escolha = input("Escolha uma opção: ")
+            escolha = self._ler_escolha()
+            
+            # Fim da entrada (stdin fechado): encerra sem repetir o menu
+            if escolha is None:
+                print()
+                return
             
             # Processar escolha
             if escolha == self.opcao_voltar.id:
-                from ..console import clear_screen, Fore, Style
                 clear_screen()
                 print(f"{Fore.CYAN}Obrigado por usar o Sistema de Dados Climáticos!{Style.RESET_ALL}")
                 return
             
             # Procurar e executar o item correspondente
-            for item in self.itens:
-                if item.id == escolha:
-                    item.executar()
-                    break
+            item = self._itens_por_id.get(escolha)
+            if item is not None:
+                item.executar()
             else:
-                from ..console import print_warning, pause
                 print_warning("Opção inválida!")
                 pause()
     
     def mostrar_ajuda(self) -> None:
         """Exibe a ajuda do sistema"""
-        from pathlib import Path
-        from ..console import clear_screen, print_header, print_info, print_warning, pause
-        import os
         import webbrowser
         
-        # Verificar se a documentação existe
-        docs_dir = Path(__file__).parent.parent.parent.parent.parent / "docs"
-        doc_file = docs_dir / "DOCUMENTACAO.md"
+        doc_file = _ARQUIVO_DOCUMENTACAO
         
         clear_screen()
         print_header("AJUDA E DOCUMENTAÇÃO")
         
-        if doc_file.exists():
+        # Verificar se a documentação existe
+        if _documentacao_disponivel():
             print_info("Documentação encontrada!")
             
             # Perguntar como deseja visualizar
@@ -110,19 +160,30 @@ class MenuPrincipal(Menu):
             if escolha == "1":
                 # Mostrar no terminal
                 try:
-                    with open(doc_file, "r", encoding="utf-8") as f:
-                        conteudo = f.read()
-                    
                     clear_screen()
-                    print(conteudo)
+                    if sys.stdout.isatty():
+                        # Em terminal, paginado (less/more) em vez de despejar tudo
+                        import pydoc
+                        with open(doc_file, "r", encoding="utf-8") as f:
+                            pydoc.pager(f.read())
+                    else:
+                        # Saída redirecionada: copia o arquivo em blocos de 64 KiB
+                        import shutil
+                        sys.stdout.flush()
+                        with open(doc_file, "rb") as f:
+                            shutil.copyfileobj(f, sys.stdout.buffer, length=64 * 1024)
+                        sys.stdout.buffer.flush()
                 except Exception as e:
                     print_warning(f"Erro ao ler documentação: {e}")
             
             elif escolha == "2":
                 # Abrir no navegador
                 try:
-                    url = "file://" + str(doc_file)
-                    webbrowser.open(url)
+                    url = _URL_DOCUMENTACAO
+                    # Em segundo plano: alguns navegadores (ex.: via $BROWSER)
+                    # bloqueiam até serem fechados, o que travaria o menu
+                    threading.Thread(target=webbrowser.open, args=(url,),
+                                     kwargs={"new": 2}, daemon=True).start()
                     print_info("Documentação aberta no navegador padrão.")
                 except Exception as e:
                     print_warning(f"Erro ao abrir documentação no navegador: {e}")
@@ -132,21 +193,7 @@ class MenuPrincipal(Menu):
             print_info("Verifique se o arquivo DOCUMENTACAO.md existe no diretório docs/")
         
         # Mostrar informações básicas
-        print("\n=== Sistema de Dados Climáticos ===")
-        print("Versão: 1.0.0")
-        print("Autor: Equipe de Desenvolvimento")
-        print("\nEste sistema permite coletar, analisar e exportar dados climáticos de múltiplas fontes.")
-        print("Use o menu principal para navegar entre as funcionalidades.")
-        
-        print("\n=== Guia Rápido ===")
-        print("1. Configure suas regiões em 'Gerenciar Regiões'")
-        print("2. Configure as credenciais das APIs em 'Configurações'")
-        print("3. Execute a coleta de dados em 'Coleta de Dados'")
-        print("4. Visualize os dados em 'Consulta e Análise'")
-        print("5. Exporte relatórios em 'Exportação de Dados'")
-        
-        print("\n=== Contato ===")
-        print("Para suporte: suporte@exemplo.com.br")
-        print("Para relatar bugs: github.com/usuario/sistema_dados_climaticos/issues")
+        sys.stdout.write(_RODAPE_AJUDA)
+        sys.stdout.flush()
         
         pause()
\ No newline at end of file